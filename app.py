@@ -1,5 +1,6 @@
 ﻿from flask import Flask
 from flask_cors import CORS
+import multiprocessing
 import os
 
 # Import configuration
@@ -8,6 +9,10 @@ from config import Config
 # Import database
 from database.connection import Database
 
+# Import ML model registry
+from app.services.ModelRegistry import ModelRegistry
+from app.services.LayoutPool import LayoutPool
+
 # Import routes
 from routes.api import api
 
@@ -23,12 +28,33 @@ app.config["MAX_CONTENT_LENGTH"] = Config.MAX_CONTENT_LENGTH
 # Ensure upload directory exists
 os.makedirs(Config.UPLOAD_FOLDER, exist_ok=True)
 
-# ===== INITIALIZE DATABASE =====
-try:
-    Database.init_database()
-    print(" Database initialized successfully")
-except Exception as e:
-    print(f" DB init skipped: {e}")
+# ===== STARTUP (DB, MODEL, WATCHER, LAYOUT POOL) =====
+def init_services():
+    """
+    Side effect startup - cuma di process yang melayani request.
+    Worker LayoutPool (spawn) ikut import module ini sebagai __mp_main__,
+    dan parent reloader Flask debug cuma mengawasi file: keduanya skip.
+    """
+    # ===== INITIALIZE DATABASE =====
+    try:
+        Database.init_database()
+        print(" Database initialized successfully")
+        if Config.DB_POOL_PREWARM:
+            print(f" DB pool ready ({Database.prewarm()} connections)")
+    except Exception as e:
+        print(f" DB init skipped: {e}")
+
+    # ===== PRELOAD ML MODEL =====
+    # Load model .pkl sekali, semua request share bundle yang sama
+    ModelRegistry.preload()
+    if Config.MODEL_HOT_RELOAD:
+        ModelRegistry.start_watcher()
+    if Config.LAYOUT_POOL_PREWARM:
+        LayoutPool.start()
+
+
+def is_main_process():
+    return multiprocessing.current_process().name == "MainProcess"
 
 # ===== REGISTER BLUEPRINTS (ROUTES) =====
 app.register_blueprint(api)
@@ -57,7 +83,15 @@ def legacy_serve_image(filename):
     return LayoutController.serve_news_image(filename)
 
 # ===== MAIN =====
+# Import dari WSGI server (gunicorn dll): startup di sini
+if __name__ != "__main__" and is_main_process():
+    init_services()
+
 if __name__ == "__main__":
+    DEBUG = Config.DEBUG
+    # Reloader: parent cuma restart child saat file berubah, startup di child (WERKZEUG_RUN_MAIN)
+    if not DEBUG or os.environ.get("WERKZEUG_RUN_MAIN") == "true":
+        init_services()
     print("=" * 60)
     print(" FurniLayout API Server")
     print("=" * 60)
@@ -66,4 +100,4 @@ if __name__ == "__main__":
     print(" Documentation: See BACKEND_STRUCTURE.md")
     print("=" * 60)
     print()
-    app.run(debug=True, host="0.0.0.0", port=5000)
+    app.run(debug=DEBUG, host="0.0.0.0", port=5000)
@@ -9,13 +9,22 @@ class ContactController:
     
     @staticmethod
     def index():
-        """Get all contact messages"""
+        """Get contact messages, 1 halaman (?limit=, ?cursor=)"""
         try:
-            messages = ContactMessage.get_all()
+            messages, next_cursor = ContactMessage.get_all(
+                cursor=request.args.get('cursor'),
+                limit=request.args.get('limit', type=int)
+            )
             return jsonify({
                 'status': 'success',
-                'data': messages
+                'data': messages,
+                'next_cursor': next_cursor
             }), 200
+        except ValueError as e:
+            return jsonify({
+                'status': 'error',
+                'message': str(e)
+            }), 400
         except Exception as e:
             return jsonify({
                 'status': 'error',
@@ -10,14 +10,24 @@ class HouseLayoutController:
     
     @staticmethod
     def index():
-        """Get all layouts (admin)"""
+        """Get all layouts (admin), 1 halaman (?limit=, ?cursor=, ?fields=)"""
         try:
             limit = request.args.get('limit', 100, type=int)
-            layouts = HouseLayout.get_all(limit)
+            layouts, next_cursor = HouseLayout.get_all(
+                limit,
+                cursor=request.args.get('cursor'),
+                fields=request.args.get('fields')
+            )
             return jsonify({
                 'status': 'success',
-                'data': layouts
+                'data': layouts,
+                'next_cursor': next_cursor
             }), 200
+        except ValueError as e:
+            return jsonify({
+                'status': 'error',
+                'message': str(e)
+            }), 400
         except Exception as e:
             return jsonify({
                 'status': 'error',
@@ -26,14 +36,24 @@ class HouseLayoutController:
     
     @staticmethod
     def get_public():
-        """Get public layouts"""
+        """Get public layouts, 1 halaman (?limit=, ?cursor=, ?fields=)"""
         try:
             limit = request.args.get('limit', 50, type=int)
-            layouts = HouseLayout.get_public(limit)
+            layouts, next_cursor = HouseLayout.get_public(
+                limit,
+                cursor=request.args.get('cursor'),
+                fields=request.args.get('fields')
+            )
             return jsonify({
                 'status': 'success',
-                'data': layouts
+                'data': layouts,
+                'next_cursor': next_cursor
             }), 200
+        except ValueError as e:
+            return jsonify({
+                'status': 'error',
+                'message': str(e)
+            }), 400
         except Exception as e:
             return jsonify({
                 'status': 'error',
@@ -42,13 +62,24 @@ class HouseLayoutController:
     
     @staticmethod
     def get_by_user(user_id):
-        """Get layouts by user ID"""
+        """Get layouts by user ID, 1 halaman (?limit=, ?cursor=, ?fields=)"""
         try:
-            layouts = HouseLayout.get_by_user(user_id)
+            layouts, next_cursor = HouseLayout.get_by_user(
+                user_id,
+                cursor=request.args.get('cursor'),
+                limit=request.args.get('limit', type=int),
+                fields=request.args.get('fields')
+            )
             return jsonify({
                 'status': 'success',
-                'data': layouts
+                'data': layouts,
+                'next_cursor': next_cursor
             }), 200
+        except ValueError as e:
+            return jsonify({
+                'status': 'error',
+                'message': str(e)
+            }), 400
         except Exception as e:
             return jsonify({
                 'status': 'error',
@@ -2,11 +2,15 @@
 LayoutController
 Handle furniture layout prediction and file uploads
 """
-from flask import request, jsonify, send_from_directory
+from flask import request, jsonify, send_from_directory, Response, stream_with_context
 from werkzeug.utils import secure_filename
 from datetime import datetime
+import json
+import math
 import os
+import time
 from config import Config
+from app.services.Metrics import Metrics
 
 
 class LayoutController:
@@ -18,16 +22,135 @@ class LayoutController:
         return '.' in filename and \
                filename.rsplit('.', 1)[1].lower() in Config.ALLOWED_EXTENSIONS
     
+    @staticmethod
+    def wants_ndjson():
+        """Client minta streaming response (Accept: application/x-ndjson)"""
+        accept = request.accept_mimetypes
+        return accept["application/x-ndjson"] > accept["application/json"]
+    
+    @staticmethod
+    def wants_debug(data):
+        """Timing per stage di body response (body "debug": true atau ?debug=1)"""
+        return bool(data.get("debug")) or request.args.get("debug", "").lower() in ("1", "true")
+    
+    @staticmethod
+    def parse_alternatives(value):
+        """
+        Body "alternatives" -> k (1 kalau tidak diisi, dibatasi LAYOUT_ALTERNATIVES_MAX)
+        Raises:
+            ValueError: bukan integer >= 1
+        """
+        if value is None or value == "":
+            return 1
+        if isinstance(value, bool) or not isinstance(value, (int, str)) or \
+                (isinstance(value, str) and not value.strip().isdigit()):
+            raise ValueError("alternatives must be a positive integer")
+        k = int(value)
+        if k < 1:
+            raise ValueError("alternatives must be a positive integer")
+        return min(k, Config.LAYOUT_ALTERNATIVES_MAX)
+    
+    @staticmethod
+    def parse_time_budget(value):
+        """
+        Body "time_budget_ms" -> budget optimizer dalam ms (None kalau tidak diisi,
+        dibatasi LAYOUT_OPTIMIZER_MAX_BUDGET_MS)
+        Raises:
+            ValueError: bukan angka > 0
+        """
+        if value is None or value == "":
+            return None
+        if isinstance(value, bool) or not isinstance(value, (int, float, str)):
+            raise ValueError("time_budget_ms must be a positive number")
+        try:
+            budget = float(value)
+        except ValueError:
+            raise ValueError("time_budget_ms must be a positive number")
+        if not math.isfinite(budget) or budget <= 0:
+            raise ValueError("time_budget_ms must be a positive number")
+        return min(budget, Config.LAYOUT_OPTIMIZER_MAX_BUDGET_MS)
+    
+    @staticmethod
+    def parse_room_size(data):
+        """
+        Body room_width / room_height (meter, default 17 x 11) -> (width, height)
+        Raises:
+            ValueError: bukan angka > 0
+        """
+        size = []
+        for key, default in (("room_width", 17.0), ("room_height", 11.0)):
+            value = data.get(key, default)
+            try:
+                value = float(value) if not isinstance(value, bool) else float("nan")
+            except (TypeError, ValueError):
+                raise ValueError(f"{key} must be a positive number")
+            if not math.isfinite(value) or value <= 0:
+                raise ValueError(f"{key} must be a positive number")
+            size.append(value)
+        return tuple(size)
+    
+    @staticmethod
+    def timed_response(payload, timer, debug=False):
+        """jsonify + Server-Timing header (+ "timing" di body kalau debug), lalu masuk stats process"""
+        if debug:
+            payload["timing"] = timer.to_dict()
+        response = jsonify(payload)
+        server_timing = timer.server_timing()
+        if server_timing:
+            response.headers["Server-Timing"] = server_timing
+        timer.record()
+        Metrics.inc("layout_items_placed_total", payload.get("total_placed", 0))
+        return response
+    
+    @staticmethod
+    def stream_predict(layout_service, items, room_type, floor_data, timer, debug=False):
+        """
+        Streaming NDJSON: 1 baris per item begitu item selesai ditaruh
+        {"event": "item", "index": 0, "data": {...}}
+        {"event": "done", "total_placed": n, ...}
+        Header sudah terkirim sebelum item pertama - timing cuma di event done (debug)
+        """
+        def generate():
+            total, cache_hit = 0, False
+            try:
+                for result, cache_hit in layout_service.stream_cached(items, room_type, floor_data, timer):
+                    yield json.dumps({"event": "item", "index": total, "data": result}) + "\n"
+                    total += 1
+                done = {
+                    "event": "done",
+                    "status": "success",
+                    "room_type": room_type,
+                    "total_placed": total,
+                    "model_used": layout_service.model is not None,
+                    "cache": {"hit": cache_hit}
+                }
+                if debug:
+                    done["timing"] = timer.to_dict()
+                timer.record()
+                Metrics.inc("layout_items_placed_total", total)
+                yield json.dumps(done) + "\n"
+            except Exception as e:
+                print(f"Predict stream error: {e}")
+                yield json.dumps({"event": "error", "status": "error", "message": str(e)}) + "\n"
+        
+        return Response(stream_with_context(generate()), mimetype="application/x-ndjson",
+                        headers={"X-Accel-Buffering": "no", "Cache-Control": "no-cache"})
+    
     @staticmethod
     def predict_batch():
         """
         Predict furniture layout positions using ML model
         POST /api/layout/predict
-        Body: {items: [], room_type: "", floor_data: {}}
+        Body: {items: [], room_type: "", floor_data: {}, time_budget_ms: 200 (optional), alternatives: k (optional),
+               debug: true (optional, timing per stage di body)}
+        Accept: application/x-ndjson -> streaming response per item
+        Response header Server-Timing: durasi per stage pipeline + retry counters
         """
         try:
             from app.services.LayoutService import LayoutService
+            from app.services.StageTimer import StageTimer
             
+            timer = StageTimer.create()
             data = request.get_json()
             items = data.get("items", [])
             room_type = data.get("room_type", "living_room")
@@ -39,29 +162,294 @@ class LayoutController:
                     "message": "No items provided"
                 }), 400
             
-            # Initialize layout service (will load ML model)
-            layout_service = LayoutService()
+            try:
+                alternatives = LayoutController.parse_alternatives(data.get("alternatives"))
+                time_budget_ms = LayoutController.parse_time_budget(data.get("time_budget_ms"))
+            except ValueError as e:
+                return jsonify({
+                    "status": "error",
+                    "message": str(e)
+                }), 400
             
-            # Predict positions using ML + collision detection
-            results = layout_service.predict_batch(items, room_type, floor_data)
+            # Shared layout service (stateless, aman dipakai banyak thread)
+            layout_service = LayoutService.shared()
+            debug = LayoutController.wants_debug(data)
             
-            return jsonify({
+            # Anytime optimizer mode (time budget)
+            if time_budget_ms is not None:
+                results, optimizer = layout_service.optimize_batch(items, room_type, floor_data, time_budget_ms)
+                return LayoutController.timed_response({
+                    "status": "success",
+                    "data": results,
+                    "room_type": room_type,
+                    "total_placed": len(results),
+                    "model_used": layout_service.model is not None,
+                    "optimizer": optimizer
+                }, timer, debug)
+            
+            # Top-k layout alternatif (data = alternatif terbaik)
+            if alternatives > 1:
+                ranked = layout_service.predict_alternatives(items, room_type, floor_data, alternatives, timer)
+                return LayoutController.timed_response({
+                    "status": "success",
+                    "data": ranked[0]["data"],
+                    "alternatives": ranked,
+                    "requested": alternatives,
+                    "returned": len(ranked),
+                    "room_type": room_type,
+                    "total_placed": len(ranked[0]["data"]),
+                    "model_used": layout_service.model is not None
+                }, timer, debug)
+            
+            if LayoutController.wants_ndjson():
+                return LayoutController.stream_predict(layout_service, items, room_type, floor_data, timer, debug)
+            
+            # Predict positions using ML + collision detection (cached)
+            results, cache_hit = layout_service.predict_cached(items, room_type, floor_data, timer)
+            
+            return LayoutController.timed_response({
                 "status": "success",
                 "data": results,
                 "room_type": room_type,
                 "total_placed": len(results),
+                "model_used": layout_service.model is not None,
+                "cache": {"hit": cache_hit, **LayoutService.cache.stats()}
+            }, timer, debug)
+            
+        except Exception as e:
+            import traceback
+            print(f"Predict batch error: {e}")
+            print(traceback.format_exc())
+            return jsonify({
+                "status": "error",
+                "message": str(e)
+            }), 500
+    
+    @staticmethod
+    def load_saved_placements(layout_id, floor=None):
+        """Placement dari HouseLayout tersimpan (layout_data.placed / floorLayouts[floor])"""
+        from app.models.HouseLayout import HouseLayout
+        
+        layout = HouseLayout.get_by_id(layout_id)
+        if not layout:
+            return None
+        
+        layout_data = layout.get("layout_data") or {}
+        if isinstance(layout_data, str):
+            layout_data = json.loads(layout_data)
+        if floor is not None:
+            return (layout_data.get("floorLayouts") or {}).get(str(floor), [])
+        return layout_data.get("placed", [])
+    
+    @staticmethod
+    def update_layout():
+        """
+        Incremental update: tambah / hapus / pindah item tanpa hitung ulang semua
+        POST /api/layout/update
+        Body: {placed: [] | layout_id: 1, floor: 1, add: [], remove: [id], move: [{id, x, y}],
+               room_type: "", floor_data: {}}
+        """
+        try:
+            from app.services.LayoutService import LayoutService
+            from app.services.StageTimer import StageTimer
+            
+            timer = StageTimer.create()
+            data = request.get_json() or {}
+            placed = data.get("placed")
+            
+            if placed is None and data.get("layout_id") is not None:
+                placed = LayoutController.load_saved_placements(data["layout_id"], data.get("floor"))
+                if placed is None:
+                    return jsonify({
+                        "status": "error",
+                        "message": "Layout not found"
+                    }), 404
+            
+            if placed is None:
+                return jsonify({
+                    "status": "error",
+                    "message": "Provide placed items or layout_id"
+                }), 400
+            
+            layout_service = LayoutService.shared()
+            result = layout_service.update_layout(
+                placed,
+                add=data.get("add", []),
+                remove=data.get("remove", []),
+                move=data.get("move", []),
+                room_type=data.get("room_type", "living_room"),
+                floor_data=data.get("floor_data", None),
+                timer=timer
+            )
+            
+            return LayoutController.timed_response({
+                "status": "success",
+                "data": result["data"],
+                "changed": result["changed"],
+                "removed": result["removed"],
+                "total_placed": len(result["data"]),
                 "model_used": layout_service.model is not None
+            }, timer, LayoutController.wants_debug(data))
+            
+        except Exception as e:
+            import traceback
+            print(f"Update layout error: {e}")
+            print(traceback.format_exc())
+            return jsonify({
+                "status": "error",
+                "message": str(e)
+            }), 500
+    
+    @staticmethod
+    def predict_building():
+        """
+        Predict layout semua lantai sekaligus (paralel per lantai)
+        POST /api/layout/predict-building
+        Body: {floors: [{floor: 1, items: [], room_type: "", floor_data: {}}, ...]}
+        """
+        try:
+            from app.services.LayoutService import LayoutService
+            
+            data = request.get_json() or {}
+            floors = data.get("floors", [])
+            
+            if not floors:
+                return jsonify({
+                    "status": "error",
+                    "message": "No floors provided"
+                }), 400
+            
+            jobs, job_floors, floor_results = [], [], []
+            for idx, floor in enumerate(floors):
+                floor_number = floor.get("floor", idx + 1)
+                items = floor.get("items", [])
+                room_type = floor.get("room_type", "living_room")
+                if not items:
+                    floor_results.append({
+                        "floor": floor_number,
+                        "status": "error",
+                        "message": "No items provided"
+                    })
+                    continue
+                
+                floor_results.append({"floor": floor_number, "room_type": room_type})
+                jobs.append((items, room_type, floor.get("floor_data", None)))
+                job_floors.append(floor_results[-1])
+            
+            layout_service = LayoutService.shared()
+            started = time.perf_counter()
+            outputs = layout_service.predict_building(jobs)
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            
+            # Shape per lantai sama dengan response /api/layout/predict
+            for floor_result, (results, cache_hit) in zip(job_floors, outputs):
+                floor_result.update({
+                    "status": "success",
+                    "data": results,
+                    "total_placed": len(results),
+                    "model_used": layout_service.model is not None,
+                    "cache": {"hit": cache_hit}
+                })
+            
+            return jsonify({
+                "status": "success",
+                "data": floor_results,
+                "total_floors": len(floor_results),
+                "elapsed_ms": round(elapsed_ms, 2)
             })
             
         except Exception as e:
             import traceback
-            print(f"Predict batch error: {e}")
+            print(f"Predict building error: {e}")
             print(traceback.format_exc())
             return jsonify({
                 "status": "error",
                 "message": str(e)
             }), 500
     
+    @staticmethod
+    def submit_job():
+        """
+        Submit layout job (async) - return job id langsung
+        POST /api/layout/jobs
+        Body: {type: "predict", items: [], room_type: "", floor_data: {}}
+              {type: "auto-place", room_width: 17.0, room_height: 11.0}
+        """
+        try:
+            from app.services.LayoutJobQueue import LayoutJobQueue
+            
+            data = request.get_json() or {}
+            job_type = data.get("type", "predict")
+            
+            if job_type == "predict":
+                if not data.get("items"):
+                    return jsonify({
+                        "status": "error",
+                        "message": "No items provided"
+                    }), 400
+                payload = {
+                    "items": data["items"],
+                    "room_type": data.get("room_type", "living_room"),
+                    "floor_data": data.get("floor_data", None)
+                }
+            else:
+                room_width, room_height = LayoutController.parse_room_size(data)
+                payload = {"room_width": room_width, "room_height": room_height}
+            
+            job = LayoutJobQueue.submit(job_type, payload)
+            
+            return jsonify({
+                "status": "success",
+                "job_id": job.id,
+                "job_status": job.status,
+                "poll_url": f"/api/layout/jobs/{job.id}"
+            }), 202
+            
+        except ValueError as e:
+            return jsonify({
+                "status": "error",
+                "message": str(e)
+            }), 400
+        except OverflowError as e:
+            return jsonify({
+                "status": "error",
+                "message": str(e)
+            }), 429
+        except Exception as e:
+            return jsonify({
+                "status": "error",
+                "message": str(e)
+            }), 500
+    
+    @staticmethod
+    def get_job(job_id):
+        """
+        Get status / hasil layout job
+        GET /api/layout/jobs/<job_id>?wait=10 (long-poll, detik)
+        """
+        try:
+            from app.services.LayoutJobQueue import LayoutJobQueue
+            
+            wait = request.args.get("wait", 0, type=float)
+            job = LayoutJobQueue.get(job_id, wait=wait)
+            
+            if job is None:
+                return jsonify({
+                    "status": "error",
+                    "message": "Job not found or expired"
+                }), 404
+            
+            return jsonify({
+                "status": "success",
+                "job": job.to_dict()
+            })
+            
+        except Exception as e:
+            return jsonify({
+                "status": "error",
+                "message": str(e)
+            }), 500
+    
     @staticmethod
     def get_floor_recommendations():
         """
@@ -104,6 +492,23 @@ class LayoutController:
                 "message": str(e)
             }), 500
     
+    @staticmethod
+    def layout_stats():
+        """
+        Statistik process: timing per stage & retry counters (semua request), cache
+        GET /api/layout/stats
+        """
+        from app.services.LayoutService import LayoutService
+        from app.services.StageTimer import StageTimer
+        
+        return jsonify({
+            "status": "success",
+            "enabled": Config.LAYOUT_STAGE_TIMING,
+            "pid": os.getpid(),
+            "pipeline": StageTimer.process_stats(),
+            "cache": LayoutService.cache.stats()
+        })
+    
     @staticmethod
     def reset_layout():
         """
@@ -126,8 +531,13 @@ class LayoutController:
             from app.services.LayoutService import LayoutService
             
             data = request.get_json() or {}
-            room_width = data.get("room_width", 17.0)
-            room_height = data.get("room_height", 11.0)
+            try:
+                room_width, room_height = LayoutController.parse_room_size(data)
+            except ValueError as e:
+                return jsonify({
+                    "status": "error",
+                    "message": str(e)
+                }), 400
             
             print(f"\n🤖 Auto Place Request - ML Model")
             print(f"   Room: {room_width}m × {room_height}m")
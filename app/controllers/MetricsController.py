@@ -0,0 +1,48 @@
+"""
+MetricsController
+Request metrics (latency per route, in-flight) & Prometheus scrape endpoint
+"""
+from flask import request, g, Response
+import time
+from app.services.Metrics import Metrics
+
+
+class MetricsController:
+    """Hook request blueprint api + GET /api/metrics"""
+    
+    @staticmethod
+    def route_label():
+        """Rule Flask (bukan path asli - id tidak bikin series baru)"""
+        return request.url_rule.rule if request.url_rule is not None else "unmatched"
+    
+    @staticmethod
+    def before_request():
+        g.metrics_started = time.perf_counter()
+        g.metrics_route = MetricsController.route_label()
+        Metrics.inc("http_requests_in_flight", route=g.metrics_route)
+    
+    @staticmethod
+    def after_request(response):
+        g.metrics_status = response.status_code
+        return response
+    
+    @staticmethod
+    def teardown_request(exc=None):
+        """Dipanggil juga kalau handler raise / setelah streaming response selesai"""
+        started = g.pop("metrics_started", None)
+        if started is None:
+            return
+        route = g.pop("metrics_route")
+        status = g.pop("metrics_status", 500 if exc is not None else 200)
+        Metrics.dec("http_requests_in_flight", route=route)
+        Metrics.observe("http_request_duration_seconds", time.perf_counter() - started,
+                        route=route, method=request.method, status=status)
+        Metrics.maybe_flush()
+    
+    @staticmethod
+    def metrics():
+        """
+        Prometheus text exposition format (semua worker kalau METRICS_DIR di-set)
+        GET /api/metrics
+        """
+        return Response(Metrics.render(), mimetype="text/plain; version=0.0.4; charset=utf-8")
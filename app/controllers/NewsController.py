@@ -20,11 +20,25 @@ class NewsController:
     
     @staticmethod
     def index():
-        """Get all news"""
-        news = News.get_all()
+        """
+        Get news, 1 halaman (?limit=, ?cursor= dari next_cursor sebelumnya)
+        ?fields=title,content,... untuk pilih kolom (default tanpa content)
+        """
+        try:
+            news, next_cursor = News.get_all(
+                cursor=request.args.get('cursor'),
+                limit=request.args.get('limit', type=int),
+                fields=request.args.get('fields')
+            )
+        except ValueError as e:
+            return jsonify({
+                "status": "error",
+                "message": str(e)
+            }), 400
         return jsonify({
             "status": "success",
-            "news": news
+            "news": news,
+            "next_cursor": next_cursor
         })
     
     @staticmethod
@@ -10,19 +10,28 @@ class QuestionController:
     
     @staticmethod
     def index():
-        """Get all questions (admin)"""
-        questions = Question.get_all()
+        """Get questions (admin), 1 halaman (?limit=, ?cursor=) + summary semua pertanyaan"""
+        try:
+            questions, next_cursor = Question.get_all(
+                cursor=request.args.get('cursor'),
+                limit=request.args.get('limit', type=int)
+            )
+        except ValueError as e:
+            return jsonify({
+                "status": "error",
+                "message": str(e)
+            }), 400
         
-        pending = [q for q in questions if q['status'] == 'pending']
-        answered = [q for q in questions if q['status'] == 'answered']
+        counts = Question.count_by_status()
         
         return jsonify({
             "status": "success",
             "data": questions,
+            "next_cursor": next_cursor,
             "summary": {
-                "total": len(questions),
-                "pending": len(pending),
-                "answered": len(answered)
+                "total": sum(counts.values()),
+                "pending": counts.get('pending', 0),
+                "answered": counts.get('answered', 0)
             }
         })
     
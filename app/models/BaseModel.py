@@ -3,81 +3,179 @@ Base Model
 Parent class untuk semua models
 """
 from database.connection import Database
+from database.instrumented import InstrumentedConnection
 
 class BaseModel:
     """Base model dengan helper methods"""
     
     table_name = None
     
+    # Projection list endpoint: nama field -> ekspresi SQL (urutan = urutan kolom)
+    columns = {}
+    # Field default list endpoint (tanpa kolom berat), detail tetap semua kolom
+    list_fields = ()
+    
     @classmethod
     def get_connection(cls):
-        """Get database connection"""
+        """
+        Get database connection (query count & latency dicatat per model class)
+        Di dalam request: koneksi unit of work request (1 koneksi untuk semua model call)
+        """
         from config import Config
-        return Database.get_connection(Config.DB_NAME)
+        from database.unit_of_work import UnitOfWork
+        unit_of_work = UnitOfWork.current()
+        if unit_of_work is not None:
+            conn = unit_of_work.connection()
+        else:
+            conn = Database.get_connection(Config.DB_NAME)
+        if Config.METRICS_ENABLED:
+            return InstrumentedConnection(conn, cls.__name__)
+        return conn
+    
+    @classmethod
+    def _prepared_cursor(cls, conn, query):
+        """Prepared cursor dari cache koneksi pool, None kalau tidak tersedia (pool / fitur mati)"""
+        from config import Config
+        if not Config.DB_PREPARED_STATEMENTS or not hasattr(conn, "prepared"):
+            return None
+        return conn.prepared(query)
+    
+    @classmethod
+    def _run(cls, query, params, handle, dictionary=True, commit=False):
+        """
+        Jalankan 1 query lalu handle(cursor)
+        Query berulang pakai server-side prepared statement (di-cache per koneksi),
+        koneksi selalu kembali ke pool walaupun query error
+        """
+        from database.statement_cache import text_rows
+        conn = cls.get_connection()
+        try:
+            cursor = cls._prepared_cursor(conn, query)
+            if cursor is None:
+                cursor = conn.cursor(dictionary=dictionary)
+                try:
+                    cursor.execute(query, params or ())
+                    result = handle(cursor)
+                finally:
+                    cursor.close()
+            else:
+                try:
+                    cursor.execute(query, params or ())
+                    result = handle(cursor)
+                except Exception:
+                    conn.discard_prepared(query)  # Statement rusak / perlu re-prepare
+                    raise
+                if isinstance(result, list):
+                    result = text_rows(cursor, result)
+            if commit:
+                conn.commit()
+            return result
+        finally:
+            conn.close()
+    
+    @staticmethod
+    def _first(cursor):
+        # fetchall (bukan fetchone) - result set prepared cursor harus habis dibaca
+        rows = cursor.fetchall()
+        return rows[:1]
     
     @classmethod
     def execute(cls, query, params=None):
         """Execute query and return last insert id"""
-        conn = cls.get_connection()
-        cursor = conn.cursor()
-        cursor.execute(query, params or ())
-        last_id = cursor.lastrowid
-        conn.commit()
-        cursor.close()
-        conn.close()
-        return last_id
+        return cls._run(query, params, lambda cursor: cursor.lastrowid, dictionary=False, commit=True)
     
     @classmethod
     def fetch_all(cls, query, params=None):
         """Fetch all results"""
-        conn = cls.get_connection()
-        cursor = conn.cursor(dictionary=True)
-        cursor.execute(query, params or ())
-        results = cursor.fetchall()
-        cursor.close()
-        conn.close()
-        return results
+        return cls._run(query, params, lambda cursor: cursor.fetchall())
     
     @classmethod
     def fetch_one(cls, query, params=None):
         """Fetch single result"""
-        conn = cls.get_connection()
-        cursor = conn.cursor(dictionary=True)
-        cursor.execute(query, params or ())
-        result = cursor.fetchone()
-        cursor.close()
-        conn.close()
-        return result
+        rows = cls._run(query, params, cls._first)
+        return rows[0] if rows else None
+    
+    @classmethod
+    def projection(cls, fields=None, default=None, exclude=()):
+        """
+        SELECT list untuk ?fields=a,b,c (sparse fieldset), id selalu ikut
+        Args:
+            fields (str|list): field yang diminta client, kosong = default
+            default (tuple): field default (None = list_fields)
+            exclude (tuple): field yang tidak boleh dipilih di endpoint ini
+        Raises:
+            ValueError: field tidak dikenal
+        """
+        if isinstance(fields, str):
+            fields = [field.strip() for field in fields.split(",") if field.strip()]
+        allowed = [name for name in cls.columns if name not in exclude]
+        selected = set(fields or default or cls.list_fields or allowed)
+        unknown = selected.difference(allowed)
+        if unknown:
+            raise ValueError(f"Unknown field(s): {', '.join(sorted(unknown))}")
+        selected.add("id")
+        # Urutan tetap ikut columns - query text sama untuk kombinasi field yang sama (prepared statement)
+        return ", ".join(expr if expr == name else f"{expr} AS {name}"
+                         for name, expr in cls.columns.items() if name in selected)
+    
+    @classmethod
+    def fetch_page(cls, columns, source, keys, where=None, params=None, cursor=None, limit=None, nullable=()):
+        """
+        1 halaman list dengan keyset pagination (ORDER BY keys DESC)
+        Args:
+            columns (str): kolom SELECT
+            source (str): FROM (table + join)
+            keys (tuple): kolom urutan (qualified, bukan alias), terakhir harus unik
+            nullable (tuple): key yang boleh NULL (default semua key NOT NULL)
+            where (str): filter tambahan (parameter di params)
+            cursor (str): next_cursor dari halaman sebelumnya
+            limit (int): ukuran halaman (sudah dibatasi page_size)
+        Returns:
+            (rows, next_cursor) - next_cursor None di halaman terakhir
+        Raises:
+            ValueError: cursor tidak valid
+        """
+        from database.pagination import decode_cursor, encode_cursor, keyset_condition
+        conditions = [where] if where else []
+        params = list(params or ())
+        if cursor:
+            condition, cursor_params = keyset_condition(keys, decode_cursor(cursor, len(keys)), nullable)
+            conditions.append(condition)
+            params += cursor_params
+
+        # Nilai key ikut di-select mentah (kolom tampilan bisa DATE_FORMAT) untuk cursor berikutnya
+        aliases = [f"_page_key{i}" for i in range(len(keys))]
+        query = f"""
+            SELECT {columns}, {', '.join(f'{key} AS {alias}' for key, alias in zip(keys, aliases))}
+            FROM {source}
+            {'WHERE ' + ' AND '.join(conditions) if conditions else ''}
+            ORDER BY {', '.join(f'{key} DESC' for key in keys)}
+            LIMIT %s
+        """
+        rows = cls.fetch_all(query, tuple(params) + (limit + 1,))  # +1 row: ada halaman berikutnya?
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_cursor([rows[-1][alias] for alias in aliases])
+        for row in rows:
+            for alias in aliases:
+                row.pop(alias, None)
+        return rows, next_cursor
     
     @classmethod
     def find_all(cls):
         """Get all records"""
-        conn = cls.get_connection()
-        cursor = conn.cursor(dictionary=True)
-        cursor.execute(f"SELECT * FROM {cls.table_name}")
-        results = cursor.fetchall()
-        cursor.close()
-        conn.close()
-        return results
+        return cls.fetch_all(f"SELECT * FROM {cls.table_name}")
     
     @classmethod
     def find_by_id(cls, id):
         """Find record by ID"""
-        conn = cls.get_connection()
-        cursor = conn.cursor(dictionary=True)
-        cursor.execute(f"SELECT * FROM {cls.table_name} WHERE id = %s", (id,))
-        result = cursor.fetchone()
-        cursor.close()
-        conn.close()
-        return result
+        return cls.fetch_one(f"SELECT * FROM {cls.table_name} WHERE id = %s", (id,))
     
     @classmethod
     def delete_by_id(cls, id):
         """Delete record by ID"""
-        conn = cls.get_connection()
-        cursor = conn.cursor()
-        cursor.execute(f"DELETE FROM {cls.table_name} WHERE id = %s", (id,))
-        affected = cursor.rowcount
-        cursor.close()
-        conn.close()
+        affected = cls._run(f"DELETE FROM {cls.table_name} WHERE id = %s", (id,),
+                            lambda cursor: cursor.rowcount, dictionary=False)
         return affected > 0
@@ -17,13 +17,19 @@ class ContactMessage(BaseModel):
         return cls.execute(query, (name, email, phone, subject, message))
     
     @classmethod
-    def get_all(cls):
-        """Get all contact messages"""
-        query = """
-            SELECT * FROM contact_messages
-            ORDER BY created_at DESC
+    def get_all(cls, cursor=None, limit=None):
         """
-        return cls.fetch_all(query)
+        Contact messages (terbaru dulu), 1 halaman
+        Returns: (messages, next_cursor)
+        """
+        from database.pagination import page_size
+        return cls.fetch_page(
+            "*",
+            "contact_messages",
+            ("contact_messages.created_at", "contact_messages.id"),
+            cursor=cursor,
+            limit=page_size(limit)
+        )
     
     @classmethod
     def get_unread(cls):
@@ -29,18 +29,12 @@ class FAQ(BaseModel):
     @classmethod
     def get_active(cls):
         """Get only active FAQs"""
-        conn = cls.get_connection()
-        cursor = conn.cursor(dictionary=True)
-        cursor.execute("""
+        return cls.fetch_all("""
             SELECT id, category, question, answer, display_order
             FROM faqs 
             WHERE is_active = 1
             ORDER BY category, display_order ASC
         """)
-        results = cursor.fetchall()
-        cursor.close()
-        conn.close()
-        return results
     
     @classmethod
     def get_by_category(cls, category):
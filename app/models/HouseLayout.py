@@ -7,6 +7,26 @@ from app.models.BaseModel import BaseModel
 class HouseLayout(BaseModel):
     table_name = 'house_layouts'
     
+    columns = {
+        'id': 'hl.id',
+        'user_id': 'hl.user_id',
+        'layout_name': 'hl.layout_name',
+        'house_type': 'hl.house_type',
+        'layout_data': 'hl.layout_data',
+        'thumbnail': 'hl.thumbnail',
+        'is_public': 'hl.is_public',
+        'created_at': 'hl.created_at',
+        'updated_at': 'hl.updated_at',
+        'username': 'u.username',
+        'email': 'u.email'
+    }
+    # List tanpa layout_data (JSON layout lengkap) & thumbnail, detail /layouts/<id> tetap lengkap
+    list_fields = ('user_id', 'layout_name', 'house_type', 'is_public', 'created_at', 'updated_at',
+                   'username', 'email')
+    # Gallery (public / per user) menampilkan thumbnail, email user tidak pernah public
+    gallery_fields = ('user_id', 'layout_name', 'house_type', 'thumbnail', 'is_public', 'created_at',
+                      'updated_at', 'username')
+    
     @classmethod
     def create(cls, user_id, layout_name, house_type, layout_data, thumbnail=None, is_public=0):
         """Create new house layout"""
@@ -21,39 +41,55 @@ class HouseLayout(BaseModel):
         return cls.execute(query, (user_id, layout_name, house_type, layout_json, thumbnail, is_public))
     
     @classmethod
-    def get_all(cls, limit=100):
-        """Get all layouts"""
-        query = """
-            SELECT hl.*, u.username, u.email
-            FROM house_layouts hl
-            LEFT JOIN users u ON hl.user_id = u.id
-            ORDER BY hl.created_at DESC
-            LIMIT %s
+    def get_all(cls, limit=100, cursor=None, fields=None):
+        """
+        Get all layouts (terbaru dulu), 1 halaman
+        fields: ?fields= (default list_fields, tanpa layout_data & thumbnail)
+        Returns: (layouts, next_cursor)
         """
-        return cls.fetch_all(query, (limit,))
+        from database.pagination import page_size
+        return cls.fetch_page(
+            cls.projection(fields),
+            "house_layouts hl LEFT JOIN users u ON hl.user_id = u.id",
+            ("hl.created_at", "hl.id"),
+            cursor=cursor,
+            limit=page_size(limit, default=100)
+        )
     
     @classmethod
-    def get_public(cls, limit=50):
-        """Get public layouts"""
-        query = """
-            SELECT hl.*, u.username
-            FROM house_layouts hl
-            LEFT JOIN users u ON hl.user_id = u.id
-            WHERE hl.is_public = 1
-            ORDER BY hl.created_at DESC
-            LIMIT %s
+    def get_public(cls, limit=50, cursor=None, fields=None):
         """
-        return cls.fetch_all(query, (limit,))
+        Get public layouts (terbaru dulu), 1 halaman
+        fields: ?fields= (default gallery_fields, tanpa layout_data)
+        Returns: (layouts, next_cursor)
+        """
+        from database.pagination import page_size
+        return cls.fetch_page(
+            cls.projection(fields, default=cls.gallery_fields, exclude=('email',)),
+            "house_layouts hl LEFT JOIN users u ON hl.user_id = u.id",
+            ("hl.created_at", "hl.id"),
+            where="hl.is_public = 1",
+            cursor=cursor,
+            limit=page_size(limit, default=50)
+        )
     
     @classmethod
-    def get_by_user(cls, user_id):
-        """Get layouts by user ID"""
-        query = """
-            SELECT * FROM house_layouts
-            WHERE user_id = %s
-            ORDER BY created_at DESC
+    def get_by_user(cls, user_id, cursor=None, limit=None, fields=None):
+        """
+        Get layouts by user ID (terbaru dulu), 1 halaman
+        fields: ?fields= (default gallery_fields, tanpa layout_data)
+        Returns: (layouts, next_cursor)
         """
-        return cls.fetch_all(query, (user_id,))
+        from database.pagination import page_size
+        return cls.fetch_page(
+            cls.projection(fields, default=cls.gallery_fields),
+            "house_layouts hl LEFT JOIN users u ON hl.user_id = u.id",
+            ("hl.created_at", "hl.id"),
+            where="hl.user_id = %s",
+            params=(user_id,),
+            cursor=cursor,
+            limit=page_size(limit)
+        )
     
     @classmethod
     def get_by_id(cls, layout_id):
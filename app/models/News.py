@@ -9,38 +9,47 @@ class News(BaseModel):
     
     table_name = "news"
     
+    columns = {
+        "id": "id",
+        "title": "title",
+        "excerpt": "excerpt",
+        "content": "content",
+        "image": "image",
+        "category": "category",
+        "author": "author",
+        "date": "DATE_FORMAT(date, '%Y-%m-%d')",
+        "published": "published"
+    }
+    # List tanpa content (TEXT penuh artikel), detail /news/<id> tetap lengkap
+    list_fields = ("title", "excerpt", "image", "category", "author", "date", "published")
+    
     @classmethod
-    def get_all(cls):
-        """Get all news articles ordered by date"""
-        conn = cls.get_connection()
-        cursor = conn.cursor(dictionary=True)
-        cursor.execute(f"""
-            SELECT id, title, excerpt, content, image, category, author, 
-                   DATE_FORMAT(date, '%Y-%m-%d') as date, published 
-            FROM {cls.table_name} 
-            ORDER BY date DESC
-        """)
-        results = cursor.fetchall()
-        cursor.close()
-        conn.close()
-        return results
+    def get_all(cls, cursor=None, limit=None, fields=None):
+        """
+        News articles ordered by date (terbaru dulu), 1 halaman
+        fields: ?fields= (default list_fields, tanpa content)
+        Returns: (news, next_cursor)
+        """
+        from database.pagination import page_size
+        return cls.fetch_page(
+            cls.projection(fields),
+            cls.table_name,
+            ("news.date", "news.id"),
+            cursor=cursor,
+            nullable=("news.date",),  # Kolom date tanpa default
+            limit=page_size(limit)
+        )
     
     @classmethod
     def get_published(cls):
         """Get only published news"""
-        conn = cls.get_connection()
-        cursor = conn.cursor(dictionary=True)
-        cursor.execute(f"""
+        return cls.fetch_all(f"""
             SELECT id, title, excerpt, content, image, category, author,
                    DATE_FORMAT(date, '%Y-%m-%d') as date, published
             FROM {cls.table_name}
             WHERE published = TRUE
             ORDER BY date DESC
         """)
-        results = cursor.fetchall()
-        cursor.close()
-        conn.close()
-        return results
     
     @classmethod
     def create(cls, data):
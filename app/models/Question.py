@@ -9,25 +9,63 @@ class Question(BaseModel):
     
     table_name = "questions"
     
+    # Urutan admin: pending dulu, lalu sisanya - tiap segment keyset sendiri
+    # (status, created_at) untuk pending, (created_at) untuk sisanya
+    # Status NULL ikut segment "rest" (sama dengan urutan CASE WHEN lama)
+    SEGMENTS = (
+        ("pending", "questions.status = 'pending'"),
+        ("rest", "(questions.status <> 'pending' OR questions.status IS NULL)")
+    )
+    
     @classmethod
-    def get_all(cls):
-        """Get all questions with formatted dates"""
-        conn = cls.get_connection()
-        cursor = conn.cursor(dictionary=True)
-        cursor.execute("""
-            SELECT id, name, email, question, answer, status,
+    def get_all(cls, cursor=None, limit=None):
+        """
+        Questions with formatted dates, pending dulu lalu terbaru, 1 halaman
+        Cursor = "<segment>.<cursor keyset segment itu>"
+        Returns: (questions, next_cursor)
+        """
+        from database.pagination import page_size
+        limit = page_size(limit)
+        names = [name for name, _ in cls.SEGMENTS]
+        start, position = 0, None
+        if cursor:
+            name, _, position = cursor.partition(".")
+            if name not in names:
+                raise ValueError("Invalid cursor")
+            start = names.index(name)
+        
+        questions = []
+        for index in range(start, len(cls.SEGMENTS)):
+            name, where = cls.SEGMENTS[index]
+            rows, next_position = cls.fetch_page(
+                """id, name, email, question, answer, status,
                    DATE_FORMAT(created_at, '%Y-%m-%d %H:%i') as created_at,
                    DATE_FORMAT(answered_at, '%Y-%m-%d %H:%i') as answered_at,
-                   answered_by
-            FROM questions 
-            ORDER BY 
-                CASE WHEN status = 'pending' THEN 0 ELSE 1 END,
-                created_at DESC
+                   answered_by""",
+                cls.table_name,
+                ("questions.created_at", "questions.id"),
+                where=where,
+                cursor=position or None,
+                limit=limit - len(questions)
+            )
+            questions += rows
+            if next_position:
+                return questions, f"{name}.{next_position}"
+            position = None
+            if len(questions) == limit and index + 1 < len(cls.SEGMENTS):
+                # Segment habis tepat di batas halaman - halaman berikutnya mulai segment berikutnya
+                return questions, f"{cls.SEGMENTS[index + 1][0]}."
+        return questions, None
+    
+    @classmethod
+    def count_by_status(cls):
+        """Jumlah pertanyaan per status (summary admin tanpa load semua row)"""
+        rows = cls.fetch_all("""
+            SELECT status, COUNT(*) as total
+            FROM questions
+            GROUP BY status
         """)
-        results = cursor.fetchall()
-        cursor.close()
-        conn.close()
-        return results
+        return {row['status']: row['total'] for row in rows}
     
     @classmethod
     def get_answered(cls):
@@ -0,0 +1,232 @@
+"""
+Compiled Model
+Export tree ensemble (XGBoost / sklearn) ke flat NumPy arrays + vectorized evaluator
+Inference tanpa pandas / predict stack XGBoost - cuma indexing NumPy
+"""
+import json
+import numpy as np
+
+# Objective XGBoost dengan link identity (output = base_score + sum leaf)
+XGB_IDENTITY_OBJECTIVES = {"reg:squarederror", "reg:absoluteerror", "reg:pseudohubererror"}
+
+
+class CompiledModel:
+    """
+    Semua tree di-pad ke (n_trees, max_nodes):
+        feature[t, n]    index feature (-1 = leaf)
+        threshold[t, n]  split threshold
+        left/right[t, n] child node
+        default_left     arah untuk NaN
+        value[t, n]      leaf value (sudah dikali weight/learning rate)
+        target[t]        output index yang ditambah tree ini
+    """
+
+    def __init__(self, trees, target, base, inclusive, source):
+        """
+        Args:
+            trees (list): dict per tree dengan array feature/threshold/left/right/default_left/value
+            target (list): output index per tree
+            base (array): base prediction per output
+            inclusive (bool): True = split kiri kalau x <= threshold (sklearn), False = x < threshold (XGBoost)
+            source (str): tipe model asal (untuk info)
+        """
+        n_trees = len(trees)
+        max_nodes = max(len(t["feature"]) for t in trees)
+        dtype = np.float32 if not inclusive else np.float64
+
+        self.feature = np.full((n_trees, max_nodes), -1, dtype=np.int32)
+        self.threshold = np.zeros((n_trees, max_nodes), dtype=dtype)
+        self.left = np.zeros((n_trees, max_nodes), dtype=np.int32)
+        self.right = np.zeros((n_trees, max_nodes), dtype=np.int32)
+        self.default_left = np.ones((n_trees, max_nodes), dtype=bool)
+        self.value = np.zeros((n_trees, max_nodes))
+        for i, tree in enumerate(trees):
+            n = len(tree["feature"])
+            self.feature[i, :n] = tree["feature"]
+            self.threshold[i, :n] = tree["threshold"]
+            self.left[i, :n] = tree["left"]
+            self.right[i, :n] = tree["right"]
+            self.default_left[i, :n] = tree["default_left"]
+            self.value[i, :n] = tree["value"]
+
+        self.base = np.asarray(base, dtype=float)
+        self.target = np.asarray(target, dtype=np.int32)
+        self.inclusive = inclusive
+        self.source = source
+        self.max_depth = max(self._depth(t) for t in trees)
+
+        # (n_trees, n_outputs) - jumlah leaf per output via 1x matmul
+        self.target_matrix = np.zeros((n_trees, len(self.base)))
+        self.target_matrix[np.arange(n_trees), self.target] = 1.0
+
+        # Flat layout untuk evaluator: node global = tree * max_nodes + node,
+        # leaf menunjuk ke dirinya sendiri (traversal fixed max_depth step)
+        offset = (np.arange(n_trees, dtype=np.int32) * max_nodes)[:, None]
+        leaf = self.feature < 0
+        node_ids = offset + np.arange(max_nodes, dtype=np.int32)
+        self._roots = offset.ravel()
+        self._feature = np.where(leaf, 0, self.feature).ravel()
+        self._threshold = np.where(leaf, np.inf, self.threshold).ravel()
+        self._children = np.stack([np.where(leaf, node_ids, offset + self.left),
+                                   np.where(leaf, node_ids, offset + self.right)], axis=-1).reshape(-1)
+        self._default_right = (~self.default_left).ravel()
+        self._value = self.value.ravel()
+
+    @staticmethod
+    def _depth(tree):
+        """Kedalaman tree (jumlah split dari root ke leaf terdalam)"""
+        depth, frontier = 0, [0]
+        while True:
+            frontier = [c for n in frontier if tree["feature"][n] >= 0 for c in (tree["left"][n], tree["right"][n])]
+            if not frontier:
+                return depth
+            depth += 1
+
+    @property
+    def n_trees(self):
+        return len(self.feature)
+
+    def predict(self, X):
+        """Vectorized traversal semua tree untuk semua sample - array (n, n_outputs)"""
+        X = np.asarray(X, dtype=np.float32)
+        n, n_features = X.shape
+        if not n:
+            return np.zeros((0, len(self.base)))
+
+        # node[i * n_trees + t] = posisi sample i di tree t
+        node = np.tile(self._roots, n)
+        row = np.repeat(np.arange(n, dtype=np.int32) * n_features, self.n_trees)
+        flat_x = X.ravel()
+        has_nan = bool(np.isnan(flat_x).any())
+        for _ in range(self.max_depth):
+            x = flat_x[row + self._feature[node]]
+            threshold = self._threshold[node]
+            go_right = x > threshold if self.inclusive else x >= threshold
+            if has_nan:
+                go_right = np.where(np.isnan(x), self._default_right[node], go_right)
+            node = self._children[2 * node + go_right]
+
+        leaves = self._value[node].reshape(n, self.n_trees)
+        return self.base + leaves @ self.target_matrix
+
+    # ========== EXPORT ==========
+
+    @classmethod
+    def compile(cls, model):
+        """Export model ke CompiledModel - None kalau tipe model tidak didukung"""
+        try:
+            return cls._compile(model)
+        except Exception as e:
+            print(f"⚠️ Model compile failed: {e}")
+            return None
+
+    @classmethod
+    def _compile(cls, model):
+        module = type(model).__module__
+        if module.startswith("xgboost"):
+            return cls._from_xgboost(model)
+        if hasattr(model, "estimators_") and type(model).__name__ == "MultiOutputRegressor":
+            return cls._from_multi_output(model)
+        if module.startswith("sklearn"):
+            return cls._from_sklearn(model)
+        return None
+
+    @classmethod
+    def _from_xgboost(cls, model):
+        """XGBRegressor / Booster (gbtree, objective regresi identity)"""
+        booster = model.get_booster() if hasattr(model, "get_booster") else model
+        learner = json.loads(booster.save_raw("json"))["learner"]
+        if learner["gradient_booster"]["name"] != "gbtree":
+            return None
+        if learner["objective"]["name"] not in XGB_IDENTITY_OBJECTIVES:
+            return None
+
+        gbtree = learner["gradient_booster"]["model"]
+        base = np.atleast_1d(np.asarray(
+            json.loads(learner["learner_model_param"]["base_score"].replace("E", "e")), dtype=float))
+        n_targets = max(int(learner["learner_model_param"].get("num_target", 1)), 1)
+        if len(base) == 1 and n_targets > 1:
+            base = np.repeat(base, n_targets)
+
+        # Early stopping: predict() cuma pakai tree sampai best_iteration
+        n_trees = len(gbtree["trees"])
+        best_iteration = getattr(model, "best_iteration", None) if hasattr(model, "get_booster") else None
+        if best_iteration is not None:
+            n_trees = int(gbtree["iteration_indptr"][best_iteration + 1])
+
+        trees = []
+        for tree in gbtree["trees"][:n_trees]:
+            if int(tree["tree_param"].get("size_leaf_vector", 1)) > 1 or any(tree["split_type"]):
+                return None  # Multi-output leaf / categorical split
+            left = np.asarray(tree["left_children"], dtype=np.int32)
+            leaf = left < 0
+            conditions = np.asarray(tree["split_conditions"], dtype=np.float32)
+            trees.append({
+                "feature": np.where(leaf, -1, tree["split_indices"]),
+                "threshold": np.where(leaf, 0, conditions),
+                "left": np.where(leaf, 0, left),
+                "right": np.where(leaf, 0, tree["right_children"]),
+                "default_left": np.asarray(tree["default_left"], dtype=bool),
+                "value": np.where(leaf, conditions, 0)  # Leaf value disimpan di split_conditions
+            })
+        return cls(trees, gbtree["tree_info"][:n_trees], base, inclusive=False, source="xgboost")
+
+    @staticmethod
+    def _sklearn_tree(estimator, output, scale=1.0):
+        """Satu sklearn tree_ -> dict array (leaf value untuk 1 output)"""
+        tree = estimator.tree_
+        leaf = tree.children_left < 0
+        return {
+            "feature": np.where(leaf, -1, tree.feature),
+            "threshold": np.where(leaf, 0, tree.threshold),
+            "left": np.where(leaf, 0, tree.children_left),
+            "right": np.where(leaf, 0, tree.children_right),
+            "default_left": tree.missing_go_to_left.astype(bool) if hasattr(tree, "missing_go_to_left")
+            else np.ones(len(leaf), dtype=bool),
+            "value": np.where(leaf, tree.value[:, output, 0] * scale, 0)
+        }
+
+    @classmethod
+    def _from_sklearn(cls, model):
+        """DecisionTree / RandomForest / ExtraTrees / GradientBoosting regressor"""
+        name = type(model).__name__
+        if name in ("DecisionTreeRegressor", "ExtraTreeRegressor"):
+            n_outputs = model.n_outputs_
+            trees = [cls._sklearn_tree(model, k) for k in range(n_outputs)]
+            return cls(trees, list(range(n_outputs)), np.zeros(n_outputs), inclusive=True, source=name)
+
+        if name in ("RandomForestRegressor", "ExtraTreesRegressor"):
+            n_outputs, weight = model.n_outputs_, 1.0 / len(model.estimators_)
+            trees = [cls._sklearn_tree(est, k, weight) for est in model.estimators_ for k in range(n_outputs)]
+            target = [k for _ in model.estimators_ for k in range(n_outputs)]
+            return cls(trees, target, np.zeros(n_outputs), inclusive=True, source=name)
+
+        if name == "GradientBoostingRegressor":
+            if not hasattr(model.init_, "constant_"):
+                return None
+            trees = [cls._sklearn_tree(est, 0, model.learning_rate) for est in model.estimators_[:, 0]]
+            base = np.ravel(model.init_.constant_)[:1]
+            return cls(trees, [0] * len(trees), base, inclusive=True, source=name)
+
+        return None
+
+    @classmethod
+    def _from_multi_output(cls, model):
+        """MultiOutputRegressor: 1 sub-model per output, gabung jadi 1 ensemble"""
+        parts = [cls._compile(est) for est in model.estimators_]
+        if any(p is None or len(p.base) != 1 for p in parts):
+            return None
+        if len({p.inclusive for p in parts}) != 1:
+            return None
+
+        trees, target = [], []
+        for output, part in enumerate(parts):
+            for t in range(part.n_trees):
+                trees.append({
+                    "feature": part.feature[t], "threshold": part.threshold[t],
+                    "left": part.left[t], "right": part.right[t],
+                    "default_left": part.default_left[t], "value": part.value[t]
+                })
+                target.append(output)
+        base = [p.base[0] for p in parts]
+        return cls(trees, target, base, inclusive=parts[0].inclusive, source=f"MultiOutput[{parts[0].source}]")
@@ -0,0 +1,84 @@
+"""
+Layout Cache
+LRU + TTL cache untuk hasil predict_batch
+Key = fingerprint canonical dari items, room_type, floor_data & model version
+"""
+import copy
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from config import Config
+
+# Field item yang mempengaruhi hasil layout (field lain diabaikan)
+FINGERPRINT_ITEM_FIELDS = ("id", "name", "category", "panjang", "lebar")
+
+
+def request_fingerprint(items, room_type, floor_data, model_version):
+    """
+    Hash canonical dari request layout
+    Urutan items tetap dihitung (placement berurutan), urutan key dict tidak
+    """
+    payload = {
+        "items": [[item.get(field) for field in FINGERPRINT_ITEM_FIELDS] for item in items],
+        "room_type": room_type,
+        "floor_data": floor_data,
+        "model_version": model_version
+    }
+    canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+class LayoutCache:
+    """Bounded LRU cache dengan TTL per entry - thread-safe"""
+
+    def __init__(self, max_size=None, ttl=None):
+        self.max_size = max_size if max_size is not None else Config.LAYOUT_CACHE_SIZE
+        self.ttl = ttl if ttl is not None else Config.LAYOUT_CACHE_TTL
+        self._entries = OrderedDict()  # key -> (expires_at, value)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key):
+        """Value dari cache (copy), None kalau miss atau expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] < time.monotonic():
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return copy.deepcopy(entry[1])
+
+    def set(self, key, value):
+        if self.max_size <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, copy.deepcopy(value))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        """Hit/miss statistics"""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": round(self.hits / total, 4) if total else 0.0
+            }
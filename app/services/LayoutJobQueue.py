@@ -0,0 +1,197 @@
+"""
+Layout Job Queue
+Layout request berat (predict / auto-place) jalan di background worker pool,
+client dapat job id langsung lalu poll / long-poll hasilnya.
+Hasil disimpan di memory dengan TTL.
+"""
+import multiprocessing
+import threading
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from config import Config
+from app.services.LayoutPool import _init_worker
+
+
+# ========== WORKER (thread atau child process) ==========
+
+def _run_predict(items, room_type="living_room", floor_data=None):
+    from app.services.LayoutService import LayoutService
+
+    service = LayoutService.shared()
+    results, cache_hit = service.predict_cached(items, room_type, floor_data)
+    return {
+        "data": results,
+        "room_type": room_type,
+        "total_placed": len(results),
+        "model_used": service.model is not None,
+        "cache": {"hit": cache_hit}
+    }
+
+
+def _run_auto_place(room_width=17.0, room_height=11.0):
+    from app.services.LayoutService import LayoutService
+
+    return LayoutService.auto_place_all_furniture(room_width, room_height)
+
+
+JOB_TYPES = {
+    "predict": _run_predict,
+    "auto-place": _run_auto_place,
+}
+
+
+def _run_job(job_type, payload):
+    """Entry point worker - harus module-level supaya bisa di-pickle"""
+    from app.services.ModelRegistry import ModelRegistry
+
+    if multiprocessing.current_process().name != "MainProcess":
+        ModelRegistry.reload_if_changed()  # Worker process tidak punya watcher thread
+    return JOB_TYPES[job_type](**payload)
+
+
+# ========== QUEUE ==========
+
+class LayoutJob:
+    """Satu job layout + state-nya"""
+
+    def __init__(self, job_type, payload):
+        self.id = uuid.uuid4().hex
+        self.type = job_type
+        self.payload = payload
+        self.future = None
+        self.result = None
+        self.error = None
+        self.created_at = time.time()
+        self.finished_at = None
+        self.done = threading.Event()
+        self._status = None
+
+    @property
+    def finished(self):
+        return self.done.is_set()
+
+    @property
+    def status(self):
+        """queued -> running -> done / failed"""
+        if self._status is not None:
+            return self._status
+        return "running" if self.future is not None and self.future.running() else "queued"
+
+    def to_dict(self):
+        job = {
+            "id": self.id,
+            "type": self.type,
+            "status": self.status,
+            "created_at": self.created_at,
+            "finished_at": self.finished_at
+        }
+        if self.status == "done":
+            job["result"] = self.result
+        elif self.status == "failed":
+            job["error"] = self.error
+        return job
+
+
+class LayoutJobQueue:
+    """In-memory job store + worker pool (thread / process, dari Config)"""
+
+    _jobs = {}
+    _lock = threading.Lock()
+    _executor = None
+
+    @classmethod
+    def executor(cls):
+        """Get (atau buat) worker pool"""
+        if cls._executor is None:
+            with cls._lock:
+                if cls._executor is None:
+                    workers = Config.LAYOUT_JOB_WORKERS
+                    if Config.LAYOUT_JOB_EXECUTOR == "process":
+                        cls._executor = ProcessPoolExecutor(
+                            max_workers=workers,
+                            mp_context=multiprocessing.get_context(Config.LAYOUT_POOL_START_METHOD),
+                            initializer=_init_worker
+                        )
+                    else:
+                        cls._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="layout-job")
+        return cls._executor
+
+    @classmethod
+    def _purge(cls):
+        """Hapus job yang sudah selesai lebih lama dari TTL"""
+        with cls._lock:
+            cls._purge_expired()
+
+    @classmethod
+    def _purge_expired(cls):
+        """_purge tanpa lock - caller harus pegang cls._lock"""
+        cutoff = time.time() - Config.LAYOUT_JOB_TTL
+        expired = [job_id for job_id, job in cls._jobs.items()
+                   if job.finished and job.finished_at < cutoff]
+        for job_id in expired:
+            del cls._jobs[job_id]
+
+    @classmethod
+    def _pending(cls):
+        """Jumlah job belum selesai - caller harus pegang cls._lock"""
+        return sum(1 for job in cls._jobs.values() if not job.finished)
+
+    @classmethod
+    def pending_count(cls):
+        with cls._lock:
+            return cls._pending()
+
+    @classmethod
+    def submit(cls, job_type, payload):
+        """
+        Queue job baru - return LayoutJob langsung (tidak menunggu hasil)
+
+        Raises:
+            ValueError: job_type tidak dikenal
+            OverflowError: antrian penuh
+        """
+        if job_type not in JOB_TYPES:
+            raise ValueError(f"Unknown job type: {job_type}")
+        job = LayoutJob(job_type, payload)
+        # Purge, cek kapasitas & insert dalam 1 lock - submit paralel tidak bisa lewat batas
+        with cls._lock:
+            cls._purge_expired()
+            if cls._pending() >= Config.LAYOUT_JOB_MAX_PENDING:
+                raise OverflowError("Layout job queue is full")
+            cls._jobs[job.id] = job
+
+        job.future = cls.executor().submit(_run_job, job_type, payload)
+        job.future.add_done_callback(lambda f: cls._finish(job, f))
+        return job
+
+    @staticmethod
+    def _finish(job, future):
+        try:
+            job.result = future.result()
+            job._status = "done"
+        except Exception as e:
+            job.error = str(e)
+            job._status = "failed"
+        job.finished_at = time.time()
+        job.done.set()
+
+    @classmethod
+    def get(cls, job_id, wait=0):
+        """
+        Get job - kalau wait > 0, long-poll sampai job selesai atau timeout
+        Return None kalau job tidak ada / sudah expired
+        """
+        cls._purge()
+        with cls._lock:
+            job = cls._jobs.get(job_id)
+        if job is not None and wait > 0:
+            job.done.wait(min(wait, Config.LAYOUT_JOB_MAX_WAIT))
+        return job
+
+    @classmethod
+    def shutdown(cls):
+        with cls._lock:
+            if cls._executor is not None:
+                cls._executor.shutdown(wait=False, cancel_futures=True)
+                cls._executor = None
@@ -0,0 +1,194 @@
+"""
+Layout Optimizer
+Anytime simulated annealing di atas hasil greedy pipeline
+Score (lebih kecil = lebih baik):
+    overlap antar furniture (dengan padding)
+    + obstacle clearance (overlap dengan obstacle + safety margin)
+    + zone fit (jarak ke posisi prediksi model)
+Restart paralel di LayoutPool - core lebih banyak = layout lebih bagus di budget yang sama
+"""
+import math
+import time
+import numpy as np
+from config import Config
+from app.services.PlacementContext import PlacementContext
+
+SCORE_WEIGHTS = {"overlap": 1.0, "obstacle": 2.0, "fit": 0.01}
+
+
+def _overlap_area(x, y, w, h, ox, oy, ow, oh):
+    """Luas overlap rect (x, y, w, h) dengan array rect (ox, oy, ow, oh)"""
+    dx = np.minimum(x + w, ox + ow) - np.maximum(x, ox)
+    dy = np.minimum(y + h, oy + oh) - np.maximum(y, oy)
+    return np.maximum(dx, 0) * np.maximum(dy, 0)
+
+
+class LayoutOptimizer:
+    """Score + annealing untuk satu lantai (state cuma array posisi)"""
+
+    def __init__(self, dims, targets, floor_data=None, context=None):
+        """
+        Args:
+            dims (list): (panjang, lebar) per item
+            targets (list): posisi prediksi model per item (zone fit)
+            floor_data (dict): rooms & obstacles
+            context (PlacementContext): context yang sudah di-build (skip preprocessing floor_data)
+        """
+        ctx = context or PlacementContext.from_floor(floor_data)
+        dims = np.asarray(dims, dtype=float).reshape(-1, 2)
+        self.w, self.h = dims[:, 0], dims[:, 1]
+        self.tx, self.ty = np.asarray(targets, dtype=float).reshape(-1, 2).T
+        self.n = len(dims)
+
+        # Obstacle diperbesar dengan safety margin
+        obstacles = np.asarray(ctx.obstacles.rects, dtype=float).reshape(-1, 4)
+        self.obs = (obstacles[:, 0] - Config.OBSTACLE_MARGIN, obstacles[:, 1] - Config.OBSTACLE_MARGIN,
+                    obstacles[:, 2] + 2 * Config.OBSTACLE_MARGIN, obstacles[:, 3] + 2 * Config.OBSTACLE_MARGIN)
+
+        # Batas posisi per item (sama dengan clamp pipeline)
+        if ctx.best_room is not None:
+            room = ctx.best_room
+            rx, ry, rw, rh = room["x"], room["y"], room["width"], room["height"]
+            self.x_lo = np.full(self.n, rx + Config.ROOM_PADDING, dtype=float)
+            self.y_lo = np.full(self.n, ry + Config.ROOM_PADDING, dtype=float)
+            self.x_hi = np.maximum(self.x_lo, rx + rw - self.w - Config.ROOM_PADDING)
+            self.y_hi = np.maximum(self.y_lo, ry + rh - self.h - Config.ROOM_PADDING)
+        else:
+            self.x_lo = np.full(self.n, 50.0)
+            self.y_lo = np.full(self.n, 50.0)
+            self.x_hi = np.maximum(self.x_lo, 750 - self.w)
+            self.y_hi = np.maximum(self.y_lo, 750 - self.h)
+
+        # Rect furniture diperbesar padding/2 tiap sisi -> overlap = jarak < padding
+        self.pad = Config.COLLISION_PADDING / 2
+
+        # Layout annealing: furniture + obstacle dalam 1 array (1 pass per move)
+        # Furniture: overlap + padding, weight overlap; obstacle: tanpa padding, weight obstacle
+        m = len(self.obs[0])
+        self._w_all = np.concatenate([self.w, self.obs[2]])
+        self._h_all = np.concatenate([self.h, self.obs[3]])
+        self._extra = np.concatenate([np.full(self.n, 2 * self.pad), np.zeros(m)])
+        self._weight = np.concatenate([np.full(self.n, SCORE_WEIGHTS["overlap"]),
+                                       np.full(m, SCORE_WEIGHTS["obstacle"])])
+
+    # ========== SCORE ==========
+
+    def _item_cost(self, i, x, y, state):
+        """
+        Cost yang melibatkan item i, untuk beberapa kandidat posisi sekaligus
+        x, y: array kandidat (k, 1) - return array (k,)
+        state: (X, Y, X + W, Y + H) furniture + obstacle
+        """
+        X, Y, R, B = state
+        dx = np.minimum(x + self.w[i], R) - np.maximum(x, X) + self._extra
+        dy = np.minimum(y + self.h[i], B) - np.maximum(y, Y) + self._extra
+        overlap = np.maximum(dx, 0) * np.maximum(dy, 0)
+        overlap[:, i] = 0
+        return overlap @ self._weight
+
+    def _fit(self, i, x, y):
+        return SCORE_WEIGHTS["fit"] * ((x - self.tx[i]) ** 2 + (y - self.ty[i]) ** 2)
+
+    def score(self, xs, ys):
+        """Total score layout + breakdown per komponen"""
+        xs, ys = np.asarray(xs, dtype=float), np.asarray(ys, dtype=float)
+        p = self.pad
+        ex, ey, ew, eh = xs - p, ys - p, self.w + 2 * p, self.h + 2 * p
+        pairs = _overlap_area(ex[:, None], ey[:, None], ew[:, None], eh[:, None], ex, ey, ew, eh)
+        overlap = (pairs.sum() - np.trace(pairs)) / 2
+
+        obstacle = 0.0
+        if len(self.obs[0]):
+            obstacle = _overlap_area(xs[:, None], ys[:, None], self.w[:, None], self.h[:, None], *self.obs).sum()
+        fit = ((xs - self.tx) ** 2 + (ys - self.ty) ** 2).sum()
+
+        total = (SCORE_WEIGHTS["overlap"] * overlap + SCORE_WEIGHTS["obstacle"] * obstacle +
+                 SCORE_WEIGHTS["fit"] * fit)
+        return float(total), {"overlap": float(overlap), "obstacle": float(obstacle), "fit": float(fit)}
+
+    # ========== ANNEALING ==========
+
+    def anneal(self, xs, ys, budget_ms, seed=0):
+        """
+        Simulated annealing sampai budget habis, mulai dari (xs, ys)
+        Returns: (best_xs, best_ys, best_score, iterations)
+        """
+        rng = np.random.default_rng(seed)
+        xs = np.clip(np.asarray(xs, dtype=float), self.x_lo, self.x_hi)
+        ys = np.clip(np.asarray(ys, dtype=float), self.y_lo, self.y_hi)
+        current, _ = self.score(xs, ys)
+        best, best_xs, best_ys = current, xs.copy(), ys.copy()
+        if self.n == 0:
+            return best_xs, best_ys, best, 0
+
+        # State gabungan furniture + obstacle, diupdate per accepted move
+        X = np.concatenate([xs, self.obs[0]])
+        Y = np.concatenate([ys, self.obs[1]])
+        state = (X, Y, X + self._w_all, Y + self._h_all)
+        R, B = state[2], state[3]
+        candidate_x, candidate_y = np.empty((2, 1)), np.empty((2, 1))
+
+        deadline = time.perf_counter() + budget_ms / 1000
+        started = time.perf_counter()
+        t0 = max(float(np.mean(self.w * self.h)) * 0.5, 1.0)
+        t_end = t0 * 1e-3
+        iterations = 0
+        block = 64
+        while True:
+            # Cek waktu & cooling per blok iterasi, random number juga di-draw per blok
+            now = time.perf_counter()
+            if now >= deadline:
+                break
+            progress = (now - started) / max(deadline - started, 1e-9)
+            temperature = t0 * (t_end / t0) ** progress
+            step = max(5.0, 120.0 * math.sqrt(temperature / t0))
+
+            items = rng.integers(self.n, size=block).tolist()
+            jump = (rng.random(block) < 0.1).tolist()
+            uniform = rng.random((block, 2)).tolist()
+            noise = rng.normal(0, step, size=(block, 2)).tolist()
+            accept = rng.random(block).tolist()
+
+            for k in range(block):
+                i = items[k]
+                x, y = X[i], Y[i]
+                if jump[k]:
+                    # Jump: posisi random di room
+                    nx = self.x_lo[i] + uniform[k][0] * (self.x_hi[i] - self.x_lo[i])
+                    ny = self.y_lo[i] + uniform[k][1] * (self.y_hi[i] - self.y_lo[i])
+                else:
+                    nx = min(max(x + noise[k][0], self.x_lo[i]), self.x_hi[i])
+                    ny = min(max(y + noise[k][1], self.y_lo[i]), self.y_hi[i])
+
+                candidate_x[0, 0], candidate_x[1, 0] = nx, x
+                candidate_y[0, 0], candidate_y[1, 0] = ny, y
+                new_cost, old_cost = self._item_cost(i, candidate_x, candidate_y, state)
+                delta = new_cost - old_cost + self._fit(i, nx, ny) - self._fit(i, x, y)
+                if delta <= 0 or accept[k] < math.exp(-delta / temperature):
+                    X[i], Y[i] = nx, ny
+                    R[i], B[i] = nx + self.w[i], ny + self.h[i]
+                    current += delta
+                    if current < best - 1e-9:
+                        best = current
+                        best_xs, best_ys = X[:self.n].copy(), Y[:self.n].copy()
+            iterations += block
+
+        # Re-score exact (hindari drift floating point dari delta)
+        best, _ = self.score(best_xs, best_ys)
+        return best_xs, best_ys, best, iterations
+
+
+# ========== WORKER (LayoutPool) ==========
+
+def optimize_restart(dims, targets, start, floor_data, budget_ms, seed):
+    """Satu restart annealing - module-level supaya bisa jalan di process pool"""
+    optimizer = LayoutOptimizer(dims, targets, floor_data)
+    xs, ys = np.asarray(start, dtype=float).reshape(-1, 2).T
+    best_xs, best_ys, best, iterations = optimizer.anneal(xs, ys, budget_ms, seed)
+    return best, np.column_stack([best_xs, best_ys]).tolist(), iterations
+
+
+def restart_count():
+    """Jumlah restart paralel (1 per worker)"""
+    from app.services.LayoutPool import LayoutPool
+    return max(1, Config.LAYOUT_OPTIMIZER_RESTARTS or LayoutPool.worker_count())
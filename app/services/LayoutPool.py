@@ -0,0 +1,159 @@
+"""
+Layout Pool
+Process pool untuk layout per lantai - tiap lantai independen, jadi
+satu rumah selesai kira-kira secepat lantai yang paling lama
+"""
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from config import Config
+
+
+# ========== WORKER (jalan di child process) ==========
+
+def _init_worker():
+    """Load model sekali per worker process"""
+    from app.services.ModelRegistry import ModelRegistry
+    ModelRegistry.preload()
+
+
+def _place_floor(items, room_type, floor_data):
+    """Layout satu lantai di worker - return (results, model_used, elapsed_ms)"""
+    from app.services.LayoutService import LayoutService
+    from app.services.ModelRegistry import ModelRegistry
+
+    started = time.perf_counter()
+    # Watcher thread cuma jalan di process app (init_services), worker cek mtime sendiri
+    ModelRegistry.reload_if_changed()
+    service = LayoutService.shared()
+    results = service.predict_batch(items, room_type, floor_data)
+    return results, service.model is not None, (time.perf_counter() - started) * 1000
+
+
+def _place_variants(items, dims, predictions, cleared, context, seeds):
+    """Beberapa layout alternatif di worker - preprocessing & prediksi dari parent"""
+    from app.services.LayoutService import LayoutService
+
+    service = LayoutService.shared()
+    return [service.place_variant(items, dims, predictions, cleared, context, seed) for seed in seeds]
+
+
+def _ping(_):
+    return os.getpid()
+
+
+# ========== POOL (parent process) ==========
+
+class LayoutPool:
+    """Lazy process pool yang di-share semua request"""
+
+    _executor = None
+    _lock = threading.Lock()
+
+    @classmethod
+    def worker_count(cls):
+        return Config.LAYOUT_POOL_WORKERS or min(4, os.cpu_count() or 1)
+
+    @classmethod
+    def executor(cls):
+        """Get (atau buat) executor"""
+        if cls._executor is None:
+            with cls._lock:
+                if cls._executor is None:
+                    context = multiprocessing.get_context(Config.LAYOUT_POOL_START_METHOD)
+                    cls._executor = ProcessPoolExecutor(
+                        max_workers=cls.worker_count(),
+                        mp_context=context,
+                        initializer=_init_worker
+                    )
+        return cls._executor
+
+    @classmethod
+    def start(cls):
+        """Spawn semua worker (+ load model) sebelum traffic masuk"""
+        # Worker spawn ikut import main module (app.py) - jangan bikin pool lagi di sana
+        if multiprocessing.current_process().name != "MainProcess" or cls.worker_count() <= 1:
+            return None
+        try:
+            executor = cls.executor()
+            list(executor.map(_ping, range(cls.worker_count())))
+            print(f"✅ Layout pool ready ({cls.worker_count()} workers)")
+            return executor
+        except BrokenProcessPool as e:
+            print(f"⚠️ Layout pool start failed: {e}")
+            cls.shutdown()
+            return None
+
+    @classmethod
+    def shutdown(cls):
+        with cls._lock:
+            if cls._executor is not None:
+                cls._executor.shutdown(wait=False, cancel_futures=True)
+                cls._executor = None
+
+    @classmethod
+    def run_all(cls, fn, jobs, timeout=None, partial=False):
+        """
+        Jalankan fn(*args) untuk tiap args di jobs secara paralel
+
+        fn harus module-level (di-pickle ke worker). Satu job / satu worker /
+        pool rusak -> jalan serial di process ini.
+        Timeout (total, bukan per job): job yang belum mulai di-cancel, lalu
+        partial=True -> None untuk job itu, partial=False -> job itu jalan serial.
+        Returns: hasil per job, urutan sama dengan input
+        """
+        if len(jobs) <= 1 or cls.worker_count() <= 1:
+            return [fn(*args) for args in jobs]
+
+        try:
+            futures = [cls.executor().submit(fn, *args) for args in jobs]
+            done, not_done = wait(futures, timeout=timeout or Config.API_TIMEOUT)
+            if not_done:
+                # Job yang sedang jalan tidak bisa di-kill, yang masih antri tidak jadi jalan
+                for future in not_done:
+                    future.cancel()
+                print(f"⚠️ Layout pool timeout ({len(not_done)}/{len(jobs)} jobs unfinished)")
+
+            results = []
+            for future, args in zip(futures, jobs):
+                if future in done:
+                    results.append(future.result())
+                else:
+                    results.append(None if partial else fn(*args))
+            return results
+        except BrokenProcessPool:
+            # Worker mati (OOM, dll) - buat pool baru next time, job ini serial
+            print("⚠️ Layout pool broken, falling back to serial")
+            cls.shutdown()
+            return [fn(*args) for args in jobs]
+
+    @classmethod
+    def place_floors(cls, floors):
+        """
+        Layout semua lantai paralel
+
+        Args:
+            floors (list): [(items, room_type, floor_data), ...]
+        Returns:
+            list: (results, model_used, elapsed_ms) per lantai, urutan sama dengan input
+        """
+        return cls.run_all(_place_floor, floors)
+
+    @classmethod
+    def place_variants(cls, items, dims, predictions, cleared, context, seeds):
+        """
+        Layout alternatif paralel - seeds dibagi rata ke worker (1 job per worker)
+        Returns: results per seed, urutan sama dengan seeds
+        """
+        chunks = [seeds[i::cls.worker_count()] for i in range(cls.worker_count())]
+        chunks = [chunk for chunk in chunks if chunk]
+        jobs = [(items, dims, predictions, cleared, context, chunk) for chunk in chunks]
+        placed = cls.run_all(_place_variants, jobs)
+
+        by_seed = {}
+        for chunk, results in zip(chunks, placed):
+            by_seed.update(zip(chunk, results))
+        return [by_seed[seed] for seed in seeds]
@@ -2,114 +2,607 @@
 Layout Service - Simple & Clean
 Model .pkl sudah trained, backend cuma load & predict
 """
-import joblib
-import pandas as pd
+import threading
+import time
+
 import numpy as np
 from config import Config
+from app.services.LayoutCache import LayoutCache, request_fingerprint
+from app.services.LayoutOptimizer import LayoutOptimizer, optimize_restart, restart_count
+from app.services.LayoutPool import LayoutPool
+from app.services.MaxRectsPacker import MaxRectsPacker
+from app.services.ModelRegistry import ModelRegistry
+from app.services.PlacementContext import PlacementContext
+
+
+# Spiral search offsets (attempt 0..49) - dihitung sekali, bukan per step
+SPIRAL_ATTEMPTS = 50
+SPIRAL_STEPS = np.array([
+    [(attempt + 1) * 35 * np.cos(np.radians(attempt * 40)),
+     (attempt + 1) * 35 * np.sin(np.radians(attempt * 40))]
+    for attempt in range(SPIRAL_ATTEMPTS)
+])
+# Step awal dicek satu per satu (kebanyakan item langsung bebas),
+# sisanya dicek per blok secara vectorized
+SPIRAL_SCALAR_STEPS = 4
+SPIRAL_CHUNKS = ((SPIRAL_SCALAR_STEPS, 16), (16, SPIRAL_ATTEMPTS))
+
+# Orientasi yang dicoba (derajat, diputar di titik tengah item)
+ROTATIONS = (0, 90)
+
+# Auto place: zone dalam meter (ruangan 17 x 11)
+AUTO_PLACE_ROOM = (17.0, 11.0)  # Ukuran room (meter) acuan AUTO_PLACE_ZONES
+AUTO_PLACE_ZONES = {
+    "living": {"x_min": 1.0, "x_max": 7.5, "y_min": 1.0, "y_max": 5.5},
+    "dining": {"x_min": 9.0, "x_max": 15.5, "y_min": 1.0, "y_max": 5.5},
+    "outdoor": {"x_min": 1.5, "x_max": 15.5, "y_min": 7.0, "y_max": 9.5},
+    "decoration": {"x_min": 1.0, "x_max": 16.0, "y_min": 1.0, "y_max": 10.0}
+}
+AUTO_PLACE_MARGIN = 0.5  # Jarak ke batas zone
+AUTO_PLACE_SPACING = 0.8  # Jarak antar furniture
+ZONE_PRIORITY = {"living": 1, "dining": 2, "outdoor": 3, "decoration": 4}
+ZONE_KEYWORDS = {
+    "dining": ("makan", "dining"),
+    "outdoor": ("pantai", "outdoor", "taman"),
+    "decoration": ("bunga", "pot", "tanaman", "dekor")
+}
+
+# Catalog default kalau tabel furniture kosong / DB tidak tersedia
+DEFAULT_AUTO_PLACE_CATALOG = [
+    {"nama": "SOFA 3 Seat", "panjang": 2.6, "lebar": 1.0, "zone": "living", "quantity": 2, "priority": 1},
+    {"nama": "Meja Makan", "panjang": 2.4, "lebar": 1.0, "zone": "dining", "quantity": 1, "priority": 2},
+    {"nama": "Kursi Makan", "panjang": 0.46, "lebar": 0.75, "zone": "dining", "quantity": 4, "priority": 3},
+    {"nama": "Pot Bunga", "panjang": 0.36, "lebar": 0.36, "zone": "decoration", "quantity": 3, "priority": 4},
+]
 
 
 class LayoutService:
-    """Service untuk furniture layout prediction menggunakan pre-trained model"""
+    """
+    Service untuk furniture layout prediction menggunakan pre-trained model
     
-    def __init__(self):
-        """Load pre-trained model dari .pkl files"""
-        try:
-            # Load model components (pre-trained)
-            self.model = joblib.load(Config.MODEL_PATH)
-            self.feature_cols = joblib.load(Config.FEATURE_COLS_PATH)
-            self.metadata = joblib.load(Config.METADATA_PATH)
-            self.placed = []  # Track placed furniture
-            print("✅ Model loaded successfully")
-        except Exception as e:
-            print(f"⚠️ Error loading model: {e}")
-            self.model = None
-            self.feature_cols = None
-            self.metadata = {}
-            self.placed = []
+    Instance immutable setelah __init__ (cuma pegang model bundle), semua
+    state per batch ada di PlacementContext - jadi satu instance aman
+    dipakai banyak thread sekaligus (lihat shared()).
+    """
+    
+    _shared = None
+    _shared_lock = threading.Lock()
+    cache = LayoutCache()
+    
+    def __init__(self, bundle=None):
+        """Pakai model dari ModelRegistry (sudah di-load sekali saat app start)"""
+        if bundle is None:
+            bundle = ModelRegistry.get()
+        self.bundle = bundle
+        self.model = bundle.model
+        self.feature_cols = bundle.feature_cols
+        self.metadata = bundle.metadata
+        self.model_version = bundle.version
+        self.compiled = bundle.compiled  # Tree ensemble dalam NumPy arrays
+        self.surrogate = bundle.surrogate  # Lookup table (mode surrogate)
+    
+    @classmethod
+    def shared(cls):
+        """
+        Satu service per model version untuk semua request
+        Kalau registry swap ke bundle baru (hot reload), service ikut diganti
+        """
+        bundle = ModelRegistry.get()
+        service = cls._shared
+        if service is None or service.bundle is not bundle:
+            with cls._shared_lock:
+                service = cls._shared
+                if service is None or service.bundle is not bundle:
+                    service = cls(bundle)
+                    cls._shared = service
+        return service
+    
+    def predict_cached(self, items, room_type="living_room", floor_data=None, timer=None):
+        """
+        predict_batch dengan result cache di depannya
+        Returns: (results, cache_hit)
+        """
+        if not Config.LAYOUT_CACHE_ENABLED:
+            return self.predict_batch(items, room_type, floor_data, timer=timer), False
+        
+        key = request_fingerprint(items, room_type, floor_data, self.model_version)
+        results = self.cache.get(key)
+        if results is not None:
+            return results, True
+        
+        results = self.predict_batch(items, room_type, floor_data, timer=timer)
+        self.cache.set(key, results)
+        return results, False
+    
+    def predict_building(self, floors):
+        """
+        Layout semua lantai sekaligus - cache dulu, sisanya paralel di LayoutPool
+        
+        Args:
+            floors (list): [(items, room_type, floor_data), ...]
+        Returns:
+            list: (results, cache_hit) per lantai, urutan sama dengan input
+        """
+        output = [None] * len(floors)
+        pending, keys = [], []
+        for idx, (items, room_type, floor_data) in enumerate(floors):
+            key = None
+            if Config.LAYOUT_CACHE_ENABLED:
+                key = request_fingerprint(items, room_type, floor_data, self.model_version)
+                results = self.cache.get(key)
+                if results is not None:
+                    output[idx] = (results, True)
+                    continue
+            pending.append(idx)
+            keys.append(key)
+        
+        placed = LayoutPool.place_floors([floors[idx] for idx in pending])
+        for idx, key, (results, _, _) in zip(pending, keys, placed):
+            if key is not None:
+                self.cache.set(key, results)
+            output[idx] = (results, False)
+        return output
     
-    def predict_batch(self, items, room_type="living_room", floor_data=None):
+    def stream_cached(self, items, room_type="living_room", floor_data=None, timer=None):
+        """
+        Versi streaming dari predict_cached - yield (result, cache_hit) per item
+        Hasil lengkap baru masuk cache setelah item terakhir selesai
+        """
+        key = None
+        if Config.LAYOUT_CACHE_ENABLED:
+            key = request_fingerprint(items, room_type, floor_data, self.model_version)
+            results = self.cache.get(key)
+            if results is not None:
+                for result in results:
+                    yield result, True
+                return
+        
+        results = []
+        for result in self.iter_placements(items, room_type, floor_data, timer=timer):
+            results.append(result)
+            yield result, False
+        if key is not None:
+            self.cache.set(key, results)
+    
+    def predict_batch(self, items, room_type="living_room", floor_data=None, context=None, timer=None):
         """
         Main prediction function - simple & clean
         Model .pkl sudah contain logic, kita cuma extract features & predict
+        
+        Args:
+            context (PlacementContext): state placement, default context baru dari floor_data
+            timer (StageTimer): timing per stage (Server-Timing), dipakai kalau context baru
         """
-        self.placed = []  # Reset
+        return list(self.iter_placements(items, room_type, floor_data, context, timer=timer))
+    
+    def iter_placements(self, items, room_type="living_room", floor_data=None, context=None, offset=0,
+                        timer=None, predictions=None):
+        """
+        Generator - yield hasil tiap item begitu lolos final obstacle check
+        (dipakai predict_batch & streaming response)
         
-        # Get room boundaries
-        rooms = self._get_rooms(floor_data)
-        obstacles = self._get_obstacles(floor_data)
+        Args:
+            offset (int): jumlah item yang sudah ada di context (lanjutan slot grid fallback)
+            predictions (list): hasil _predict_all yang sudah ada (skip inference)
+        """
+        ctx = context or PlacementContext.from_floor(floor_data, timer)
+        rooms = ctx.rooms
+        timer = ctx.timer
+        
+        # Extract dimensions semua item
+        dims = [(float(item.get("panjang", 100)), float(item.get("lebar", 100))) for item in items]
+        
+        # STEP 1: Model prediction - 1x inference untuk seluruh cart
+        if predictions is None:
+            started = time.perf_counter()
+            predictions = self._predict_all(dims, rooms, offset)
+            timer.lap("predict", started)
         
-        results = []
         for idx, item in enumerate(items):
-            # Extract item data
-            furn_id = item.get("id", idx)
-            name = item.get("name", "Furniture")
-            panjang = float(item.get("panjang", 100))
-            lebar = float(item.get("lebar", 100))
-            
-            # STEP 1: Model prediction (model .pkl do the work!)
-            x, y = self._predict(panjang, lebar, idx, rooms)
-            
-            # STEP 2: Ensure within bounds
-            x, y = self._clamp_to_room(x, y, panjang, lebar, rooms)
+            # Orientasi dulu (0 / 90), pipeline jalan dengan footprint yang dipilih
+            started = time.perf_counter()
+            rotation = self._choose_orientation(*predictions[idx], *dims[idx], ctx)
+            x, y, w, h = self._oriented(*predictions[idx], *dims[idx], rotation)
+            timer.lap("orientation", started)
+            x, y, panjang, lebar = self._resolve_position(x, y, w, h, ctx, rotate=Config.LAYOUT_ROTATION)
+            if (panjang, lebar) != (w, h):
+                rotation = 90 - rotation  # Diputar lagi di spiral search
             
-            # STEP 3: Avoid obstacles (check BEFORE and AFTER)
-            x, y = self._avoid_obstacles(x, y, panjang, lebar, obstacles)
-            x, y = self._clamp_to_room(x, y, panjang, lebar, rooms)
-            # Double-check obstacle clearance
-            x, y = self._avoid_obstacles(x, y, panjang, lebar, obstacles)
-            x, y = self._clamp_to_room(x, y, panjang, lebar, rooms)
-            
-            # STEP 4: Avoid collision with other furniture
-            x, y = self._avoid_collision(x, y, panjang, lebar)
-            x, y = self._clamp_to_room(x, y, panjang, lebar, rooms)
-            
-            # FINAL: Re-check obstacles one more time (CRITICAL!)
-            x, y = self._final_obstacle_check(x, y, panjang, lebar, obstacles, rooms)
-            
-            # Build result
-            results.append({
-                "id": furn_id,
-                "nama": name,
-                "category": item.get("category", ""),
-                "posisi_x": int(x),
-                "posisi_y": int(y),
-                "panjang": int(panjang),
-                "lebar": int(lebar),
-                "zone": self._get_zone(x, y, panjang, lebar),
-                "rotation": 0
-            })
+            # Track placed (incremental insert ke spatial index & raster)
+            ctx.place(x, y, panjang, lebar)
             
-            # Track placed
-            self.placed.append({"x": x, "y": y, "w": panjang, "h": lebar})
+            yield self._build_result(item, offset + idx, x, y, panjang, lebar, rotation)
+    
+    def optimize_batch(self, items, room_type="living_room", floor_data=None, time_budget_ms=200):
+        """
+        Anytime mode: greedy pipeline sebagai seed, lalu simulated annealing
+        (restart paralel) sampai time budget habis - return layout terbaik
+        
+        Returns:
+            tuple: (results, optimizer_stats)
+        """
+        started = time.perf_counter()
+        time_budget_ms = min(float(time_budget_ms), Config.LAYOUT_OPTIMIZER_MAX_BUDGET_MS)
+        ctx = PlacementContext.from_floor(floor_data)
+        dims = [(float(item.get("panjang", 100)), float(item.get("lebar", 100))) for item in items]
+        
+        # Floor preprocessing & inference 1x - dipakai greedy seed dan target zone fit
+        predictions = self._predict_all(dims, ctx.rooms)
+        greedy = list(self.iter_placements(items, room_type, context=ctx.fork(), predictions=predictions))
+        start = [(r["posisi_x"], r["posisi_y"]) for r in greedy]
+        rotations = [r["rotation"] for r in greedy]
+        
+        # Target zone fit = prediksi model (sudah di-clamp ke room), orientasi ikut greedy
+        oriented = [self._oriented(x, y, panjang, lebar, rotation) for (x, y), (panjang, lebar), rotation
+                    in zip(predictions, dims, rotations)]
+        dims = [(panjang, lebar) for _, _, panjang, lebar in oriented]
+        targets = [self._clamp_to_room(x, y, panjang, lebar, ctx) for x, y, panjang, lebar in oriented]
         
+        optimizer = LayoutOptimizer(dims, targets, context=ctx)
+        greedy_score, _ = optimizer.score(*np.asarray(start, dtype=float).reshape(-1, 2).T)
+        
+        # Sisa budget dibagi ke restart paralel (1 per worker)
+        remaining_ms = time_budget_ms - (time.perf_counter() - started) * 1000
+        restarts = restart_count()
+        runs = []
+        if remaining_ms > 5 and items:
+            jobs = [(dims, targets, start, floor_data, remaining_ms * 0.9, seed) for seed in range(restarts)]
+            # Restart yang lewat timeout dibuang - paling buruk hasil greedy
+            runs = LayoutPool.run_all(optimize_restart, jobs, timeout=remaining_ms / 1000 + 5, partial=True)
+            runs = [run for run in runs if run is not None]
+        
+        # Score annealing tidak menjamin bebas overlap / obstacle - posisi hasil restart
+        # lewat collision stage & final obstacle check dulu, baru dibandingkan dengan greedy
+        best_score, results, iterations = greedy_score, greedy, 0
+        for score, positions, run_iterations in runs:
+            iterations += run_iterations
+            if score >= best_score:
+                continue
+            candidate = self._legalize(items, positions, dims, rotations, ctx)
+            score, _ = optimizer.score([r["posisi_x"] for r in candidate], [r["posisi_y"] for r in candidate])
+            if score < best_score:
+                best_score, results = score, candidate
+        
+        _, breakdown = optimizer.score([r["posisi_x"] for r in results], [r["posisi_y"] for r in results])
+        return results, {
+            "time_budget_ms": time_budget_ms,
+            "elapsed_ms": round((time.perf_counter() - started) * 1000, 2),
+            "restarts": len(runs),
+            "iterations": iterations,
+            "greedy_score": round(greedy_score, 2),
+            "best_score": round(best_score, 2),
+            "score_breakdown": {k: round(v, 2) for k, v in breakdown.items()}
+        }
+    
+    def _legalize(self, items, positions, dims, rotations, context):
+        """Posisi hasil annealing -> pipeline bounds, obstacle, collision & final check (orientasi tetap)"""
+        ctx = context.fork()
+        results = []
+        for idx, (item, (x, y), (panjang, lebar)) in enumerate(zip(items, positions, dims)):
+            x, y, panjang, lebar = self._resolve_position(x, y, panjang, lebar, ctx)
+            ctx.place(x, y, panjang, lebar)
+            results.append(self._build_result(item, idx, x, y, panjang, lebar, rotations[idx]))
         return results
     
+    def predict_alternatives(self, items, room_type="living_room", floor_data=None, k=3, timer=None):
+        """
+        Top-k layout alternatif dalam 1 request
+        Floor preprocessing (rooms, obstacle index, raster) & model inference cuma 1x,
+        kandidat (greedy + variant urutan/jitter) di-place paralel di LayoutPool,
+        lalu diranking pakai score LayoutOptimizer (duplikat dibuang)
+        
+        Kandidat unik kurang dari k (room kecil / sempit) -> seed baru terus di-generate
+        sampai k unik atau total seed mencapai k x LAYOUT_ALTERNATIVES_MAX_ATTEMPTS
+        
+        Returns:
+            list: [{rank, score, data}, ...] maksimal k (bisa kurang), score terkecil dulu
+        """
+        k = max(1, min(int(k), Config.LAYOUT_ALTERNATIVES_MAX))
+        ctx = PlacementContext.from_floor(floor_data, timer)
+        dims = [(float(item.get("panjang", 100)), float(item.get("lebar", 100))) for item in items]
+        predictions = self._predict_all(dims, ctx.rooms)
+        
+        # Bounds + obstacle avoidance tidak tergantung furniture lain - 1x untuk semua variant
+        # (per orientasi, orientasi sendiri dipilih per variant)
+        cleared = [{rotation: self._clear_obstacles(*self._oriented(x, y, panjang, lebar, rotation), ctx)
+                    for rotation in ROTATIONS}
+                   for (x, y), (panjang, lebar) in zip(predictions, dims)]
+        
+        # Score: overlap + obstacle clearance + jarak ke prediksi model (sama dengan optimizer)
+        targets = [{rotation: self._clamp_to_room(*self._oriented(x, y, panjang, lebar, rotation), ctx)
+                    for rotation in ROTATIONS}
+                   for (x, y), (panjang, lebar) in zip(predictions, dims)]
+        ranked, seen = [], set()
+        next_seed, max_seeds = 0, k * Config.LAYOUT_ALTERNATIVES_MAX_ATTEMPTS
+        while len(ranked) < k and next_seed < max_seeds:
+            count = min((k - len(ranked)) * Config.LAYOUT_ALTERNATIVES_OVERSAMPLE, max_seeds - next_seed)
+            seeds = list(range(next_seed, next_seed + count))
+            next_seed += count
+            for results in LayoutPool.place_variants(items, dims, predictions, cleared, ctx, seeds):
+                placement = tuple((r["posisi_x"], r["posisi_y"], r["rotation"]) for r in results)
+                if placement in seen:
+                    continue
+                seen.add(placement)
+                # Footprint & target tiap variant ikut rotasi yang dipilih
+                optimizer = LayoutOptimizer([(r["panjang"], r["lebar"]) for r in results],
+                                            [target[r["rotation"]] for target, r in zip(targets, results)],
+                                            context=ctx)
+                score, _ = optimizer.score([r["posisi_x"] for r in results], [r["posisi_y"] for r in results])
+                ranked.append((score, results))
+        ranked.sort(key=lambda candidate: candidate[0])
+        
+        return [{"rank": rank, "score": round(score, 2), "data": results}
+                for rank, (score, results) in enumerate(ranked[:k], start=1)]
+    
+    def place_variant(self, items, dims, predictions, cleared, context, seed=0):
+        """
+        1 layout alternatif dari posisi yang sudah lolos obstacle stage
+        (cleared: {rotation: (x, y)} per item, dari _clear_obstacles)
+        seed 0 = greedy biasa (sama dengan predict_batch), seed lain = urutan
+        placement diacak + posisi di-jitter, jadi collision resolve ke posisi lain
+        """
+        ctx = context.fork()
+        order = list(range(len(items)))
+        jitter = None
+        if seed:
+            rng = np.random.default_rng(seed)
+            order = rng.permutation(len(items)).tolist()
+            jitter = rng.normal(0, Config.LAYOUT_ALTERNATIVE_JITTER, size=(len(items), 2)).tolist()
+        
+        results = [None] * len(items)
+        for idx in order:
+            px, py = predictions[idx]
+            if jitter is not None:
+                px, py = px + jitter[idx][0], py + jitter[idx][1]
+            rotation = self._choose_orientation(px, py, *dims[idx], ctx)
+            _, _, w, h = self._oriented(px, py, *dims[idx], rotation)
+            x, y = cleared[idx][rotation]
+            if jitter is not None:
+                # Posisi geser -> cek bounds & obstacle lagi
+                x, y = self._clamp_to_room(x + jitter[idx][0], y + jitter[idx][1], w, h, ctx)
+                x, y = self._avoid_obstacles(x, y, w, h, ctx)
+                x, y = self._clamp_to_room(x, y, w, h, ctx)
+            x, y, panjang, lebar = self._place_clear(x, y, w, h, ctx, rotate=Config.LAYOUT_ROTATION)
+            if (panjang, lebar) != (w, h):
+                rotation = 90 - rotation
+            ctx.place(x, y, panjang, lebar)
+            results[idx] = self._build_result(items[idx], idx, x, y, panjang, lebar, rotation)
+        return results
+    
+    def update_layout(self, placed, add=None, remove=None, move=None, room_type="living_room", floor_data=None,
+                      timer=None):
+        """
+        Delta update layout yang sudah ada - cuma item baru / dipindah yang di-place
+        
+        Args:
+            placed (list): placement yang sudah ada (format hasil predict_batch, atau x/y dari canvas)
+            add (list): item baru (format item predict_batch)
+            remove (list): id item yang dihapus
+            move (list): [{id, x, y}] posisi target baru (tetap dicek obstacle & collision)
+        Returns:
+            dict: {"data": semua placement, "changed": placement baru/dipindah, "removed": id yang dihapus}
+        """
+        add, remove, move = add or [], remove or [], move or []
+        removed = {str(item_id) for item_id in remove}
+        targets = {str(m.get("id")): m for m in move}
+        
+        # Item yang tidak berubah cukup di-insert ke index (tanpa pipeline)
+        ctx = PlacementContext.from_floor(floor_data, timer)
+        kept, moving = [], []
+        for existing in placed:
+            key = str(existing.get("id", existing.get("uid")))
+            if key in removed:
+                continue
+            if key in targets:
+                moving.append(existing)
+                continue
+            ctx.place(*self._placement_rect(existing))
+            kept.append(existing)
+        
+        changed = []
+        for existing in moving:
+            _, _, panjang, lebar = self._placement_rect(existing)
+            target = targets[str(existing.get("id", existing.get("uid")))]
+            # Orientasi item yang dipindah user tidak diubah
+            x, y, _, _ = self._resolve_position(float(target.get("x", 0)), float(target.get("y", 0)),
+                                                panjang, lebar, ctx)
+            ctx.place(x, y, panjang, lebar)
+            
+            result = dict(existing)
+            result.update({"posisi_x": int(x), "posisi_y": int(y), "zone": self._get_zone(x, y, panjang, lebar)})
+            if "x" in existing:
+                result.update({"x": int(x), "y": int(y)})
+            changed.append(result)
+        
+        # Item baru lewat pipeline biasa dengan context yang sudah terisi
+        offset = len(kept) + len(changed)
+        changed.extend(self.iter_placements(add, room_type, floor_data, ctx, offset=offset))
+        
+        return {
+            "data": kept + changed,
+            "changed": changed,
+            "removed": [existing.get("id", existing.get("uid")) for existing in placed
+                        if str(existing.get("id", existing.get("uid"))) in removed]
+        }
+    
+    @staticmethod
+    def _placement_rect(placement):
+        """(x, y, panjang, lebar) dari placement (posisi_x/posisi_y atau x/y)"""
+        x = placement.get("posisi_x", placement.get("x", 0))
+        y = placement.get("posisi_y", placement.get("y", 0))
+        return float(x), float(y), float(placement.get("panjang", 100)), float(placement.get("lebar", 100))
+    
+    def _resolve_position(self, x, y, panjang, lebar, ctx, rotate=False):
+        """
+        Pipeline posisi final untuk 1 item (bounds, obstacles, collision)
+        Returns: (x, y, panjang, lebar) - footprint bisa tertukar kalau rotate=True
+        """
+        x, y = self._clear_obstacles(x, y, panjang, lebar, ctx)
+        return self._place_clear(x, y, panjang, lebar, ctx, rotate)
+    
+    def _clear_obstacles(self, x, y, panjang, lebar, ctx):
+        """Bounds + obstacle stage - cuma tergantung room & obstacle (bukan furniture lain)"""
+        timer = ctx.timer
+        started = time.perf_counter()
+        
+        # STEP 2: Ensure within bounds
+        x, y = self._clamp_to_room(x, y, panjang, lebar, ctx)
+        started = timer.lap("clamp_to_room", started)
+        
+        # STEP 3: Avoid obstacles (check BEFORE and AFTER)
+        x, y = self._avoid_obstacles(x, y, panjang, lebar, ctx)
+        started = timer.lap("avoid_obstacles", started)
+        x, y = self._clamp_to_room(x, y, panjang, lebar, ctx)
+        started = timer.lap("clamp_to_room", started)
+        # Double-check obstacle clearance
+        x, y = self._avoid_obstacles(x, y, panjang, lebar, ctx)
+        started = timer.lap("avoid_obstacles", started)
+        x, y = self._clamp_to_room(x, y, panjang, lebar, ctx)
+        timer.lap("clamp_to_room", started)
+        return x, y
+    
+    def _place_clear(self, x, y, panjang, lebar, ctx, rotate=False):
+        """
+        Collision stage + final obstacle check (tergantung furniture yang sudah ditaruh)
+        Returns: (x, y, panjang, lebar)
+        """
+        timer = ctx.timer
+        started = time.perf_counter()
+        
+        # STEP 4: Avoid collision with other furniture
+        x, y, panjang, lebar = self._avoid_collision(x, y, panjang, lebar, ctx, rotate)
+        started = timer.lap("avoid_collision", started)
+        x, y = self._clamp_to_room(x, y, panjang, lebar, ctx)
+        started = timer.lap("clamp_to_room", started)
+        
+        # FINAL: Re-check obstacles one more time (CRITICAL!)
+        x, y = self._final_obstacle_check(x, y, panjang, lebar, ctx)
+        timer.lap("final_obstacle_check", started)
+        return x, y, panjang, lebar
+    
+    @staticmethod
+    def _oriented(x, y, panjang, lebar, rotation):
+        """(x, y, w, h) footprint item setelah diputar di titik tengahnya"""
+        if rotation == 90:
+            return x + (panjang - lebar) / 2, y + (lebar - panjang) / 2, lebar, panjang
+        return x, y, panjang, lebar
+    
+    def _choose_orientation(self, x, y, panjang, lebar, ctx):
+        """
+        Pilih rotasi awal 0 / 90 di posisi prediksi (sudah di-clamp)
+        Orientasi asli menang kalau bebas; kalau kena obstacle / furniture dan
+        versi 90 bebas, putar. Dua-duanya kena -> pakai yang muat di room,
+        sisanya diurus pipeline (spiral search juga cek 2 orientasi)
+        """
+        if not Config.LAYOUT_ROTATION or panjang == lebar:
+            return 0
+        
+        # 2 kandidat doang - scalar check lebih murah dari overlap_mask
+        fits = []
+        for rotation in ROTATIONS:
+            fx, fy, w, h = self._oriented(x, y, panjang, lebar, rotation)
+            fits.append(self._fits_room(w, h, ctx))
+            if fits[-1] and self._is_clear(*self._clamp_to_room(fx, fy, w, h, ctx), w, h, ctx):
+                return rotation
+        return ROTATIONS[fits.index(True)] if True in fits else 0
+    
+    @staticmethod
+    def _is_clear(x, y, w, h, ctx):
+        """Bebas obstacle (safety margin) & furniture lain (collision padding)"""
+        return ctx.first_obstacle(x, y, w, h, Config.OBSTACLE_MARGIN) is None and \
+            (ctx.is_free("placed", x, y, w, h, Config.COLLISION_PADDING) or
+             ctx.placed.first_overlap(x, y, w, h, Config.COLLISION_PADDING) is None)
+    
+    @staticmethod
+    def _fits_room(w, h, ctx):
+        """Footprint muat di room (dengan padding clamp)"""
+        if not ctx.rooms:
+            return w <= 700 and h <= 700  # Area clamp default 50..750
+        room = ctx.best_room
+        return w + 2 * Config.ROOM_PADDING <= room["width"] and h + 2 * Config.ROOM_PADDING <= room["height"]
+    
+    def _build_result(self, item, idx, x, y, panjang, lebar, rotation=0):
+        """
+        Result dict untuk 1 item
+        panjang / lebar = footprint di canvas (sudah diputar kalau rotation 90)
+        """
+        return {
+            "id": item.get("id", idx),
+            "nama": item.get("name", "Furniture"),
+            "category": item.get("category", ""),
+            "posisi_x": int(x),
+            "posisi_y": int(y),
+            "panjang": int(panjang),
+            "lebar": int(lebar),
+            "zone": self._get_zone(x, y, panjang, lebar),
+            "rotation": rotation
+        }
+    
+    @staticmethod
+    def _on_model_reload(bundle):
+        """Model baru = hasil cache lama tidak valid lagi"""
+        LayoutService.cache.clear()
+    
     # ========== CORE FUNCTIONS (SIMPLE!) ==========
     
-    def _predict(self, panjang, lebar, index, rooms):
-        """Use ML model to predict position"""
-        if self.model and self.feature_cols:
-            try:
-                # Extract features (9 dimensions)
-                features = pd.DataFrame([[
-                    panjang, lebar,
-                    panjang * lebar,                      # area
-                    panjang / lebar if lebar > 0 else 1,  # aspect_ratio
-                    2 * (panjang + lebar),                # perimeter
-                    np.sqrt(panjang**2 + lebar**2),       # diagonal
-                    np.log1p(panjang * lebar),            # log_area
-                    np.log1p(panjang),                    # log_panjang
-                    np.log1p(lebar)                       # log_lebar
-                ]], columns=self.feature_cols)
-                
-                # Predict using model .pkl
-                pred = self.model.predict(features)[0]
-                return float(pred[0]), float(pred[1])
-            except:
-                pass
+    @staticmethod
+    def _build_features(dims):
+        """Feature matrix (n_items x 9) dari panjang & lebar"""
+        dims = np.asarray(dims, dtype=float).reshape(-1, 2)
+        panjang, lebar = dims[:, 0], dims[:, 1]
+        area = panjang * lebar
+        aspect = np.divide(panjang, lebar, out=np.ones_like(panjang), where=lebar > 0)
+        
+        return np.column_stack([
+            panjang, lebar,
+            area,                             # area
+            aspect,                           # aspect_ratio
+            2 * (panjang + lebar),            # perimeter
+            np.sqrt(panjang**2 + lebar**2),   # diagonal
+            np.log1p(area),                   # log_area
+            np.log1p(panjang),                # log_panjang
+            np.log1p(lebar)                   # log_lebar
+        ])
+    
+    def _model_array(self, dims):
+        """Run model .pkl sekali untuk semua item - array (n, 2), None kalau gagal"""
+        if self.model is None or not self.feature_cols or not len(dims):
+            return None
+        try:
+            features = self._build_features(dims)
+            if features.shape[1] != len(self.feature_cols):
+                return None
+            # Compiled evaluator menang di batch kecil, batch besar ke model.predict
+            use_compiled = self.compiled is not None and len(features) <= Config.COMPILED_MAX_BATCH
+            model = self.compiled if use_compiled else self.model
+            pred = np.asarray(model.predict(features), dtype=float)
+            if pred.ndim != 2 or pred.shape[1] < 2:
+                return None
+            return pred[:, :2]
+        except Exception:
+            return None
+    
+    def _model_predict(self, dims):
+        """Prediksi semua item (surrogate table kalau aktif), None kalau model gagal"""
+        if not dims:
+            return None
+        if self.surrogate is not None:
+            pred = self.surrogate.predict(dims)
+        else:
+            pred = self._model_array(dims)
+        if pred is None:
+            return None
+        return [(float(px), float(py)) for px, py in pred]
+    
+    def _predict_all(self, dims, rooms, offset=0):
+        """Use ML model to predict positions of all items (1x model call)"""
+        predicted = self._model_predict(dims)
+        if predicted is not None:
+            return predicted
         
         # Fallback: grid layout
-        return self._grid_position(panjang, lebar, index, rooms)
+        return [self._grid_position(panjang, lebar, offset + idx, rooms)
+                for idx, (panjang, lebar) in enumerate(dims)]
     
     def _grid_position(self, panjang, lebar, index, rooms):
         """Simple grid fallback if model fails"""
@@ -133,116 +626,148 @@ class LayoutService:
         
         return x, y
     
-    def _clamp_to_room(self, x, y, w, h, rooms):
+    def _clamp_to_room(self, x, y, w, h, ctx):
         """Force furniture within room boundaries"""
-        if not rooms:
+        if not ctx.rooms:
             return max(50, min(750-w, x)), max(50, min(750-h, y))
         
-        # Find best room
-        best = max(rooms, key=lambda r: r.get("width", 0) * r.get("height", 0))
+        # Find best room (sudah di-cache di context)
+        best = ctx.best_room
         rx, ry, rw, rh = best["x"], best["y"], best["width"], best["height"]
         
         # Clamp with padding
-        pad = 15
+        pad = Config.ROOM_PADDING
         x = max(rx+pad, min(rx+rw-w-pad, x))
         y = max(ry+pad, min(ry+rh-h-pad, y))
         
         return x, y
     
-    def _avoid_obstacles(self, x, y, w, h, obstacles):
+    def _avoid_obstacles(self, x, y, w, h, ctx):
         """Move away from obstacles (tangga, dinding, kolom) - AGGRESSIVE MODE"""
-        if not obstacles:
+        obstacles = ctx.obstacles
+        if not len(obstacles):
             return x, y
             
         max_attempts = 15  # More attempts
-        safety_margin = 50  # Larger safety margin
+        safety_margin = Config.OBSTACLE_MARGIN  # Larger safety margin
         
         for attempt in range(max_attempts):
-            has_collision = False
+            # Check overlap with LARGE safety margin
+            hit = ctx.first_obstacle(x, y, w, h, safety_margin)
+            if hit is None:
+                if attempt:
+                    ctx.timer.count("obstacle_retries", attempt)
+                return x, y  # Safe position found
             
-            for obs in obstacles:
-                ox, oy, ow, oh = obs["x"], obs["y"], obs["width"], obs["height"]
-                
-                # Check overlap with LARGE safety margin
-                if not (x + w + safety_margin < ox or 
-                       ox + ow + safety_margin < x or 
-                       y + h + safety_margin < oy or 
-                       oy + oh + safety_margin < y):
-                    
-                    has_collision = True
-                    
-                    # Calculate distance from obstacle center
-                    furniture_cx = x + w/2
-                    furniture_cy = y + h/2
-                    obstacle_cx = ox + ow/2
-                    obstacle_cy = oy + oh/2
-                    
-                    dx = furniture_cx - obstacle_cx
-                    dy = furniture_cy - obstacle_cy
-                    
-                    # AGGRESSIVE movement away
-                    move_dist = 80 + (attempt * 10)  # Increase distance each attempt
-                    
-                    if abs(dx) > abs(dy):
-                        # Move horizontal
-                        x += move_dist if dx > 0 else -move_dist
-                    else:
-                        # Move vertical  
-                        y += move_dist if dy > 0 else -move_dist
-                    
-                    break  # Re-check after movement
+            ox, oy, ow, oh = obstacles.rect(hit)
             
-            if not has_collision:
-                return x, y  # Safe position found
+            # Calculate distance from obstacle center
+            furniture_cx = x + w/2
+            furniture_cy = y + h/2
+            obstacle_cx = ox + ow/2
+            obstacle_cy = oy + oh/2
+            
+            dx = furniture_cx - obstacle_cx
+            dy = furniture_cy - obstacle_cy
+            
+            # AGGRESSIVE movement away
+            move_dist = 80 + (attempt * 10)  # Increase distance each attempt
+            
+            if abs(dx) > abs(dy):
+                # Move horizontal
+                x += move_dist if dx > 0 else -move_dist
+            else:
+                # Move vertical  
+                y += move_dist if dy > 0 else -move_dist
         
         # If still colliding after max attempts, try random safe position
         # Find safe area far from all obstacles
-        if obstacles:
-            safe_x = obstacles[0]["x"] - w - 100  # Far left
-            safe_y = obstacles[0]["y"] - h - 100  # Far top
-            return safe_x, safe_y
-        
-        return x, y
+        ctx.timer.count("obstacle_retries", max_attempts)
+        ctx.timer.count("obstacle_fallback")
+        ox, oy, _, _ = obstacles.rect(0)
+        safe_x = ox - w - 100  # Far left
+        safe_y = oy - h - 100  # Far top
+        return safe_x, safe_y
     
-    def _avoid_collision(self, x, y, w, h):
-        """Avoid other furniture (spiral search dengan padding lebih besar)"""
-        padding = 25  # Increased from 20
+    def _avoid_collision(self, x, y, w, h, ctx, rotate=False):
+        """
+        Avoid other furniture (spiral search dengan padding lebih besar)
+        rotate=True: tiap kandidat spiral dicek di 2 orientasi dalam 1 overlap check
+        Returns: (x, y, w, h)
+        """
+        padding = Config.COLLISION_PADDING  # Increased from 20
+        placed = ctx.placed
         
-        for attempt in range(50):  # More attempts
-            collision = False
-            
-            for p in self.placed:
-                if not (x + w + padding < p["x"] or 
-                       p["x"] + p["w"] + padding < x or 
-                       y + h + padding < p["y"] or 
-                       p["y"] + p["h"] + padding < y):
-                    collision = True
-                    break
-            
-            if not collision:
-                return x, y
-            
-            # Spiral search (larger radius)
-            angle = attempt * 40
-            radius = (attempt + 1) * 35  # Increased radius
-            x += radius * np.cos(np.radians(angle))
-            y += radius * np.sin(np.radians(angle))
+        # Fast path: posisi awal sudah bebas
+        if ctx.is_free("placed", x, y, w, h, padding) or \
+                placed.first_overlap(x, y, w, h, padding) is None:
+            return x, y, w, h
         
-        return x, y
+        ctx.timer.count("spiral_searches")
+        # Semua kandidat spiral sekaligus (larger radius tiap attempt)
+        xs = np.cumsum(np.concatenate(([x], SPIRAL_STEPS[:, 0])))
+        ys = np.cumsum(np.concatenate(([y], SPIRAL_STEPS[:, 1])))
+        if rotate and w != h:
+            return self._spiral_rotated(xs, ys, w, h, ctx, padding)
+        xs, ys = xs.tolist(), ys.tolist()
+        
+        # Beberapa kandidat awal dicek satu per satu
+        for attempt in range(1, SPIRAL_SCALAR_STEPS):
+            if placed.first_overlap(xs[attempt], ys[attempt], w, h, padding) is None:
+                return xs[attempt], ys[attempt], w, h
+        
+        # Vectorized overlap check per blok kandidat, ambil yang bebas pertama
+        for start, stop in SPIRAL_CHUNKS:
+            blocked = placed.overlap_mask(xs[start:stop], ys[start:stop], w, h, padding)
+            free = np.flatnonzero(~blocked)
+            if len(free):
+                best = start + free[0]
+                return xs[best], ys[best], w, h
+        
+        # Semua kandidat penuh - posisi terakhir spiral
+        ctx.timer.count("spiral_exhausted")
+        return xs[SPIRAL_ATTEMPTS], ys[SPIRAL_ATTEMPTS], w, h
     
-    # ========== HELPERS ==========
+    def _spiral_rotated(self, xs, ys, w, h, ctx, padding):
+        """
+        Spiral search 2 orientasi: semua kandidat (orientasi x step) di-clamp ke
+        room lalu dicek dalam 1 overlap_mask - step terkecil menang, orientasi
+        sekarang menang kalau seri. Step 0 ikut dicek (putar di tempat tanpa geser)
+        Orientasi yang muat di room didahulukan
+        """
+        n = len(xs)
+        cand_w, cand_h = np.array([[w], [h]]), np.array([[h], [w]])
+        
+        # Clamp sama dengan _clamp_to_room (kandidat di luar room pasti ditarik balik)
+        lo_x, lo_y, hi_x, hi_y = self._room_bounds(ctx)
+        cand_x = np.maximum(lo_x, np.minimum(hi_x - cand_w, np.stack([xs, xs + (w - h) / 2])))
+        cand_y = np.maximum(lo_y, np.minimum(hi_y - cand_h, np.stack([ys, ys + (h - w) / 2])))
+        fits = (cand_w <= hi_x - lo_x) & (cand_h <= hi_y - lo_y)
+        
+        free = ~ctx.placed.overlap_mask(cand_x.ravel(), cand_y.ravel(),
+                                        np.repeat(cand_w, n), np.repeat(cand_h, n), padding).reshape(2, n)
+        for feasible in (free & fits, free):
+            steps = np.flatnonzero(feasible.any(axis=0))
+            if len(steps):
+                step = steps[0]
+                if feasible[0, step]:
+                    return float(cand_x[0, step]), float(cand_y[0, step]), w, h
+                return float(cand_x[1, step]), float(cand_y[1, step]), h, w
+        
+        # Semua kandidat penuh - posisi terakhir spiral
+        ctx.timer.count("spiral_exhausted")
+        return float(xs[SPIRAL_ATTEMPTS]), float(ys[SPIRAL_ATTEMPTS]), w, h
     
-    def _get_rooms(self, floor_data):
-        """Extract rooms from floor data"""
-        if not floor_data:
-            return [{"x": 60, "y": 60, "width": 680, "height": 680}]
-        return floor_data.get("rooms", [{"x": 60, "y": 60, "width": 680, "height": 680}])
+    @staticmethod
+    def _room_bounds(ctx):
+        """(x0, y0, x1, y1) area yang boleh ditempati (sama dengan _clamp_to_room)"""
+        if not ctx.rooms:
+            return 50, 50, 750, 750
+        room = ctx.best_room
+        return (room["x"] + Config.ROOM_PADDING, room["y"] + Config.ROOM_PADDING,
+                room["x"] + room["width"] - Config.ROOM_PADDING, room["y"] + room["height"] - Config.ROOM_PADDING)
     
-    def _get_obstacles(self, floor_data):
-        """Extract obstacles from floor data"""
-        if not floor_data:
-            return []
-        return floor_data.get("obstacles", []) + floor_data.get("stairs", [])
+    # ========== HELPERS ==========
     
     def _get_zone(self, x, y, w, h):
         """Determine zone (9-grid)"""
@@ -262,45 +787,36 @@ class LayoutService:
         else:
             return zone_x
     
-    def _final_obstacle_check(self, x, y, w, h, obstacles, rooms):
+    def _final_obstacle_check(self, x, y, w, h, ctx):
         """Final check: if still overlapping obstacle, find completely safe position"""
-        if not obstacles:
+        rooms = ctx.rooms
+        if not len(ctx.obstacles):
             return x, y
         
-        safety = 50
+        safety = Config.OBSTACLE_MARGIN
         
         # Check if current position overlaps any obstacle
-        for obs in obstacles:
-            ox, oy, ow, oh = obs["x"], obs["y"], obs["width"], obs["height"]
+        if ctx.first_obstacle(x, y, w, h, safety) is None:
+            return x, y
+        
+        # Still overlapping! Find safe position in room corners
+        ctx.timer.count("final_relocations")
+        if rooms:
+            room = rooms[0]
+            rx, ry, rw, rh = room["x"], room["y"], room["width"], room["height"]
             
-            if not (x + w + safety < ox or ox + ow + safety < x or 
-                   y + h + safety < oy or oy + oh + safety < y):
-                
-                # Still overlapping! Find safe position in room corners
-                if rooms:
-                    room = rooms[0]
-                    rx, ry, rw, rh = room["x"], room["y"], room["width"], room["height"]
-                    
-                    # Try corners: top-left, top-right, bottom-left, bottom-right
-                    candidates = [
-                        (rx + 20, ry + 20),                          # Top-left
-                        (rx + rw - w - 20, ry + 20),                 # Top-right
-                        (rx + 20, ry + rh - h - 20),                 # Bottom-left
-                        (rx + rw - w - 20, ry + rh - h - 20),        # Bottom-right
-                    ]
-                    
-                    # Find first corner without obstacle
-                    for cx, cy in candidates:
-                        safe = True
-                        for obs2 in obstacles:
-                            ox2, oy2, ow2, oh2 = obs2["x"], obs2["y"], obs2["width"], obs2["height"]
-                            if not (cx + w + safety < ox2 or ox2 + ow2 + safety < cx or 
-                                   cy + h + safety < oy2 or oy2 + oh2 + safety < cy):
-                                safe = False
-                                break
-                        
-                        if safe:
-                            return cx, cy
+            # Try corners: top-left, top-right, bottom-left, bottom-right
+            candidates = [
+                (rx + 20, ry + 20),                          # Top-left
+                (rx + rw - w - 20, ry + 20),                 # Top-right
+                (rx + 20, ry + rh - h - 20),                 # Bottom-left
+                (rx + rw - w - 20, ry + rh - h - 20),        # Bottom-right
+            ]
+            
+            # Find first corner without obstacle
+            for cx, cy in candidates:
+                if ctx.first_obstacle(cx, cy, w, h, safety) is None:
+                    return cx, cy
         
         return x, y
     
@@ -310,59 +826,53 @@ class LayoutService:
     def auto_place_all_furniture(room_width=17.0, room_height=11.0):
         """
         Auto place all furniture using model .pkl
-        Simplified version - langsung pakai hasil model training
+        Item dari tabel furniture, di-pack per zone dengan MaxRects
+        (zone diskalakan ke room_width x room_height, dalam meter)
         """
-        # Load model
-        try:
-            model_data = joblib.load(Config.MODEL_PATH)
-            model_loaded = True
+        # Model dari registry (tidak unpickle ulang)
+        model_loaded = ModelRegistry.get().model is not None
+        if model_loaded:
             print("🤖 Using AI ML Model for auto layout")
-        except:
-            model_loaded = False
+        else:
             print("⚠️ ML model not loaded, using grid fallback")
         
-        # Furniture catalog
-        catalog = {
-            "SOFA 3 Seat": {"panjang": 2.6, "lebar": 1.0, "zone": "living", "quantity": 2, "priority": 1},
-            "Meja Makan": {"panjang": 2.4, "lebar": 1.0, "zone": "dining", "quantity": 1, "priority": 2},
-            "Kursi Makan": {"panjang": 0.46, "lebar": 0.75, "zone": "dining", "quantity": 4, "priority": 3},
-            "Pot Bunga": {"panjang": 0.36, "lebar": 0.36, "zone": "decoration", "quantity": 3, "priority": 4},
-        }
+        # Furniture catalog (1 row tabel furniture = 1 item)
+        catalog = LayoutService._load_catalog()
         
         placed_items = []
-        total_items = sum(f["quantity"] for f in catalog.values())
+        total_items = sum(f["quantity"] for f in catalog)
         placed_count = 0
         
         print(f"\n🎯 Auto Layout: {total_items} items")
         
-        # Sort by priority
-        sorted_furniture = sorted(catalog.items(), key=lambda x: x[1]["priority"])
+        # Sort by priority, item besar duluan (packing lebih rapat)
+        sorted_furniture = sorted(catalog, key=lambda f: (f["priority"], -f["panjang"] * f["lebar"]))
+        zones = LayoutService._auto_place_zones(float(room_width), float(room_height))
+        packer = MaxRectsPacker(zones, spacing=AUTO_PLACE_SPACING, margin=AUTO_PLACE_MARGIN)
         
-        for furniture_name, furniture_data in sorted_furniture:
-            quantity = furniture_data["quantity"]
+        for furniture_data in sorted_furniture:
+            furniture_name = furniture_data["nama"]
+            zone = furniture_data["zone"]
+            panjang = furniture_data["panjang"]
+            lebar = furniture_data["lebar"]
             
-            for i in range(quantity):
-                # Simple grid placement
-                zone = furniture_data["zone"]
-                panjang = furniture_data["panjang"]
-                lebar = furniture_data["lebar"]
+            for i in range(furniture_data["quantity"]):
+                # Find free rectangle in zone
+                x, y = packer.insert(zone, panjang, lebar)
+                if x is None:
+                    break  # Zone penuh untuk ukuran ini
                 
-                # Try positions in zone
-                x, y = LayoutService._find_position(zone, panjang, lebar, placed_items)
-                
-                if x is not None:
-                    placed_items.append({
-                        "nama": furniture_name,
-                        "x": x,
-                        "y": y,
-                        "panjang": panjang,
-                        "lebar": lebar,
-                        "zone": zone,
-                        "color": LayoutService._get_zone_color(zone),
-                        "uid": f"{furniture_name}-{i}"
-                    })
-                    placed_count += 1
-                    print(f"  ✓ {furniture_name} ({placed_count}/{total_items})")
+                placed_items.append({
+                    "nama": furniture_name,
+                    "x": round(x, 2),
+                    "y": round(y, 2),
+                    "panjang": panjang,
+                    "lebar": lebar,
+                    "zone": zone,
+                    "color": LayoutService._get_zone_color(zone),
+                    "uid": f"{furniture_name}-{i}"
+                })
+                placed_count += 1
         
         success_rate = (placed_count / total_items * 100) if total_items > 0 else 0
         
@@ -379,44 +889,52 @@ class LayoutService:
         }
     
     @staticmethod
-    def _find_position(zone, panjang, lebar, placed_items):
-        """Find valid position in zone"""
-        zones = {
-            "living": {"x_min": 1.0, "x_max": 7.5, "y_min": 1.0, "y_max": 5.5},
-            "dining": {"x_min": 9.0, "x_max": 15.5, "y_min": 1.0, "y_max": 5.5},
-            "outdoor": {"x_min": 1.5, "x_max": 15.5, "y_min": 7.0, "y_max": 9.5},
-            "decoration": {"x_min": 1.0, "x_max": 16.0, "y_min": 1.0, "y_max": 10.0}
-        }
+    def _auto_place_zones(room_width, room_height):
+        """AUTO_PLACE_ZONES (layout room acuan) diskalakan ke ukuran room request"""
+        sx, sy = room_width / AUTO_PLACE_ROOM[0], room_height / AUTO_PLACE_ROOM[1]
+        return {name: {"x_min": zone["x_min"] * sx, "x_max": zone["x_max"] * sx,
+                       "y_min": zone["y_min"] * sy, "y_max": zone["y_max"] * sy}
+                for name, zone in AUTO_PLACE_ZONES.items()}
+    
+    @staticmethod
+    def _load_catalog():
+        """
+        Catalog auto place dari tabel furniture (fallback ke default catalog)
+        Tabel furniture (nama, dimensi, panjang, lebar) tidak punya kolom jumlah / zone:
+        tiap row = 1 item, zone ditebak dari nama
+        """
+        try:
+            from app.models.Furniture import Furniture
+            rows = Furniture.get_all()
+        except Exception as e:
+            print(f"⚠️ Furniture table not available, using default catalog: {e}")
+            rows = []
         
-        zone_data = zones.get(zone)
-        if not zone_data:
-            return None, None
-        
-        # Try grid positions
-        margin = 0.5
-        spacing = 0.8
-        
-        x = zone_data["x_min"] + margin
-        while x <= zone_data["x_max"] - panjang - margin:
-            y = zone_data["y_min"] + margin
-            while y <= zone_data["y_max"] - lebar - margin:
-                # Check collision with placed items
-                collision = False
-                for item in placed_items:
-                    if not (x + panjang + spacing <= item["x"] or 
-                           item["x"] + item["panjang"] + spacing <= x or 
-                           y + lebar + spacing <= item["y"] or 
-                           item["y"] + item["lebar"] + spacing <= y):
-                        collision = True
-                        break
-                
-                if not collision:
-                    return round(x, 2), round(y, 2)
-                    
-                y += 0.5
-            x += 0.5
+        catalog = []
+        for row in rows:
+            if not row.get("panjang") or not row.get("lebar"):
+                continue
+            name = row.get("nama") or f"Furniture {row.get('id')}"
+            zone = LayoutService._infer_zone(name)
+            catalog.append({
+                "nama": name,
+                "panjang": float(row["panjang"]) / 100,  # cm -> meter
+                "lebar": float(row["lebar"]) / 100,
+                "zone": zone,
+                "quantity": 1,
+                "priority": ZONE_PRIORITY[zone]
+            })
         
-        return None, None
+        return catalog or DEFAULT_AUTO_PLACE_CATALOG
+    
+    @staticmethod
+    def _infer_zone(name):
+        """Tebak zone dari nama furniture"""
+        lowered = name.lower()
+        for candidate, keywords in ZONE_KEYWORDS.items():
+            if any(k in lowered for k in keywords):
+                return candidate
+        return "living"
     
     @staticmethod
     def _get_zone_color(zone):
@@ -428,3 +946,6 @@ class LayoutService:
             "decoration": "#F4A259"
         }
         return colors.get(zone, "#95A5A6")
+
+
+ModelRegistry.on_reload(LayoutService._on_model_reload)
@@ -0,0 +1,101 @@
+"""
+MaxRects Packer
+Bin packing dengan maximal free rectangles (free-rectangle splitting)
+Dipakai auto_place_all_furniture untuk menaruh item per zone
+"""
+import numpy as np
+
+EPS = 1e-9
+
+
+class MaxRectsPacker:
+    """
+    Satu daftar free rectangles untuk seluruh ruangan; tiap zone cuma
+    membatasi area kandidat. Jadi zone yang overlap (mis. decoration)
+    tetap tidak bisa menabrak item dari zone lain.
+
+    Spacing antar item dijamin dengan memperbesar item (dan container)
+    sebesar spacing di sisi kanan & bawah.
+    """
+
+    def __init__(self, zones, spacing=0.0, margin=0.0):
+        """
+        Args:
+            zones (dict): {zone: {"x_min", "x_max", "y_min", "y_max"}}
+            spacing (float): jarak minimum antar item
+            margin (float): jarak minimum item ke batas zone
+        """
+        self.spacing = spacing
+        self.containers = {
+            name: (z["x_min"] + margin, z["y_min"] + margin,
+                   z["x_max"] - margin + spacing, z["y_max"] - margin + spacing)
+            for name, z in zones.items()
+        }
+        bounds = np.array(list(self.containers.values()), dtype=float)
+        # Free rects: array (n, 4) -> x0, y0, x1, y1
+        self.free = np.array([[bounds[:, 0].min(), bounds[:, 1].min(),
+                               bounds[:, 2].max(), bounds[:, 3].max()]])
+
+    def insert(self, zone, w, h):
+        """Taruh rect w x h di zone - return (x, y) atau (None, None)"""
+        container = self.containers.get(zone)
+        if container is None:
+            return None, None
+        w, h = w + self.spacing, h + self.spacing
+
+        # Irisan tiap free rect dengan container zone
+        cx0, cy0, cx1, cy1 = container
+        x0 = np.maximum(self.free[:, 0], cx0)
+        y0 = np.maximum(self.free[:, 1], cy0)
+        x1 = np.minimum(self.free[:, 2], cx1)
+        y1 = np.minimum(self.free[:, 3], cy1)
+        fits = np.flatnonzero((x1 - x0 >= w - EPS) & (y1 - y0 >= h - EPS))
+        if not len(fits):
+            return None, None
+
+        # Posisi paling kiri, lalu paling atas (sama dengan scan grid lama)
+        best = fits[np.lexsort((y0[fits], x0[fits]))[0]]
+        x, y = float(x0[best]), float(y0[best])
+        self._place(x, y, x + w, y + h)
+        return x, y
+
+    def _place(self, ux0, uy0, ux1, uy1):
+        """Split semua free rect yang kena rect baru, lalu prune"""
+        f = self.free
+        hit = (f[:, 0] < ux1 - EPS) & (f[:, 2] > ux0 + EPS) & \
+              (f[:, 1] < uy1 - EPS) & (f[:, 3] > uy0 + EPS)
+        if not hit.any():
+            return
+        keep = f[~hit]
+
+        # 4 kandidat sisa (kiri, kanan, atas, bawah) per free rect yang kena
+        parts = np.repeat(f[hit][None], 4, axis=0)
+        parts[0, :, 2] = ux0
+        parts[1, :, 0] = ux1
+        parts[2, :, 3] = uy0
+        parts[3, :, 1] = uy1
+        parts = parts.reshape(-1, 4)
+        parts = parts[(parts[:, 2] - parts[:, 0] > EPS) & (parts[:, 3] - parts[:, 1] > EPS)]
+
+        self.free = np.concatenate([keep, parts[self._maximal(parts, keep)]])
+
+    @staticmethod
+    def _maximal(new, keep):
+        """Mask rect baru yang tidak terkandung di free rect lain"""
+        if not len(new):
+            return np.zeros(0, dtype=bool)
+        # Rect lama tidak mungkin terkandung di rect baru (rect baru subset
+        # rect yang di-split), jadi cukup cek rect baru vs semua rect
+        others = np.concatenate([keep, new])
+        a, b = new[:, None, :], others[None, :, :]
+        inside = ((a[..., 0] >= b[..., 0] - EPS) & (a[..., 1] >= b[..., 1] - EPS) &
+                  (a[..., 2] <= b[..., 2] + EPS) & (a[..., 3] <= b[..., 3] + EPS))
+
+        # Rect baru vs dirinya sendiri tidak dihitung; duplikat: sisakan yang pertama
+        n, k = len(new), len(keep)
+        idx = np.arange(n)
+        inside[idx, k + idx] = False
+        later = idx[:, None] < idx[None, :]
+        same = inside[:, k:] & inside[:, k:].T
+        inside[:, k:] &= ~(same & later)
+        return ~inside.any(axis=1)
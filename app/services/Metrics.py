@@ -0,0 +1,354 @@
+"""
+Metrics
+Counter / gauge / histogram in-process + export Prometheus text format (/api/metrics)
+Tanpa dependency & tanpa service eksternal.
+
+Multi-worker (gunicorn fork, dll): set METRICS_DIR ke directory yang sama untuk
+semua worker - tiap process tulis snapshot sendiri (metrics_<pid>_<start>.json),
+scrape di worker manapun merge semua file. Snapshot process yang sudah mati
+digabung ke metrics_retired.json lalu dihapus (counter tetap, file tidak menumpuk).
+"""
+import atexit
+import glob
+import json
+import os
+import threading
+import time
+from config import Config
+
+RETIRED_FILE = "metrics_retired.json"
+RETIRE_LOCK_STALE = 30  # seconds - lock retire lebih tua dari ini dianggap sisa process crash
+
+# Histogram buckets (detik)
+REQUEST_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+DB_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+
+# name -> (type, help, aggregation antar process, buckets)
+# sum: dijumlah semua file (process mati tetap dihitung lewat RETIRED_FILE, counter tidak turun)
+# livesum / livemax: cuma process yang masih hidup
+METRICS = {
+    "http_request_duration_seconds": ("histogram", "Request latency per API route", "sum", REQUEST_BUCKETS),
+    "http_requests_in_flight": ("gauge", "Requests currently being handled per API route", "livesum", None),
+    "db_queries_total": ("counter", "Database queries per model class", "sum", None),
+    "db_query_duration_seconds": ("histogram", "Database query latency per model class", "sum", DB_BUCKETS),
+    "layout_items_placed_total": ("counter", "Furniture items placed by the layout pipeline", "sum", None),
+    "layout_cache_hits_total": ("counter", "Layout result cache hits", "sum", None),
+    "layout_cache_misses_total": ("counter", "Layout result cache misses", "sum", None),
+    "layout_stage_seconds_total": ("counter", "Time spent per placement pipeline stage", "sum", None),
+    "layout_stage_calls_total": ("counter", "Calls per placement pipeline stage", "sum", None),
+    "layout_pipeline_events_total": ("counter", "Placement pipeline retries / fallbacks", "sum", None),
+    "db_pool_connections": ("gauge", "Pooled database connections per state", "livesum", None),
+    "db_pool_checkouts_total": ("counter", "Connections checked out of the pool", "sum", None),
+    "db_pool_wait_seconds_total": ("counter", "Time spent waiting for a free pooled connection", "sum", None),
+    "db_pool_timeouts_total": ("counter", "Checkouts that timed out on an exhausted pool", "sum", None),
+    "db_statement_cache_hits_total": ("counter", "Prepared statement cache hits", "sum", None),
+    "db_statement_cache_misses_total": ("counter", "Prepared statement cache misses (statement prepared)", "sum", None),
+    "model_load_seconds": ("gauge", "Time to load the layout model files", "livemax", None),
+    "model_loaded": ("gauge", "1 if the layout model .pkl is loaded", "livemax", None),
+}
+
+# Dihitung saat render dari counter yang sudah di-merge
+DERIVED_HELP = {"layout_cache_hit_ratio": "Layout cache hits / (hits + misses)"}
+
+
+def _key(name, labels):
+    return name, tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+def _escape(value):
+    return value.replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+
+def _format_labels(labels, extra=()):
+    pairs = list(labels) + list(extra)
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in pairs) + "}"
+
+
+def _format_value(value):
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def _pid_alive(pid):
+    try:
+        os.kill(pid, 0)
+        return True
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+
+
+class Metrics:
+    """Registry metrics process ini (class-level, thread-safe)"""
+
+    _values = {}  # (name, labels) -> counter / gauge value
+    _histograms = {}  # (name, labels) -> [bucket counts..., sum, count]
+    _lock = threading.Lock()
+    _started = time.time()
+    _last_flush = 0.0
+
+    # ========== RECORD ==========
+
+    @classmethod
+    def inc(cls, name, value=1, **labels):
+        if not Config.METRICS_ENABLED:
+            return
+        key = _key(name, labels)
+        with cls._lock:
+            cls._values[key] = cls._values.get(key, 0) + value
+
+    @classmethod
+    def dec(cls, name, value=1, **labels):
+        cls.inc(name, -value, **labels)
+
+    @classmethod
+    def set(cls, name, value, **labels):
+        """Set absolute (gauge, atau counter yang sudah diakumulasi di tempat lain)"""
+        if not Config.METRICS_ENABLED:
+            return
+        with cls._lock:
+            cls._values[_key(name, labels)] = value
+
+    @classmethod
+    def observe(cls, name, value, **labels):
+        """Tambah 1 sample ke histogram"""
+        if not Config.METRICS_ENABLED:
+            return
+        buckets = METRICS[name][3]
+        key = _key(name, labels)
+        with cls._lock:
+            entry = cls._histograms.get(key)
+            if entry is None:
+                entry = cls._histograms[key] = [0] * len(buckets) + [0.0, 0]
+            for i, bound in enumerate(buckets):
+                if value <= bound:
+                    entry[i] += 1
+                    break
+            entry[-2] += value
+            entry[-1] += 1
+
+    # ========== SNAPSHOT (multi-process) ==========
+
+    @staticmethod
+    def _collect_app_stats():
+        """Statistik yang sudah diakumulasi service lain (cache, stage timer, model)"""
+        from app.services.LayoutService import LayoutService
+        from app.services.ModelRegistry import ModelRegistry
+        from app.services.StageTimer import StageTimer
+        from database.connection import Database
+        from database.statement_cache import StatementCache
+
+        cache = LayoutService.cache.stats()
+        Metrics.set("layout_cache_hits_total", cache["hits"])
+        Metrics.set("layout_cache_misses_total", cache["misses"])
+
+        stats = StageTimer.process_stats()
+        for stage, entry in stats["stages"].items():
+            Metrics.set("layout_stage_seconds_total", entry["total_ms"] / 1000, stage=stage)
+            Metrics.set("layout_stage_calls_total", entry["calls"], stage=stage)
+        for name, value in stats["counters"].items():
+            Metrics.set("layout_pipeline_events_total", value, event=name)
+
+        for pool in Database.pool_stats():
+            Metrics.set("db_pool_connections", pool["idle"], pool=pool["name"], state="idle")
+            Metrics.set("db_pool_connections", pool["in_use"], pool=pool["name"], state="in_use")
+            Metrics.set("db_pool_checkouts_total", pool["checkouts"], pool=pool["name"])
+            Metrics.set("db_pool_wait_seconds_total", pool["wait_seconds"], pool=pool["name"])
+            Metrics.set("db_pool_timeouts_total", pool["timeouts"], pool=pool["name"])
+
+        statements = StatementCache.stats()
+        Metrics.set("db_statement_cache_hits_total", statements["hits"])
+        Metrics.set("db_statement_cache_misses_total", statements["misses"])
+
+        bundle = ModelRegistry._bundle  # Jangan trigger load dari scrape
+        if bundle is not None:
+            Metrics.set("model_load_seconds", bundle.load_time)
+            Metrics.set("model_loaded", int(bundle.model is not None))
+
+    @classmethod
+    def snapshot(cls):
+        """State process ini (JSON-serializable)"""
+        cls._collect_app_stats()
+        with cls._lock:
+            return {
+                "pid": os.getpid(),
+                "values": [[name, labels, value] for (name, labels), value in cls._values.items()],
+                "histograms": [[name, labels, entry] for (name, labels), entry in cls._histograms.items()]
+            }
+
+    @classmethod
+    def _snapshot_path(cls):
+        return os.path.join(Config.METRICS_DIR, f"metrics_{os.getpid()}_{int(cls._started * 1000)}.json")
+
+    @classmethod
+    def flush(cls):
+        """Tulis snapshot ke METRICS_DIR (atomic rename)"""
+        if not Config.METRICS_ENABLED or not Config.METRICS_DIR:
+            return
+        cls._last_flush = time.monotonic()
+        try:
+            os.makedirs(Config.METRICS_DIR, exist_ok=True)
+            path = cls._snapshot_path()
+            with open(path + ".tmp", "w") as f:
+                json.dump(cls.snapshot(), f)
+            os.replace(path + ".tmp", path)
+        except OSError as e:
+            print(f"⚠️ Metrics flush failed: {e}")
+
+    @classmethod
+    def maybe_flush(cls):
+        """Flush kalau snapshot terakhir lebih lama dari METRICS_FLUSH_INTERVAL"""
+        if Config.METRICS_DIR and time.monotonic() - cls._last_flush >= Config.METRICS_FLUSH_INTERVAL:
+            cls.flush()
+
+    @classmethod
+    def _snapshots(cls):
+        """Snapshot semua process (METRICS_DIR), atau process ini saja"""
+        if not Config.METRICS_DIR:
+            return [cls.snapshot()]
+
+        cls.flush()
+        snapshots = {}
+        for path in glob.glob(os.path.join(Config.METRICS_DIR, "metrics_*.json")):
+            snapshot = cls._read_snapshot(path)
+            if snapshot is not None:
+                snapshots[path] = snapshot
+
+        dead = [path for path, snapshot in snapshots.items()
+                if snapshot["pid"] is not None and snapshot["pid"] != os.getpid()
+                and not _pid_alive(snapshot["pid"])]
+        if dead:
+            retired = cls._retire(dead)
+            if retired is not None:
+                for path in dead:
+                    snapshots.pop(path, None)
+                snapshots[os.path.join(Config.METRICS_DIR, RETIRED_FILE)] = retired
+        return list(snapshots.values())
+
+    @staticmethod
+    def _read_snapshot(path):
+        try:
+            with open(path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None  # File sedang ditulis / rusak - skip scrape ini
+
+    @classmethod
+    def _retire(cls, paths):
+        """
+        Gabung snapshot process mati ke RETIRED_FILE (cuma metric "sum") lalu hapus filenya
+        Lock file (O_EXCL) supaya 2 worker yang scrape bersamaan tidak menggabung 2x
+        Returns: snapshot retired baru, None kalau worker lain sedang retire
+        """
+        lock = os.path.join(Config.METRICS_DIR, "metrics_retired.lock")
+        try:
+            os.close(os.open(lock, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+        except FileExistsError:
+            try:
+                if time.time() - os.path.getmtime(lock) > RETIRE_LOCK_STALE:
+                    os.remove(lock)
+            except OSError:
+                pass
+            return None
+
+        try:
+            retired_path = os.path.join(Config.METRICS_DIR, RETIRED_FILE)
+            # Baca ulang di dalam lock - file yang sudah di-retire worker lain tidak ada lagi
+            snapshots = [cls._read_snapshot(path) for path in [retired_path] + paths if os.path.exists(path)]
+            values, histograms = cls._merge([snapshot for snapshot in snapshots if snapshot is not None])
+            retired = {
+                "pid": None,
+                "values": [[name, labels, value] for (name, labels), value in values.items()],
+                "histograms": [[name, labels, entry] for (name, labels), entry in histograms.items()]
+            }
+            with open(retired_path + ".tmp", "w") as f:
+                json.dump(retired, f)
+            os.replace(retired_path + ".tmp", retired_path)
+            for path in paths:
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+            return retired
+        except OSError as e:
+            print(f"⚠️ Metrics retire failed: {e}")
+            return None
+        finally:
+            try:
+                os.remove(lock)
+            except OSError:
+                pass
+
+    @classmethod
+    def _merge(cls, snapshots):
+        """Gabung snapshot sesuai aggregation tiap metric"""
+        values, histograms = {}, {}
+        for snapshot in snapshots:
+            pid = snapshot["pid"]
+            alive = pid is not None and (pid == os.getpid() or _pid_alive(pid))
+            for name, labels, value in snapshot["values"]:
+                aggregation = METRICS.get(name, ("", "", "sum"))[2]
+                if aggregation.startswith("live") and not alive:
+                    continue
+                key = _key(name, dict(labels))
+                if aggregation == "livemax":
+                    values[key] = max(values.get(key, value), value)
+                else:
+                    values[key] = values.get(key, 0) + value
+            for name, labels, entry in snapshot["histograms"]:
+                key = _key(name, dict(labels))
+                merged = histograms.get(key)
+                histograms[key] = list(entry) if merged is None else [a + b for a, b in zip(merged, entry)]
+        return values, histograms
+
+    # ========== EXPOSITION ==========
+
+    @classmethod
+    def render(cls):
+        """Semua metrics dalam Prometheus text exposition format (0.0.4)"""
+        values, histograms = cls._merge(cls._snapshots())
+
+        lines = []
+        for name, (kind, help_text, _, buckets) in METRICS.items():
+            series = sorted((labels, value) for (n, labels), value in values.items() if n == name)
+            hist = sorted((labels, entry) for (n, labels), entry in histograms.items() if n == name)
+            if not series and not hist:
+                continue
+            lines += [f"# HELP {name} {help_text}", f"# TYPE {name} {kind}"]
+            for labels, value in series:
+                lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+            for labels, entry in hist:
+                cumulative = 0
+                for bound, count in zip(buckets + (float("inf"),), entry[:-2] + [entry[-1] - sum(entry[:-2])]):
+                    cumulative += count
+                    lines.append(f"{name}_bucket{_format_labels(labels, [('le', _format_value(bound))])} "
+                                 f"{cumulative}")
+                lines.append(f"{name}_sum{_format_labels(labels)} {_format_value(float(entry[-2]))}")
+                lines.append(f"{name}_count{_format_labels(labels)} {entry[-1]}")
+
+        hits = values.get(_key("layout_cache_hits_total", {}), 0)
+        misses = values.get(_key("layout_cache_misses_total", {}), 0)
+        lines += [f"# HELP layout_cache_hit_ratio {DERIVED_HELP['layout_cache_hit_ratio']}",
+                  "# TYPE layout_cache_hit_ratio gauge",
+                  f"layout_cache_hit_ratio {_format_value(hits / (hits + misses) if hits + misses else 0.0)}"]
+        return "\n".join(lines) + "\n"
+
+    # ========== LIFECYCLE ==========
+
+    @classmethod
+    def reset(cls):
+        """Kosongkan registry (child setelah fork mulai dari 0, file snapshot sendiri)"""
+        cls._lock = threading.Lock()
+        cls._values, cls._histograms = {}, {}
+        cls._started = time.time()
+        cls._last_flush = 0.0
+
+
+# Child process hasil fork tidak boleh ikut melapor angka parent (double count saat merge)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=Metrics.reset)
+atexit.register(Metrics.flush)
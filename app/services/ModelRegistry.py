@@ -0,0 +1,251 @@
+"""
+Model Registry
+Load model .pkl sekali per proses, lalu di-share ke semua request.
+Watcher thread memantau file model dan swap versi baru secara atomic.
+"""
+import hashlib
+import os
+import threading
+import time
+
+import joblib
+import numpy as np
+from config import Config
+
+
+class ModelBundle:
+    """Snapshot immutable dari model + feature columns + metadata"""
+
+    def __init__(self, model, feature_cols, metadata, version, loaded_at, load_time):
+        self.model = model
+        self.feature_cols = feature_cols
+        self.metadata = metadata or {}
+        self.version = version
+        self.loaded_at = loaded_at
+        self.load_time = load_time
+        self.warmed_up = False
+        self.compiled = None
+        self.surrogate = None
+
+
+class ModelRegistry:
+    """Process-wide registry untuk pre-trained layout model"""
+
+    _bundle = None
+    _signature = None
+    _rejected = None  # Signature file yang gagal load / warm-up (tidak dicoba ulang sampai berubah lagi)
+    _lock = threading.Lock()
+    _watcher = None
+    _stop = threading.Event()
+    _listeners = []
+
+    @staticmethod
+    def _paths():
+        """Model files yang di-watch"""
+        return [Config.MODEL_PATH, Config.FEATURE_COLS_PATH, Config.METADATA_PATH]
+
+    @classmethod
+    def _file_signature(cls):
+        """(mtime, size) tiap file - berubah kalau file di-replace"""
+        signature = []
+        for path in cls._paths():
+            try:
+                st = os.stat(path)
+                signature.append((path, st.st_mtime_ns, st.st_size))
+            except OSError:
+                signature.append((path, None, None))
+        return tuple(signature)
+
+    @staticmethod
+    def _load_file(path):
+        """Load satu .pkl, None kalau gagal"""
+        try:
+            return joblib.load(path)
+        except Exception as e:
+            print(f"⚠️ Error loading {os.path.basename(path)}: {e}")
+            return None
+
+    @classmethod
+    def _build(cls, signature):
+        """Load semua komponen model ke bundle baru"""
+        started = time.perf_counter()
+        model = cls._load_file(Config.MODEL_PATH)
+        feature_cols = cls._load_file(Config.FEATURE_COLS_PATH)
+        metadata = cls._load_file(Config.METADATA_PATH)
+        load_time = time.perf_counter() - started
+
+        version = hashlib.sha1(repr(signature).encode()).hexdigest()[:12]
+        return ModelBundle(model, feature_cols, metadata, version, time.time(), load_time)
+
+    @staticmethod
+    def _warm_up(bundle):
+        """Dummy prediction supaya lazy init model terjadi sebelum traffic masuk"""
+        if bundle.model is None or not bundle.feature_cols:
+            return
+        from app.services.LayoutService import LayoutService
+
+        if LayoutService(bundle)._model_predict([(100.0, 60.0)]) is not None:
+            bundle.warmed_up = True
+        else:
+            print("⚠️ Model warm-up failed, predictions will use grid fallback")
+
+    @staticmethod
+    def _compile(bundle):
+        """Export tree ensemble ke NumPy arrays, dipakai kalau parity dengan model.predict OK"""
+        if not Config.COMPILED_INFERENCE or bundle.model is None or not bundle.feature_cols:
+            return
+        from app.services.CompiledModel import CompiledModel
+        from app.services.LayoutService import LayoutService
+
+        compiled = CompiledModel.compile(bundle.model)
+        if compiled is None:
+            return
+        try:
+            rng = np.random.default_rng(0)
+            dims = rng.uniform(10, 500, size=(256, 2))
+            features = LayoutService._build_features(dims)
+            if features.shape[1] != len(bundle.feature_cols):
+                return
+            expected = np.asarray(bundle.model.predict(features), dtype=float).reshape(len(dims), -1)
+            diff = float(np.abs(compiled.predict(features) - expected).max())
+        except Exception as e:
+            print(f"⚠️ Compiled model parity check failed: {e}")
+            return
+
+        if diff > Config.COMPILED_PARITY_TOL:
+            print(f"⚠️ Compiled model mismatch ({diff:.4f}), using model.predict")
+            return
+        bundle.compiled = compiled
+        print(f"⚡ Compiled {compiled.source}: {compiled.n_trees} trees, depth {compiled.max_depth}")
+
+    @staticmethod
+    def _build_surrogate(bundle):
+        """Precompute lookup table (mode surrogate), validasi error vs model asli"""
+        if Config.LAYOUT_INFERENCE != "surrogate" or not bundle.warmed_up:
+            return
+        from app.services.LayoutService import LayoutService
+        from app.services.SurrogateModel import SurrogateModel
+
+        surrogate = SurrogateModel(LayoutService(bundle)._model_array)
+        if not surrogate.build() or surrogate.validate() is None:
+            print("⚠️ Surrogate build failed, using real model")
+            return
+
+        report = surrogate.report
+        print(f"📐 Surrogate table {report['grid_points']} points: "
+              f"max error {report['max_error']} px, mean {report['mean_error']} px")
+        if report["max_error"] > Config.SURROGATE_MAX_ERROR:
+            print(f"⚠️ Surrogate error > {Config.SURROGATE_MAX_ERROR} px, using real model")
+            return
+        bundle.surrogate = surrogate
+
+    @classmethod
+    def load(cls):
+        """Load (atau reload) model dan swap bundle secara atomic"""
+        with cls._lock:
+            signature = cls._file_signature()
+            bundle = cls._build(signature)
+            cls._compile(bundle)
+            cls._warm_up(bundle)
+            cls._build_surrogate(bundle)
+
+            previous = cls._bundle
+            if previous is not None and previous.warmed_up and not bundle.warmed_up:
+                # File setengah ditulis / rusak - tetap pakai model lama, signature lama
+                # dipertahankan supaya file yang selesai ditulis di-reload lagi
+                cls._rejected = signature
+                print(f"⚠️ Model reload failed, keeping version {previous.version}")
+                return previous
+
+            # Reference swap atomic - request yang sedang jalan tetap pakai bundle lama
+            cls._bundle = bundle
+            cls._signature = signature
+            cls._rejected = None
+
+        if bundle.model is not None:
+            print(f"✅ Model loaded successfully (version {bundle.version}, {bundle.load_time * 1000:.0f} ms)")
+
+        for listener in list(cls._listeners):
+            try:
+                listener(bundle)
+            except Exception as e:
+                print(f"⚠️ Model reload listener error: {e}")
+        return bundle
+
+    @classmethod
+    def get(cls):
+        """Get current bundle, load pertama kali kalau belum ada"""
+        bundle = cls._bundle
+        if bundle is None:
+            bundle = cls.load()
+        return bundle
+
+    @classmethod
+    def on_reload(cls, listener):
+        """Register callback(bundle) yang dipanggil tiap model di-(re)load"""
+        if listener not in cls._listeners:
+            cls._listeners.append(listener)
+        return listener
+
+    @classmethod
+    def preload(cls):
+        """Dipanggil sekali saat app start"""
+        return cls.get()
+
+    @classmethod
+    def reload_if_changed(cls):
+        """Reload kalau salah satu file model berubah - True kalau bundle baru dipakai"""
+        signature = cls._file_signature()
+        if signature == cls._signature or signature == cls._rejected:
+            return False
+        print("🔄 Model files changed, reloading...")
+        previous = cls._bundle
+        return cls.load() is not previous
+
+    @classmethod
+    def start_watcher(cls, interval=None):
+        """Start background thread yang polling model files"""
+        if cls._watcher is not None and cls._watcher.is_alive():
+            return cls._watcher
+
+        interval = interval or Config.MODEL_WATCH_INTERVAL
+        cls._stop.clear()
+
+        def watch():
+            while not cls._stop.wait(interval):
+                try:
+                    cls.reload_if_changed()
+                except Exception as e:
+                    print(f"⚠️ Model watcher error: {e}")
+
+        cls._watcher = threading.Thread(target=watch, name="model-watcher", daemon=True)
+        cls._watcher.start()
+        return cls._watcher
+
+    @classmethod
+    def stop_watcher(cls):
+        """Stop watcher thread"""
+        cls._stop.set()
+        cls._watcher = None
+
+    @classmethod
+    def model_info(cls):
+        """Model info dari memory (tanpa unpickle ulang)"""
+        bundle = cls.get()
+        metadata = bundle.metadata
+        if not metadata:
+            return None
+
+        return {
+            "version": metadata.get('version'),
+            "date": metadata.get('date'),
+            "furniture_count": metadata.get('furniture_count'),
+            "training_samples": metadata.get('samples'),
+            "regression": metadata.get('regression'),
+            "classification": metadata.get('classification'),
+            "model_version": bundle.version,
+            "warmed_up": bundle.warmed_up,
+            "inference": "surrogate" if bundle.surrogate is not None else
+                         "compiled" if bundle.compiled is not None else "model",
+            "surrogate": bundle.surrogate.report if bundle.surrogate is not None else None
+        }
@@ -0,0 +1,168 @@
+"""
+Occupancy Grid
+Raster occupancy (rooms, obstacles, furniture) + summed-area table
+Query "apakah rect w x h di (x, y) bebas (dengan margin)" jadi O(1)
+
+Raster bersifat konservatif: cell ditandai kalau tersentuh rect (interval
+tertutup), jadi is_free() == True selalu berarti benar-benar bebas.
+Kalau False, caller boleh fallback ke exact check.
+"""
+import copy
+import math
+import numpy as np
+from config import Config
+
+
+class OccupancyGrid:
+    """Multi-layer occupancy raster dengan summed-area table per layer"""
+
+    def __init__(self, bounds, resolution=None):
+        """
+        Args:
+            bounds (tuple): (x0, y0, x1, y1) area canvas yang di-raster
+            resolution (float): ukuran 1 cell dalam px
+        """
+        self.resolution = float(resolution or Config.OCCUPANCY_RESOLUTION)
+        x0, y0, x1, y1 = bounds
+        self.x0, self.y0 = float(x0), float(y0)
+        self.cols = max(1, math.floor((x1 - x0) / self.resolution) + 1)
+        self.rows = max(1, math.floor((y1 - y0) / self.resolution) + 1)
+        self.x1 = self.x0 + self.cols * self.resolution
+        self.y1 = self.y0 + self.rows * self.resolution
+
+        self.layers = {}
+        self.sats = {}
+        self.spill = {}
+        self.best_room = None
+
+    @classmethod
+    def from_floor(cls, rooms, obstacles, resolution=None, padding=200):
+        """
+        Build grid dari floor_data: layer 'rooms' (area di luar room),
+        'obstacles' (tangga, kolom, dll) dan 'placed' (furniture, kosong)
+        """
+        rects = [(r["x"], r["y"], r["width"], r["height"]) for r in list(rooms) + list(obstacles)]
+        xs = [0, Config.CANVAS_WIDTH] + [x for x, _, w, _ in rects] + [x + w for x, _, w, _ in rects]
+        ys = [0, Config.CANVAS_HEIGHT] + [y for _, y, _, h in rects] + [y + h for _, y, _, h in rects]
+        grid = cls((min(xs) - padding, min(ys) - padding, max(xs) + padding, max(ys) + padding), resolution)
+
+        # Rooms: cell yang sepenuhnya di dalam room = free, sisanya outside
+        grid.add_layer("rooms", fill=1)
+        inside = np.zeros((grid.rows, grid.cols), dtype=bool)
+        for room in rooms:
+            r0, c0, r1, c1 = grid._inner_cells(room["x"], room["y"], room["width"], room["height"])
+            inside[r0:r1, c0:c1] = True
+        grid.layers["rooms"][inside] = 0
+        grid._rebuild_sat("rooms")
+        if rooms:
+            grid.best_room = max(rooms, key=lambda r: r.get("width", 0) * r.get("height", 0))
+
+        grid.add_layer("obstacles")
+        for obs in obstacles:
+            grid.block("obstacles", obs["x"], obs["y"], obs["width"], obs["height"])
+
+        grid.add_layer("placed")
+        return grid
+
+    # ========== RASTER HELPERS ==========
+
+    def _touched_cells(self, x, y, w, h):
+        """Cell range (row0, col0, row1, col1) exclusive yang tersentuh rect"""
+        r = self.resolution
+        c0 = math.floor((x - self.x0) / r)
+        r0 = math.floor((y - self.y0) / r)
+        c1 = math.floor((x + w - self.x0) / r) + 1
+        r1 = math.floor((y + h - self.y0) / r) + 1
+        return r0, c0, r1, c1
+
+    def _inner_cells(self, x, y, w, h):
+        """Cell range yang sepenuhnya di dalam rect"""
+        r = self.resolution
+        c0 = math.ceil((x - self.x0) / r)
+        r0 = math.ceil((y - self.y0) / r)
+        c1 = math.floor((x + w - self.x0) / r)
+        r1 = math.floor((y + h - self.y0) / r)
+        return max(r0, 0), max(c0, 0), min(r1, self.rows), min(c1, self.cols)
+
+    def _clip(self, r0, c0, r1, c1):
+        return max(r0, 0), max(c0, 0), min(r1, self.rows), min(c1, self.cols)
+
+    def _in_bounds(self, r0, c0, r1, c1):
+        return r0 >= 0 and c0 >= 0 and r1 <= self.rows and c1 <= self.cols
+
+    def _rebuild_sat(self, layer):
+        sat = np.zeros((self.rows + 1, self.cols + 1), dtype=np.int32)
+        sat[1:, 1:] = self.layers[layer].cumsum(0).cumsum(1)
+        self.sats[layer] = sat
+
+    def _count(self, layer, r0, c0, r1, c1):
+        """Jumlah cell blocked di range - O(1) via summed-area table"""
+        if r0 >= r1 or c0 >= c1:
+            return 0
+        sat = self.sats[layer]
+        return int(sat[r1, c1] - sat[r0, c1] - sat[r1, c0] + sat[r0, c0])
+
+    # ========== PUBLIC API ==========
+
+    def fork(self):
+        """
+        Copy dengan layer 'placed' kosong - raster rooms & obstacles di-share
+        (read-only selama placement), jadi tidak perlu raster ulang per variant
+        """
+        grid = copy.copy(self)
+        grid.layers, grid.sats, grid.spill = dict(self.layers), dict(self.sats), dict(self.spill)
+        grid.add_layer("placed")
+        return grid
+
+    def add_layer(self, layer, fill=0):
+        self.layers[layer] = np.full((self.rows, self.cols), fill, dtype=np.uint8)
+        self.spill[layer] = False
+        self._rebuild_sat(layer)
+
+    def block(self, layer, x, y, w, h):
+        """Tandai rect sebagai terisi - update SAT incremental"""
+        cells = self._touched_cells(x, y, w, h)
+        if not self._in_bounds(*cells):
+            # Sebagian rect di luar raster - query di luar raster jadi "unknown"
+            self.spill[layer] = True
+        r0, c0, r1, c1 = self._clip(*cells)
+        if r0 >= r1 or c0 >= c1:
+            return
+
+        grid = self.layers[layer]
+        added = (grid[r0:r1, c0:c1] == 0).astype(np.int32)
+        if not added.any():
+            return
+        grid[r0:r1, c0:c1] = 1
+
+        # SAT[i, j] untuk i >= r0, j >= c0 bertambah sebanyak cell baru di
+        # kiri-atas (i, j) - cukup prefix sum dari blok rect yang baru,
+        # di luar blok nilainya = baris/kolom terakhir prefix
+        prefix = added.cumsum(0).cumsum(1)
+        sat = self.sats[layer]
+        sat[r0 + 1:r1 + 1, c0 + 1:c1 + 1] += prefix
+        sat[r0 + 1:r1 + 1, c1 + 1:] += prefix[:, -1:]
+        sat[r1 + 1:, c0 + 1:c1 + 1] += prefix[-1:, :]
+        sat[r1 + 1:, c1 + 1:] += prefix[-1, -1]
+
+    def is_free(self, layer, x, y, w, h, margin=0):
+        """True kalau rect (+ margin) tidak menyentuh cell terisi di layer"""
+        cells = self._touched_cells(x - margin, y - margin, w + 2 * margin, h + 2 * margin)
+        if self.spill[layer] and not self._in_bounds(*cells):
+            return False
+        return self._count(layer, *self._clip(*cells)) == 0
+
+    def inside_rooms(self, x, y, w, h, margin=0):
+        """True kalau rect (+ margin) sepenuhnya di dalam area room"""
+        cells = self._touched_cells(x - margin, y - margin, w + 2 * margin, h + 2 * margin)
+        if not self._in_bounds(*cells):
+            return False
+        return self._count("rooms", *cells) == 0
+
+    def free_ratio(self, layer, x, y, w, h):
+        """Porsi cell bebas di rect (0..1)"""
+        r0, c0, r1, c1 = self._clip(*self._touched_cells(x, y, w, h))
+        total = max(r1 - r0, 0) * max(c1 - c0, 0)
+        if not total:
+            return 1.0
+        return 1.0 - self._count(layer, r0, c0, r1, c1) / total
@@ -0,0 +1,98 @@
+"""
+Placement Context
+State per batch (rooms, obstacles, furniture yang sudah ditaruh)
+Dibuat per request - LayoutService sendiri tidak menyimpan state apapun
+"""
+import time
+from config import Config
+from app.services.OccupancyGrid import OccupancyGrid
+from app.services.SpatialIndex import create_index
+from app.services.StageTimer import NullTimer
+
+DEFAULT_ROOM = {"x": 60, "y": 60, "width": 680, "height": 680}
+
+
+class PlacementContext:
+    """Request-local placement state - tidak pernah di-share antar thread"""
+
+    def __init__(self, rooms, obstacles, occupancy=None, timer=None):
+        """
+        Args:
+            rooms (list): room dicts dari floor_data
+            obstacles (list): obstacle/stairs dicts dari floor_data
+            occupancy (OccupancyGrid): raster rooms + obstacles (optional)
+            timer (StageTimer): timer per stage request ini (optional)
+        """
+        self.timer = timer or NullTimer()
+        self.rooms = rooms
+        self.obstacle_list = obstacles
+        self.occupancy = occupancy
+        self.best_room = max(rooms, key=lambda r: r.get("width", 0) * r.get("height", 0)) if rooms else None
+
+        # Obstacles ke spatial index (urutan tetap sama)
+        self.obstacles = create_index()
+        for obs in obstacles:
+            self.obstacles.insert(obs["x"], obs["y"], obs["width"], obs["height"])
+
+        self.placed = create_index()  # Track placed furniture
+
+    @classmethod
+    def from_floor(cls, floor_data=None, timer=None):
+        """Build context dari floor_data request"""
+        started = time.perf_counter()
+        rooms = cls._get_rooms(floor_data)
+        obstacles = cls._get_obstacles(floor_data)
+
+        # Raster rooms + obstacles untuk O(1) free-rectangle query
+        occupancy = None
+        if Config.OCCUPANCY_GRID:
+            occupancy = OccupancyGrid.from_floor(rooms, obstacles)
+
+        ctx = cls(rooms, obstacles, occupancy, timer)
+        ctx.timer.lap("floor", started)
+        return ctx
+
+    def fork(self):
+        """
+        Context baru dengan rooms/obstacles yang sama (index & raster di-share),
+        furniture yang sudah ditaruh kosong - untuk layout alternatif
+        """
+        ctx = PlacementContext.__new__(PlacementContext)
+        ctx.timer = self.timer
+        ctx.rooms = self.rooms
+        ctx.obstacle_list = self.obstacle_list
+        ctx.occupancy = self.occupancy.fork() if self.occupancy is not None else None
+        ctx.best_room = self.best_room
+        ctx.obstacles = self.obstacles
+        ctx.placed = create_index()
+        return ctx
+
+    @staticmethod
+    def _get_rooms(floor_data):
+        """Extract rooms from floor data"""
+        if not floor_data:
+            return [dict(DEFAULT_ROOM)]
+        return floor_data.get("rooms", [dict(DEFAULT_ROOM)])
+
+    @staticmethod
+    def _get_obstacles(floor_data):
+        """Extract obstacles from floor data"""
+        if not floor_data:
+            return []
+        return floor_data.get("obstacles", []) + floor_data.get("stairs", [])
+
+    def place(self, x, y, w, h):
+        """Track furniture yang sudah ditaruh (spatial index & raster)"""
+        self.placed.insert(x, y, w, h)
+        if self.occupancy is not None:
+            self.occupancy.block("placed", x, y, w, h)
+
+    def is_free(self, layer, x, y, w, h, margin):
+        """O(1) raster check - True berarti pasti bebas"""
+        return self.occupancy is not None and self.occupancy.is_free(layer, x, y, w, h, margin)
+
+    def first_obstacle(self, x, y, w, h, margin):
+        """Obstacle pertama yang overlap (raster dulu, exact check kalau perlu)"""
+        if self.is_free("obstacles", x, y, w, h, margin):
+            return None
+        return self.obstacles.first_overlap(x, y, w, h, margin)
@@ -0,0 +1,154 @@
+"""
+Spatial Index
+Broad-phase index untuk overlap query (furniture & obstacles)
+Semua rect format (x, y, w, h) dalam koordinat canvas
+"""
+import math
+import numpy as np
+from config import Config
+
+
+def rects_overlap(x, y, w, h, rect, margin=0):
+    """Overlap test dengan margin (sama dengan check di LayoutService)"""
+    ox, oy, ow, oh = rect
+    return not (x + w + margin < ox or
+                ox + ow + margin < x or
+                y + h + margin < oy or
+                oy + oh + margin < y)
+
+
+class LinearIndex:
+    """Brute-force index - scan semua rect (baseline / debugging)"""
+
+    def __init__(self):
+        self.rects = []
+        self._array = np.empty((16, 4))
+
+    def __len__(self):
+        return len(self.rects)
+
+    def insert(self, x, y, w, h):
+        """Insert rect, return id (urutan insert)"""
+        rect_id = len(self.rects)
+        if rect_id == len(self._array):
+            self._array = np.concatenate([self._array, np.empty_like(self._array)])
+        self._array[rect_id] = (x, y, w, h)
+        self.rects.append((x, y, w, h))
+        return rect_id
+
+    def rect(self, rect_id):
+        return self.rects[rect_id]
+
+    def candidates(self, x, y, w, h, margin=0):
+        """Semua id yang mungkin overlap, urut sesuai insert"""
+        return range(len(self.rects))
+
+    def overlap_mask(self, xs, ys, w, h, margin=0):
+        """
+        Vectorized overlap test untuk banyak kandidat posisi sekaligus
+        xs, ys (dan w, h) berupa array - return bool array: True = overlap
+        """
+        xs, ys = np.asarray(xs, dtype=float), np.asarray(ys, dtype=float)
+        w, h = np.asarray(w, dtype=float), np.asarray(h, dtype=float)
+        if not self.rects:
+            return np.zeros(xs.shape, dtype=bool)
+
+        # Broad-phase: ambil kandidat dari bounding box semua posisi
+        bx0, by0 = xs.min(), ys.min()
+        bx1, by1 = (xs + w).max(), (ys + h).max()
+        ids = self.candidates(bx0, by0, bx1 - bx0, by1 - by0, margin)
+        if not len(ids):
+            return np.zeros(xs.shape, dtype=bool)
+        rects = self._array[:len(self.rects)] if isinstance(ids, range) else self._array[ids]
+
+        # Buang rect di luar bounding box kandidat sebelum bikin matrix
+        ox, oy, ow, oh = rects.T
+        near = ~((bx1 + margin < ox) | (ox + ow + margin < bx0) |
+                 (by1 + margin < oy) | (oy + oh + margin < by0))
+        if not near.any():
+            return np.zeros(xs.shape, dtype=bool)
+        ox, oy, ow, oh = rects[near].T
+
+        # Narrow-phase: matrix kandidat x rect
+        xs, ys = xs[..., None], ys[..., None]
+        if w.ndim:
+            w, h = w[..., None], h[..., None]
+        hit = ~((xs + w + margin < ox) |
+                (ox + ow + margin < xs) |
+                (ys + h + margin < oy) |
+                (oy + oh + margin < ys))
+        return hit.any(axis=-1)
+
+    def first_overlap(self, x, y, w, h, margin=0):
+        """Id pertama (urutan insert) yang overlap, None kalau bebas"""
+        for rect_id in self.candidates(x, y, w, h, margin):
+            if rects_overlap(x, y, w, h, self.rects[rect_id], margin):
+                return rect_id
+        return None
+
+
+class GridIndex(LinearIndex):
+    """Uniform grid - rect di-bucket ke cell yang dia tutupi"""
+
+    # Rect yang menutupi terlalu banyak cell disimpan terpisah & selalu dicek
+    MAX_CELLS_PER_RECT = 256
+    # Query yang menutupi lebih dari ini langsung scan semua rect
+    MAX_QUERY_CELLS = 64
+    # Di bawah jumlah ini index di-bypass (linear scan)
+    MIN_INDEXED_RECTS = 24
+
+    def __init__(self, cell_size=None):
+        super().__init__()
+        self.cell_size = float(cell_size or Config.SPATIAL_GRID_CELL)
+        self.cells = {}
+        self.oversized = []
+
+    def _cell_range(self, x0, y0, x1, y1):
+        c = self.cell_size
+        return (math.floor(x0 / c), math.floor(y0 / c),
+                math.floor(x1 / c), math.floor(y1 / c))
+
+    def insert(self, x, y, w, h):
+        rect_id = super().insert(x, y, w, h)
+        cx0, cy0, cx1, cy1 = self._cell_range(x, y, x + w, y + h)
+
+        if (cx1 - cx0 + 1) * (cy1 - cy0 + 1) > self.MAX_CELLS_PER_RECT:
+            self.oversized.append(rect_id)
+            return rect_id
+
+        for cx in range(cx0, cx1 + 1):
+            for cy in range(cy0, cy1 + 1):
+                self.cells.setdefault((cx, cy), []).append(rect_id)
+        return rect_id
+
+    def candidates(self, x, y, w, h, margin=0):
+        # Rect masih sedikit - scan langsung lebih murah dari lookup cell
+        if len(self.rects) <= self.MIN_INDEXED_RECTS:
+            return range(len(self.rects))
+
+        cx0, cy0, cx1, cy1 = self._cell_range(x - margin, y - margin, x + w + margin, y + h + margin)
+
+        # Query area besar - lebih murah scan semua rect (vectorized)
+        n_cells = (cx1 - cx0 + 1) * (cy1 - cy0 + 1)
+        if n_cells > self.MAX_QUERY_CELLS or n_cells > len(self.cells):
+            return range(len(self.rects))
+
+        found = set(self.oversized)
+        for cx in range(cx0, cx1 + 1):
+            for cy in range(cy0, cy1 + 1):
+                found.update(self.cells.get((cx, cy), ()))
+        return sorted(found)
+
+
+INDEX_TYPES = {
+    "grid": GridIndex,
+    "linear": LinearIndex,
+}
+
+
+def create_index(kind=None):
+    """Factory - tipe index dari Config.SPATIAL_INDEX"""
+    kind = kind or Config.SPATIAL_INDEX
+    if kind not in INDEX_TYPES:
+        raise ValueError(f"Unknown spatial index: {kind}")
+    return INDEX_TYPES[kind]()
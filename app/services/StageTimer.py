@@ -0,0 +1,116 @@
+"""
+Stage Timer
+Timer & retry counter per stage placement pipeline - cuma perf_counter + dict
+per call, jadi aman selalu nyala.
+Per request: Server-Timing header / body debug. Setelah request selesai
+di-merge ke statistik process (StageTimer.process_stats) untuk dashboard.
+"""
+import threading
+import time
+from config import Config
+
+# Urutan stage di pipeline (untuk output yang konsisten)
+STAGES = ("floor", "predict", "orientation", "clamp_to_room", "avoid_obstacles",
+          "avoid_collision", "final_obstacle_check")
+
+
+class StageTimer:
+    """Akumulasi waktu per stage & counter retry untuk 1 request"""
+
+    # Statistik process: stage -> [calls, seconds], counter -> total
+    _stage_totals = {}
+    _counter_totals = {}
+    _requests = 0
+    _lock = threading.Lock()
+
+    def __init__(self):
+        self.stages = {}
+        self.counters = {}
+        self.started = time.perf_counter()
+
+    @classmethod
+    def create(cls):
+        """Timer baru - NullTimer kalau instrumentasi dimatikan di Config"""
+        return cls() if Config.LAYOUT_STAGE_TIMING else NullTimer()
+
+    def lap(self, stage, started):
+        """Tambah (now - started) ke stage, return now (dipakai sebagai started stage berikutnya)"""
+        now = time.perf_counter()
+        entry = self.stages.get(stage)
+        if entry is None:
+            self.stages[stage] = [1, now - started]
+        else:
+            entry[0] += 1
+            entry[1] += now - started
+        return now
+
+    def count(self, name, n=1):
+        self.counters[name] = self.counters.get(name, 0) + n
+
+    def _ordered(self):
+        return sorted(self.stages.items(), key=lambda kv: STAGES.index(kv[0]) if kv[0] in STAGES else len(STAGES))
+
+    def to_dict(self):
+        return {
+            "total_ms": round((time.perf_counter() - self.started) * 1000, 3),
+            "stages": {stage: {"calls": calls, "ms": round(seconds * 1000, 3)}
+                       for stage, (calls, seconds) in self._ordered()},
+            "counters": dict(self.counters)
+        }
+
+    def server_timing(self):
+        """Nilai header Server-Timing: stage;dur=ms, counter;desc="n", total;dur=ms"""
+        parts = [f"{stage};dur={seconds * 1000:.3f}" for stage, (_, seconds) in self._ordered()]
+        parts += [f'{name};desc="{value}"' for name, value in self.counters.items()]
+        parts.append(f"total;dur={(time.perf_counter() - self.started) * 1000:.3f}")
+        return ", ".join(parts)
+
+    def record(self):
+        """Merge ke statistik process (1x per request)"""
+        with StageTimer._lock:
+            StageTimer._requests += 1
+            for stage, (calls, seconds) in self.stages.items():
+                total = StageTimer._stage_totals.setdefault(stage, [0, 0.0])
+                total[0] += calls
+                total[1] += seconds
+            for name, value in self.counters.items():
+                StageTimer._counter_totals[name] = StageTimer._counter_totals.get(name, 0) + value
+
+    @classmethod
+    def process_stats(cls):
+        """Aggregate semua request di process ini (sejak start / reset)"""
+        with cls._lock:
+            return {
+                "requests": cls._requests,
+                "stages": {stage: {"calls": calls, "total_ms": round(seconds * 1000, 3),
+                                   "avg_ms": round(seconds * 1000 / calls, 4) if calls else 0.0}
+                           for stage, (calls, seconds) in cls._stage_totals.items()},
+                "counters": dict(cls._counter_totals)
+            }
+
+    @classmethod
+    def reset_stats(cls):
+        with cls._lock:
+            cls._stage_totals, cls._counter_totals, cls._requests = {}, {}, 0
+
+
+class NullTimer:
+    """Timer no-op (Config.LAYOUT_STAGE_TIMING = False)"""
+
+    stages = {}
+    counters = {}
+
+    def lap(self, stage, started):
+        return started
+
+    def count(self, name, n=1):
+        pass
+
+    def to_dict(self):
+        return {}
+
+    def server_timing(self):
+        return ""
+
+    def record(self):
+        pass
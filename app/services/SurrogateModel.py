@@ -0,0 +1,112 @@
+"""
+Surrogate Model
+Lookup table prediksi model di grid (panjang, lebar) + bilinear interpolation
+Semua feature model diturunkan dari panjang & lebar, jadi table 2D cukup
+"""
+import time
+import numpy as np
+from config import Config
+
+
+class SurrogateModel:
+    """
+    Prediksi (x, y) dari table yang di-precompute saat model load
+    Di luar range grid -> fallback ke model asli
+    """
+
+    def __init__(self, predict_fn, panjang_range=None, lebar_range=None, step=None):
+        """
+        Args:
+            predict_fn (callable): dims (n, 2) -> array (n, 2), None kalau gagal
+            panjang_range (tuple): (min, max) panjang yang di-cover table
+            lebar_range (tuple): (min, max) lebar yang di-cover table
+            step (float): resolusi grid (cm)
+        """
+        self.predict_fn = predict_fn
+        self.step = float(step or Config.SURROGATE_STEP)
+        p0, p1 = panjang_range or Config.SURROGATE_PANJANG_RANGE
+        l0, l1 = lebar_range or Config.SURROGATE_LEBAR_RANGE
+
+        # Axis grid (ujung atas ikut masuk walau tidak pas kelipatan step)
+        self.p_axis = self._axis(p0, p1, self.step)
+        self.l_axis = self._axis(l0, l1, self.step)
+        self.table = None
+        self.report = {}
+
+    @staticmethod
+    def _axis(start, stop, step):
+        n = max(2, int(np.ceil((stop - start) / step)) + 1)
+        return start + np.arange(n) * step
+
+    def build(self):
+        """Evaluate model asli di semua titik grid (1x model call)"""
+        started = time.perf_counter()
+        pp, ll = np.meshgrid(self.p_axis, self.l_axis, indexing="ij")
+        pred = self.predict_fn(np.column_stack([pp.ravel(), ll.ravel()]))
+        if pred is None:
+            return False
+        self.table = np.asarray(pred, dtype=float).reshape(len(self.p_axis), len(self.l_axis), -1)
+        self.report = {
+            "grid_points": int(pp.size),
+            "step": self.step,
+            "panjang_range": [float(self.p_axis[0]), float(self.p_axis[-1])],
+            "lebar_range": [float(self.l_axis[0]), float(self.l_axis[-1])],
+            "build_ms": round((time.perf_counter() - started) * 1000, 2)
+        }
+        return True
+
+    def _in_range(self, dims):
+        return ((dims[:, 0] >= self.p_axis[0]) & (dims[:, 0] <= self.p_axis[-1]) &
+                (dims[:, 1] >= self.l_axis[0]) & (dims[:, 1] <= self.l_axis[-1]))
+
+    def _interpolate(self, dims):
+        """Bilinear interpolation di table (dims harus di dalam range)"""
+        fp = (dims[:, 0] - self.p_axis[0]) / self.step
+        fl = (dims[:, 1] - self.l_axis[0]) / self.step
+        i = np.clip(np.floor(fp).astype(int), 0, len(self.p_axis) - 2)
+        j = np.clip(np.floor(fl).astype(int), 0, len(self.l_axis) - 2)
+        tp = ((dims[:, 0] - self.p_axis[i]) / (self.p_axis[i + 1] - self.p_axis[i]))[:, None]
+        tl = ((dims[:, 1] - self.l_axis[j]) / (self.l_axis[j + 1] - self.l_axis[j]))[:, None]
+
+        t = self.table
+        return ((1 - tp) * (1 - tl) * t[i, j] + tp * (1 - tl) * t[i + 1, j] +
+                (1 - tp) * tl * t[i, j + 1] + tp * tl * t[i + 1, j + 1])
+
+    def predict(self, dims):
+        """Array (n, 2) prediksi - None kalau fallback model asli gagal"""
+        dims = np.asarray(dims, dtype=float).reshape(-1, 2)
+        inside = self._in_range(dims)
+        if inside.all():
+            return self._interpolate(dims)
+
+        result = np.empty((len(dims), self.table.shape[-1]))
+        result[inside] = self._interpolate(dims[inside])
+        fallback = self.predict_fn(dims[~inside])
+        if fallback is None:
+            return None
+        result[~inside] = fallback
+        return result
+
+    def validate(self, samples=None, seed=0):
+        """
+        Error vs model asli di titik random dalam range (jarak euclid, px)
+        Hasil masuk ke self.report
+        """
+        samples = samples or Config.SURROGATE_VALIDATION_SAMPLES
+        rng = np.random.default_rng(seed)
+        dims = np.column_stack([
+            rng.uniform(self.p_axis[0], self.p_axis[-1], samples),
+            rng.uniform(self.l_axis[0], self.l_axis[-1], samples)
+        ])
+        real = self.predict_fn(dims)
+        if real is None:
+            return None
+
+        error = np.linalg.norm(self._interpolate(dims) - np.asarray(real, dtype=float), axis=1)
+        self.report.update({
+            "validation_samples": int(samples),
+            "max_error": round(float(error.max()), 3),
+            "mean_error": round(float(error.mean()), 3),
+            "p95_error": round(float(np.percentile(error, 95)), 3)
+        })
+        return self.report
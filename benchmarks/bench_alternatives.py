@@ -0,0 +1,58 @@
+"""
+Benchmark: top-k layout alternatif dalam 1 request vs k request terpisah
+Preprocessing floor & model inference di-share, variant di-place di LayoutPool.
+
+Usage:
+    python benchmarks/bench_alternatives.py [--k 3,5,10] [--items 40] [--obstacles 30] [--repeat 10]
+"""
+import argparse
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.services.LayoutPool import LayoutPool
+from app.services.LayoutService import LayoutService
+from app.services.ModelRegistry import ModelRegistry
+from bench_predict_batch import FEATURE_COLS, make_cart, stand_in_bundle, timed
+
+
+def make_floor(n_obstacles, seed=0):
+    rnd = random.Random(seed)
+    return {"rooms": [{"x": 60, "y": 60, "width": 680, "height": 680}],
+            "obstacles": [{"x": rnd.randint(60, 700), "y": rnd.randint(60, 700),
+                           "width": rnd.randint(10, 60), "height": rnd.randint(10, 60)}
+                          for _ in range(n_obstacles)]}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--k", default="3,5,10")
+    parser.add_argument("--items", type=int, default=40)
+    parser.add_argument("--obstacles", type=int, default=30)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    bundle = ModelRegistry.get()
+    if bundle.model is None or len(bundle.feature_cols or []) != len(FEATURE_COLS):
+        print("Model .pkl tidak cocok/tidak ada - pakai stand-in XGBoost model\n")
+        bundle = stand_in_bundle()
+    service = LayoutService(bundle)
+    cart, floor = make_cart(args.items), make_floor(args.obstacles)
+    LayoutPool.start()
+
+    print(f"workers: {LayoutPool.worker_count()}, items: {args.items}, obstacles: {args.obstacles}\n")
+    print(f"{'k':>4} {'distinct':>9} {'1 request ms':>13} {'k requests ms':>14} {'speedup':>8}")
+    for k in [int(s) for s in args.k.split(",")]:
+        ranked = service.predict_alternatives(cart, "living_room", floor, k)
+        shared_ms = timed(lambda: service.predict_alternatives(cart, "living_room", floor, k), args.repeat)
+        separate_ms = timed(lambda: [service.predict_batch(cart, "living_room", floor) for _ in range(k)],
+                            args.repeat)
+        print(f"{k:>4} {len(ranked):>9} {shared_ms:>13.2f} {separate_ms:>14.2f} {separate_ms / shared_ms:>7.2f}x")
+    LayoutPool.shutdown()
+
+
+if __name__ == "__main__":
+    main()
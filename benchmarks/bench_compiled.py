@@ -0,0 +1,59 @@
+"""
+Benchmark: compiled NumPy tree evaluator vs model.predict
+Parity check (max abs diff) dan latency per batch size.
+
+Usage:
+    python benchmarks/bench_compiled.py [--sizes 1,10,100,1000] [--repeat 50]
+"""
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import numpy as np
+import pandas as pd
+
+from app.services.CompiledModel import CompiledModel
+from app.services.LayoutService import LayoutService
+from app.services.ModelRegistry import ModelRegistry
+from bench_predict_batch import FEATURE_COLS, stand_in_bundle, timed
+
+PARITY_TOL = 1e-3
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", default="1,10,100,1000")
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    bundle = ModelRegistry.get()
+    if bundle.model is None or len(bundle.feature_cols or []) != len(FEATURE_COLS):
+        print("Model .pkl tidak cocok/tidak ada - pakai stand-in XGBoost model\n")
+        bundle = stand_in_bundle()
+    model = bundle.model
+    compiled = CompiledModel.compile(model)
+    assert compiled is not None, f"{type(model).__name__} tidak bisa di-compile"
+    print(f"{compiled.source}: {compiled.n_trees} trees, max depth {compiled.max_depth}\n")
+
+    # Parity: termasuk dims di luar range training
+    rng = np.random.default_rng(0)
+    features = LayoutService._build_features(rng.uniform(1, 1000, size=(5000, 2)))
+    expected = np.asarray(model.predict(features), dtype=float).reshape(len(features), -1)
+    diff = float(np.abs(compiled.predict(features) - expected).max())
+    print(f"parity: max abs diff {diff:.6f} over {len(features)} samples")
+    assert diff <= PARITY_TOL, "compiled model mismatch"
+
+    print(f"\n{'batch':>6} {'DataFrame ms':>13} {'ndarray ms':>11} {'compiled ms':>12} {'speedup':>8}")
+    for n in [int(s) for s in args.sizes.split(",")]:
+        X = features[:n]
+        frame_ms = timed(lambda: model.predict(pd.DataFrame(X, columns=FEATURE_COLS)), args.repeat)
+        array_ms = timed(lambda: model.predict(X), args.repeat)
+        compiled_ms = timed(lambda: compiled.predict(X), args.repeat)
+        print(f"{n:>6} {frame_ms:>13.3f} {array_ms:>11.3f} {compiled_ms:>12.3f} {frame_ms / compiled_ms:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
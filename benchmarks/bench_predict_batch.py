@@ -0,0 +1,92 @@
+"""
+Benchmark: latency predict_batch vs ukuran cart
+Bandingkan inference per-item (cara lama, 1 DataFrame + 1 model call per item)
+dengan batched inference (1 feature matrix + 1 model call per cart).
+
+Usage:
+    python benchmarks/bench_predict_batch.py [--repeat 20] [--sizes 1,10,30,60,120,250]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import numpy as np
+import pandas as pd
+
+from app.services.LayoutService import LayoutService
+from app.services.ModelRegistry import ModelBundle, ModelRegistry
+
+FEATURE_COLS = ['panjang', 'lebar', 'area', 'aspect_ratio', 'perimeter',
+                'diagonal', 'log_area', 'log_panjang', 'log_lebar']
+
+
+def stand_in_bundle():
+    """Model pengganti (XGBoost kecil) kalau model .pkl tidak tersedia"""
+    import xgboost as xgb
+
+    rng = np.random.default_rng(0)
+    dims = rng.uniform(30, 300, size=(1000, 2))
+    X = LayoutService._build_features(dims)
+    y = np.column_stack([60 + dims[:, 0] * 1.5, 60 + dims[:, 1] * 2.0]) + rng.normal(0, 20, (1000, 2))
+    model = xgb.XGBRegressor(n_estimators=200, max_depth=6).fit(pd.DataFrame(X, columns=FEATURE_COLS), y)
+    return ModelBundle(model, FEATURE_COLS, {}, "stand-in", time.time(), 0.0)
+
+
+def make_cart(n, seed=0):
+    rnd = random.Random(seed)
+    return [{"id": i, "name": f"Item {i}",
+             "panjang": rnd.randint(40, 260), "lebar": rnd.randint(40, 120)} for i in range(n)]
+
+
+def legacy_predict(service, panjang, lebar):
+    """Cara lama: 1 DataFrame 1 baris + 1 model call per item"""
+    features = pd.DataFrame(service._build_features([(panjang, lebar)]), columns=service.feature_cols)
+    pred = service.model.predict(features)[0]
+    return float(pred[0]), float(pred[1])
+
+
+def timed(fn, repeat):
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    return float(np.median(samples))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--sizes", default="1,10,30,60,120,250")
+    args = parser.parse_args()
+
+    bundle = ModelRegistry.get()
+    if bundle.model is None or len(bundle.feature_cols or []) != len(FEATURE_COLS):
+        print("Model .pkl tidak cocok/tidak ada - pakai stand-in XGBoost model\n")
+        bundle = stand_in_bundle()
+    service = LayoutService(bundle)
+    floor = {"rooms": [{"x": 60, "y": 60, "width": 680, "height": 680}],
+             "obstacles": [{"x": 360, "y": 360, "width": 80, "height": 80}]}
+
+    print(f"{'items':>6} {'per-item ms':>12} {'batched ms':>11} {'speedup':>8} {'predict_batch ms':>17}")
+    for n in [int(s) for s in args.sizes.split(",")]:
+        cart = make_cart(n)
+        dims = [(float(i["panjang"]), float(i["lebar"])) for i in cart]
+
+        # Parity: hasil batched harus sama dengan per-item
+        per_item = [legacy_predict(service, p, l) for p, l in dims]
+        batched = service._predict_all(dims, None)
+        assert np.allclose(per_item, batched, atol=1e-4), "batched inference mismatch"
+
+        legacy_ms = timed(lambda: [legacy_predict(service, p, l) for p, l in dims], args.repeat)
+        batched_ms = timed(lambda: service._predict_all(dims, None), args.repeat)
+        total_ms = timed(lambda: service.predict_batch(cart, "living_room", floor), args.repeat)
+        print(f"{n:>6} {legacy_ms:>12.2f} {batched_ms:>11.2f} {legacy_ms / batched_ms:>7.1f}x {total_ms:>17.2f}")
+
+
+if __name__ == "__main__":
+    main()
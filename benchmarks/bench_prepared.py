@@ -0,0 +1,155 @@
+"""
+Benchmark: text query vs server-side prepared statement (StatementCache)
+Query hot BaseModel (by id, FAQ aktif, social media aktif, news published) di
+temporary table dengan shape yang sama, 1 koneksi, text protocol vs prepared.
+Butuh MySQL (Config.DB_HOST / DB_USER / DB_NAME).
+
+Selisih per query ~ biaya parse + plan di server (prepared: cuma execute)
+ditambah encoding parameter di client. Counter session MySQL
+(Com_stmt_prepare / Com_stmt_execute) dicetak untuk memastikan statement
+benar-benar di-prepare sekali.
+
+Usage:
+    python benchmarks/bench_prepared.py [--repeat 2000] [--rows 500]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import numpy as np
+
+from config import Config
+from database.connection import Database
+from database.statement_cache import StatementCache
+
+# (nama, query, params per iterasi)
+QUERIES = [
+    ("find_by_id", "SELECT * FROM bench_news WHERE id = %s", lambda i, rows: (i % rows + 1,)),
+    ("active_faqs", """
+        SELECT id, category, question, answer, display_order
+        FROM bench_faqs
+        WHERE is_active = 1
+        ORDER BY category, display_order ASC
+    """, lambda i, rows: ()),
+    ("active_social_media", """
+        SELECT * FROM bench_social_media
+        WHERE is_active = 1
+        ORDER BY display_order ASC
+    """, lambda i, rows: ()),
+    ("published_news", """
+        SELECT id, title, excerpt, content, image, category, author,
+               DATE_FORMAT(date, '%Y-%m-%d') as date, published
+        FROM bench_news
+        WHERE published = TRUE
+        ORDER BY date DESC
+        LIMIT 20
+    """, lambda i, rows: ()),
+]
+
+
+def create_tables(conn, rows):
+    """Temporary table (hilang saat koneksi ditutup) dengan kolom seperti tabel asli"""
+    cursor = conn.cursor()
+    cursor.execute("""
+        CREATE TEMPORARY TABLE bench_news (
+          id INT AUTO_INCREMENT PRIMARY KEY, title VARCHAR(255), excerpt TEXT, content TEXT,
+          image VARCHAR(255), category VARCHAR(100), author VARCHAR(100), date DATETIME,
+          published BOOLEAN DEFAULT TRUE, KEY (published, date))
+    """)
+    cursor.execute("""
+        CREATE TEMPORARY TABLE bench_faqs (
+          id INT AUTO_INCREMENT PRIMARY KEY, category VARCHAR(100), question TEXT, answer TEXT,
+          display_order INT, is_active BOOLEAN DEFAULT TRUE)
+    """)
+    cursor.execute("""
+        CREATE TEMPORARY TABLE bench_social_media (
+          id INT AUTO_INCREMENT PRIMARY KEY, platform VARCHAR(50), platform_name VARCHAR(100),
+          url VARCHAR(255), icon VARCHAR(100), display_order INT, is_active BOOLEAN DEFAULT TRUE)
+    """)
+    cursor.executemany(
+        "INSERT INTO bench_news (title, excerpt, content, image, category, author, date, published) "
+        "VALUES (%s, %s, %s, %s, %s, %s, NOW() - INTERVAL %s DAY, %s)",
+        [(f"News {i}", "excerpt " * 10, "content " * 100, f"news{i}.jpg", "umum", "admin", i, i % 4 != 0)
+         for i in range(rows)])
+    cursor.executemany(
+        "INSERT INTO bench_faqs (category, question, answer, display_order, is_active) VALUES (%s, %s, %s, %s, %s)",
+        [(f"cat{i % 5}", f"Question {i}?", "answer " * 20, i, i % 3 != 0) for i in range(40)])
+    cursor.executemany(
+        "INSERT INTO bench_social_media (platform, platform_name, url, icon, display_order, is_active) "
+        "VALUES (%s, %s, %s, %s, %s, %s)",
+        [(f"p{i}", f"Platform {i}", f"https://example.com/{i}", "icon", i, i % 2 == 0) for i in range(8)])
+    conn.commit()
+    cursor.close()
+
+
+def session_status(conn):
+    cursor = conn.cursor()
+    cursor.execute("SHOW SESSION STATUS WHERE Variable_name IN ('Com_stmt_prepare', 'Com_stmt_execute', 'Questions')")
+    status = {name: int(value) for name, value in cursor.fetchall()}
+    cursor.close()
+    return status
+
+
+def run_text(conn, query, params_for, repeat, rows):
+    samples = []
+    for i in range(repeat):
+        started = time.perf_counter()
+        cursor = conn.cursor(dictionary=True)
+        cursor.execute(query, params_for(i, rows))
+        cursor.fetchall()
+        cursor.close()
+        samples.append((time.perf_counter() - started) * 1e6)
+    return samples
+
+
+def run_prepared(statements, query, params_for, repeat, rows):
+    samples = []
+    for i in range(repeat):
+        started = time.perf_counter()
+        cursor = statements.cursor(query)
+        cursor.execute(query, params_for(i, rows))
+        cursor.fetchall()
+        samples.append((time.perf_counter() - started) * 1e6)
+    return samples
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=2000)
+    parser.add_argument("--rows", type=int, default=500)
+    args = parser.parse_args()
+
+    try:
+        conn = Database.connect(Config.DB_NAME)
+    except Exception as e:
+        print(f"MySQL tidak tersedia ({Config.DB_HOST}): {e}")
+        sys.exit(1)
+
+    create_tables(conn, args.rows)
+    statements = StatementCache(conn)
+    print(f"server: {conn.get_server_info()}, repeat: {args.repeat}, rows: {args.rows}\n")
+    print(f"{'query':>20} {'text us':>9} {'prepared us':>12} {'saved us':>9} {'speedup':>8} "
+          f"{'prepares':>9} {'executes':>9}")
+    for name, query, params_for in QUERIES:
+        # Warm up (buffer pool, statement pertama di-prepare)
+        run_text(conn, query, params_for, 20, args.rows)
+        run_prepared(statements, query, params_for, 20, args.rows)
+
+        text = np.median(run_text(conn, query, params_for, args.repeat, args.rows))
+        before = session_status(conn)
+        prepared = np.median(run_prepared(statements, query, params_for, args.repeat, args.rows))
+        after = session_status(conn)
+        print(f"{name:>20} {text:>9.1f} {prepared:>12.1f} {text - prepared:>9.1f} {text / prepared:>7.2f}x "
+              f"{after['Com_stmt_prepare'] - before['Com_stmt_prepare']:>9} "
+              f"{after['Com_stmt_execute'] - before['Com_stmt_execute']:>9}")
+
+    print(f"\nstatement cache: {StatementCache.stats()}")
+    statements.close()
+    conn.close()
+
+
+if __name__ == "__main__":
+    main()
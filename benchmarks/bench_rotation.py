@@ -0,0 +1,122 @@
+"""
+Benchmark: rotation-aware placement vs orientasi tetap (rotation 0)
+Floor sempit (koridor, banyak kolom): porsi item yang masuk spiral search, item valid
+(di dalam room, tidak overlap fisik), sisa overlap / obstacle area, latency.
+
+Usage:
+    python benchmarks/bench_rotation.py [--items 30] [--repeat 10] [--seeds 5]
+"""
+import argparse
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import numpy as np
+
+from config import Config
+from app.services.LayoutOptimizer import LayoutOptimizer
+from app.services.LayoutService import LayoutService
+from app.services.ModelRegistry import ModelRegistry
+from app.services.PlacementContext import PlacementContext
+from app.services.SpatialIndex import rects_overlap
+from bench_predict_batch import FEATURE_COLS, make_cart, stand_in_bundle, timed
+
+
+def corridor_floor(seed):
+    """Room panjang & sempit - item panjang cuma muat kalau diputar"""
+    rnd = random.Random(seed)
+    return {"rooms": [{"x": 60, "y": 60, "width": 240, "height": 680}],
+            "obstacles": [{"x": rnd.randint(60, 280), "y": rnd.randint(60, 720), "width": 20, "height": 20}
+                          for _ in range(1)]}
+
+
+def pillar_floor(seed):
+    """Room besar dengan banyak kolom"""
+    rnd = random.Random(seed)
+    return {"rooms": [{"x": 60, "y": 60, "width": 680, "height": 680}],
+            "obstacles": [{"x": rnd.randint(60, 720), "y": rnd.randint(60, 720), "width": 30, "height": 30}
+                          for _ in range(12)]}
+
+
+class SpiralCounter:
+    """Hitung item yang masuk spiral search (posisi awal collision stage tidak bebas)"""
+
+    def __init__(self):
+        self.calls = 0
+        self.moved = 0
+        self._avoid_collision = LayoutService._avoid_collision
+
+    def __enter__(self):
+        counter = self
+
+        def avoid_collision(service, x, y, w, h, *args, **kwargs):
+            result = counter._avoid_collision(service, x, y, w, h, *args, **kwargs)
+            counter.calls += 1
+            counter.moved += result != (x, y, w, h)
+            return result
+
+        LayoutService._avoid_collision = avoid_collision
+        return self
+
+    def __exit__(self, *exc):
+        LayoutService._avoid_collision = self._avoid_collision
+
+
+def evaluate(service, cart, floor):
+    """(porsi item yang masuk spiral, item valid, overlap area, obstacle area, jumlah item diputar)"""
+    with SpiralCounter() as counter:
+        results = service.predict_batch(cart, "living_room", floor)
+
+    ctx = PlacementContext.from_floor(floor)
+    valid = 0
+    for idx, r in enumerate(results):
+        rect = (r["posisi_x"], r["posisi_y"], r["panjang"], r["lebar"])
+        others = [(o["posisi_x"], o["posisi_y"], o["panjang"], o["lebar"]) for o in results if o is not r]
+        room = ctx.best_room
+        inside = room["x"] <= rect[0] and rect[0] + rect[2] <= room["x"] + room["width"] and \
+            room["y"] <= rect[1] and rect[1] + rect[3] <= room["y"] + room["height"]
+        # Valid = di dalam room & tidak overlap fisik (tanpa padding / margin)
+        if inside and all(not rects_overlap(*rect, other) for other in others) and \
+                ctx.first_obstacle(*rect, 0) is None:
+            valid += 1
+
+    optimizer = LayoutOptimizer([(r["panjang"], r["lebar"]) for r in results],
+                                [(r["posisi_x"], r["posisi_y"]) for r in results], context=ctx)
+    _, breakdown = optimizer.score([r["posisi_x"] for r in results], [r["posisi_y"] for r in results])
+    rotated = sum(1 for r in results if r["rotation"])
+    return counter.moved / max(counter.calls, 1), valid, breakdown["overlap"], breakdown["obstacle"], rotated
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--items", type=int, default=15)
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--seeds", type=int, default=5)
+    args = parser.parse_args()
+
+    bundle = ModelRegistry.get()
+    if bundle.model is None or len(bundle.feature_cols or []) != len(FEATURE_COLS):
+        print("Model .pkl tidak cocok/tidak ada - pakai stand-in XGBoost model\n")
+        bundle = stand_in_bundle()
+    service = LayoutService(bundle)
+
+    print(f"{'floor':>9} {'rotation':>9} {'spiral %':>9} {'valid':>6} {'overlap':>10} "
+          f"{'obstacle':>9} {'rotated':>8} {'ms':>7}")
+    for name, make_floor in (("corridor", corridor_floor), ("pillars", pillar_floor)):
+        for enabled in (False, True):
+            Config.LAYOUT_ROTATION = enabled
+            rows, ms = [], []
+            for seed in range(args.seeds):
+                cart, floor = make_cart(args.items, seed), make_floor(seed)
+                rows.append(evaluate(service, cart, floor))
+                ms.append(timed(lambda: service.predict_batch(cart, "living_room", floor), args.repeat))
+            steps, valid, overlap, obstacle, rotated = np.mean(rows, axis=0)
+            print(f"{name:>9} {'on' if enabled else 'off':>9} {steps * 100:>9.0f} {valid:>6.1f} {overlap:>10.0f} "
+                  f"{obstacle:>9.0f} {rotated:>8.1f} {np.mean(ms):>7.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Benchmark: time-to-first-item streaming vs full predict_batch
+TTFI = waktu sampai item pertama keluar dari iter_placements (dan
+baris NDJSON pertama via /api/layout/predict), dibanding total latency.
+
+Usage:
+    python benchmarks/bench_streaming.py [--repeat 10] [--sizes 10,60,250,1000]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import numpy as np
+from flask import Flask
+
+from config import Config
+from app.services.LayoutService import LayoutService
+from app.services.ModelRegistry import ModelRegistry
+from bench_predict_batch import FEATURE_COLS, make_cart, stand_in_bundle
+from routes.api import api
+
+FLOOR = {"rooms": [{"x": 60, "y": 60, "width": 680, "height": 680}],
+         "obstacles": [{"x": 360, "y": 360, "width": 80, "height": 80}]}
+
+
+def first_and_total(start_stream):
+    """(ms sampai item pertama, ms sampai selesai)"""
+    started = time.perf_counter()
+    iterator = iter(start_stream())
+    next(iterator)
+    first = time.perf_counter() - started
+    for _ in iterator:
+        pass
+    return first * 1000, (time.perf_counter() - started) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--sizes", default="10,60,250,1000")
+    args = parser.parse_args()
+
+    bundle = ModelRegistry.get()
+    if bundle.model is None or len(bundle.feature_cols or []) != len(FEATURE_COLS):
+        print("Model .pkl tidak cocok/tidak ada - pakai stand-in XGBoost model\n")
+        bundle = stand_in_bundle()
+    ModelRegistry._bundle = bundle
+    service = LayoutService.shared()
+    Config.LAYOUT_CACHE_ENABLED = False
+
+    app = Flask(__name__)
+    app.register_blueprint(api)
+    client = app.test_client()
+
+    print(f"{'items':>6} {'TTFI ms':>8} {'total ms':>9} {'HTTP TTFI ms':>13} {'HTTP total ms':>14}")
+    for n in [int(s) for s in args.sizes.split(",")]:
+        cart = make_cart(n)
+        local = [first_and_total(lambda: service.iter_placements(cart, "living_room", FLOOR))
+                 for _ in range(args.repeat)]
+
+        def post():
+            response = client.post("/api/layout/predict", json={"items": cart, "floor_data": FLOOR},
+                                   headers={"Accept": "application/x-ndjson"}, buffered=False)
+            return response.response
+
+        http = [first_and_total(post) for _ in range(args.repeat)]
+
+        ttfi, total = np.median(local, axis=0)
+        http_ttfi, http_total = np.median(http, axis=0)
+        print(f"{n:>6} {ttfi:>8.2f} {total:>9.2f} {http_ttfi:>13.2f} {http_total:>14.2f}")
+
+
+if __name__ == "__main__":
+    main()
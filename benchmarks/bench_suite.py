@@ -0,0 +1,259 @@
+"""
+Benchmark suite: layout engine (predict_batch & auto_place_all_furniture)
+Floor & cart dari seeded generator, output JSON supaya bisa dibandingkan antar commit.
+
+Per case: latency p50/p95/p99, peak memory (tracemalloc), spiral search
+(item yang posisi awalnya collision), success rate (item valid: di dalam room,
+tidak overlap furniture lain / obstacle / tangga).
+
+Usage:
+    python benchmarks/bench_suite.py [--sizes 10,50,200,500,2000] [--floors 5] [--repeat 10]
+                                     [--output benchmarks/results/suite.json] [--compare old.json]
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import numpy as np
+
+from config import Config
+from app.services.LayoutService import LayoutService
+from app.services.ModelRegistry import ModelRegistry
+from bench_predict_batch import FEATURE_COLS, stand_in_bundle
+from generators import make_cart, make_catalog, make_floor
+
+DEFAULT_OUTPUT = os.path.join(os.path.dirname(__file__), "results", "suite.json")
+
+
+class SpiralCounter:
+    """Hitung collision stage (_avoid_collision) & berapa yang masuk spiral search"""
+
+    def __init__(self):
+        self.calls = 0
+        self.spirals = 0
+        self._avoid_collision = LayoutService._avoid_collision
+
+    def __enter__(self):
+        counter = self
+
+        def avoid_collision(service, x, y, w, h, *args, **kwargs):
+            result = counter._avoid_collision(service, x, y, w, h, *args, **kwargs)
+            counter.calls += 1
+            counter.spirals += tuple(result) != (x, y, w, h)
+            return result
+
+        LayoutService._avoid_collision = avoid_collision
+        return self
+
+    def __exit__(self, *exc):
+        LayoutService._avoid_collision = self._avoid_collision
+
+
+def valid_placements(results, floor):
+    """Jumlah item di dalam salah satu room & tidak overlap furniture / obstacle / tangga"""
+    if not results:
+        return 0
+    rects = np.array([(r["posisi_x"], r["posisi_y"], r["panjang"], r["lebar"]) for r in results], dtype=float)
+    x0, y0 = rects[:, 0], rects[:, 1]
+    x1, y1 = x0 + rects[:, 2], y0 + rects[:, 3]
+
+    inside = np.zeros(len(rects), dtype=bool)
+    for room in floor.get("rooms", []):
+        inside |= ((x0 >= room["x"]) & (y0 >= room["y"]) &
+                   (x1 <= room["x"] + room["width"]) & (y1 <= room["y"] + room["height"]))
+
+    def overlaps(ax0, ay0, ax1, ay1, bx0, by0, bx1, by1):
+        return ((ax0[:, None] < bx1) & (bx0 < ax1[:, None]) &
+                (ay0[:, None] < by1) & (by0 < ay1[:, None]))
+
+    furniture = overlaps(x0, y0, x1, y1, x0, y0, x1, y1)
+    np.fill_diagonal(furniture, False)
+    blocked = furniture.any(axis=1)
+
+    fixed = floor.get("obstacles", []) + floor.get("stairs", [])
+    if fixed:
+        ox0 = np.array([o["x"] for o in fixed], dtype=float)
+        oy0 = np.array([o["y"] for o in fixed], dtype=float)
+        ox1 = ox0 + np.array([o["width"] for o in fixed])
+        oy1 = oy0 + np.array([o["height"] for o in fixed])
+        blocked |= overlaps(x0, y0, x1, y1, ox0, oy0, ox1, oy1).any(axis=1)
+
+    return int((inside & ~blocked).sum())
+
+
+def percentiles(samples):
+    p50, p95, p99 = np.percentile(samples, [50, 95, 99])
+    return {"p50_ms": round(float(p50), 3), "p95_ms": round(float(p95), 3), "p99_ms": round(float(p99), 3),
+            "mean_ms": round(float(np.mean(samples)), 3), "runs": len(samples)}
+
+
+def peak_memory(fn):
+    """Peak alokasi Python/NumPy (MB) selama 1x fn()"""
+    tracemalloc.start()
+    try:
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return round(peak / 1024 / 1024, 3)
+
+
+def timed_runs(fn, repeat, max_seconds):
+    """Latency per run (ms) - berhenti lebih awal kalau budget waktu case habis (min 3 run)"""
+    samples, deadline = [], time.perf_counter() + max_seconds
+    for i in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1000)
+        if i >= 2 and time.perf_counter() > deadline:
+            break
+    return samples
+
+
+def bench_predict_batch(service, n, floors, repeat, max_seconds):
+    samples, spirals, calls, valid = [], 0, 0, 0
+    per_floor = max_seconds / len(floors)
+    for seed, floor in enumerate(floors):
+        cart = make_cart(n, seed)
+        with SpiralCounter() as counter:
+            results = service.predict_batch(cart, "living_room", floor)
+        spirals, calls = spirals + counter.spirals, calls + counter.calls
+        valid += valid_placements(results, floor)
+        samples += timed_runs(lambda: service.predict_batch(cart, "living_room", floor), repeat, per_floor)
+
+    cart = make_cart(n, 0)
+    return {
+        "bench": "predict_batch", "items": n, "floors": len(floors),
+        **percentiles(samples),
+        "peak_memory_mb": peak_memory(lambda: service.predict_batch(cart, "living_room", floors[0])),
+        "spiral_searches": spirals,
+        "spiral_per_item": round(spirals / max(calls, 1), 4),
+        "success_rate": round(valid / (n * len(floors)), 4)
+    }
+
+
+def bench_auto_place(n, seeds, repeat, max_seconds):
+    samples, placed, total = [], 0, 0
+    load_catalog = LayoutService._load_catalog
+    try:
+        for seed in range(seeds):
+            catalog = make_catalog(n, seed)
+            LayoutService._load_catalog = staticmethod(lambda catalog=catalog: catalog)
+            with contextlib.redirect_stdout(io.StringIO()):
+                result = LayoutService.auto_place_all_furniture()
+                placed, total = placed + result["placed_count"], total + result["total_items"]
+                samples += timed_runs(LayoutService.auto_place_all_furniture, repeat, max_seconds / seeds)
+
+        LayoutService._load_catalog = staticmethod(lambda: make_catalog(n, 0))
+        with contextlib.redirect_stdout(io.StringIO()):
+            memory = peak_memory(LayoutService.auto_place_all_furniture)
+    finally:
+        LayoutService._load_catalog = load_catalog
+
+    return {
+        "bench": "auto_place_all_furniture", "items": n, "floors": seeds,
+        **percentiles(samples),
+        "peak_memory_mb": memory,
+        "spiral_searches": None,
+        "spiral_per_item": None,
+        "success_rate": round(placed / max(total, 1), 4)
+    }
+
+
+def git_commit():
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], stderr=subprocess.DEVNULL,
+                                       cwd=os.path.dirname(os.path.abspath(__file__))).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results, baseline_path):
+    """Print delta vs hasil run lain (file JSON output suite ini)"""
+    with open(baseline_path) as f:
+        baseline = {(r["bench"], r["items"]): r for r in json.load(f)["results"]}
+
+    print(f"\nvs {baseline_path}")
+    print(f"{'bench':>25} {'items':>6} {'p50':>9} {'p95':>9} {'p99':>9} {'memory':>9} {'success':>9}")
+    for r in results:
+        old = baseline.get((r["bench"], r["items"]))
+        if old is None:
+            continue
+
+        def delta(key):
+            return f"{(r[key] / old[key] - 1) * 100:+8.1f}%" if old[key] else f"{'-':>9}"
+        print(f"{r['bench']:>25} {r['items']:>6} {delta('p50_ms')} {delta('p95_ms')} {delta('p99_ms')} "
+              f"{delta('peak_memory_mb')} {(r['success_rate'] - old['success_rate']) * 100:+8.1f}p")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", default="10,50,200,500,2000")
+    parser.add_argument("--floors", type=int, default=5)
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--max-seconds", type=float, default=20, help="budget waktu per case")
+    parser.add_argument("--skip-auto-place", action="store_true")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT)
+    parser.add_argument("--compare", default=None, help="JSON hasil run sebelumnya")
+    args = parser.parse_args()
+
+    bundle = ModelRegistry.get()
+    if bundle.model is None or len(bundle.feature_cols or []) != len(FEATURE_COLS):
+        print("Model .pkl tidak cocok/tidak ada - pakai stand-in XGBoost model\n")
+        bundle = stand_in_bundle()
+    ModelRegistry._bundle = bundle  # auto_place cek model dari registry
+    service = LayoutService(bundle)
+    floors = [make_floor(seed) for seed in range(args.floors)]
+    sizes = [int(s) for s in args.sizes.split(",")]
+
+    results = []
+    print(f"{'bench':>25} {'items':>6} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'peak MB':>8} "
+          f"{'spiral/item':>12} {'success':>8}")
+    for n in sizes:
+        cases = [lambda: bench_predict_batch(service, n, floors, args.repeat, args.max_seconds)]
+        if not args.skip_auto_place:
+            cases.append(lambda: bench_auto_place(n, args.floors, args.repeat, args.max_seconds))
+        for case in cases:
+            r = case()
+            results.append(r)
+            spiral = "-" if r["spiral_per_item"] is None else f"{r['spiral_per_item']:.3f}"
+            print(f"{r['bench']:>25} {r['items']:>6} {r['p50_ms']:>9.2f} {r['p95_ms']:>9.2f} {r['p99_ms']:>9.2f} "
+                  f"{r['peak_memory_mb']:>8.2f} {spiral:>12} {r['success_rate'] * 100:>7.1f}%")
+
+    report = {
+        "meta": {
+            "commit": git_commit(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "cpu_count": os.cpu_count(),
+            "model": bundle.version,
+            "floors": args.floors,
+            "repeat": args.repeat,
+            "config": {key: getattr(Config, key) for key in
+                       ("SPATIAL_INDEX", "OCCUPANCY_GRID", "COMPILED_INFERENCE", "LAYOUT_INFERENCE",
+                        "LAYOUT_ROTATION")}
+        },
+        "results": results
+    }
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"\nSaved: {args.output}")
+
+    if args.compare:
+        compare(results, args.compare)
+
+
+if __name__ == "__main__":
+    main()
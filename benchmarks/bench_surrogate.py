@@ -0,0 +1,58 @@
+"""
+Benchmark: surrogate lookup table vs model asli
+Error interpolasi (max / mean / p95, px) dan latency per resolusi grid.
+
+Usage:
+    python benchmarks/bench_surrogate.py [--steps 2,5,10,20] [--items 120] [--repeat 50]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import numpy as np
+
+from app.services.LayoutService import LayoutService
+from app.services.ModelRegistry import ModelRegistry
+from app.services.SurrogateModel import SurrogateModel
+from bench_predict_batch import FEATURE_COLS, make_cart, stand_in_bundle, timed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--steps", default="2,5,10,20")
+    parser.add_argument("--items", type=int, default=120)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    bundle = ModelRegistry.get()
+    if bundle.model is None or len(bundle.feature_cols or []) != len(FEATURE_COLS):
+        print("Model .pkl tidak cocok/tidak ada - pakai stand-in XGBoost model\n")
+        bundle = stand_in_bundle()
+    service = LayoutService(bundle)
+    dims = np.array([(i["panjang"], i["lebar"]) for i in make_cart(args.items)], dtype=float)
+
+    model_ms = timed(lambda: service._model_array(dims), args.repeat)
+    print(f"model .pkl: {model_ms:.3f} ms / {args.items} items\n")
+
+    print(f"{'step':>5} {'points':>7} {'build ms':>9} {'max err':>8} {'mean err':>9} "
+          f"{'p95 err':>8} {'lookup ms':>10} {'speedup':>8}")
+    for step in [float(s) for s in args.steps.split(",")]:
+        surrogate = SurrogateModel(service._model_array, step=step)
+        surrogate.build()
+        report = surrogate.validate()
+        lookup_ms = timed(lambda: surrogate.predict(dims), args.repeat)
+        print(f"{step:>5g} {report['grid_points']:>7} {report['build_ms']:>9.1f} "
+              f"{report['max_error']:>8.2f} {report['mean_error']:>9.2f} {report['p95_error']:>8.2f} "
+              f"{lookup_ms:>10.3f} {model_ms / lookup_ms:>7.1f}x")
+
+    # Di luar range grid harus sama persis dengan model asli
+    outside = np.array([[5.0, 5.0], [900.0, 50.0]])
+    assert np.allclose(surrogate.predict(outside), service._model_array(outside)), "fallback mismatch"
+
+
+if __name__ == "__main__":
+    main()
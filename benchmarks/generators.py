@@ -0,0 +1,114 @@
+"""
+Seeded generator untuk benchmark layout engine
+Floor (rooms, stairs, obstacles) dalam shape floor_data yang dikirim LayoutApp,
+cart furniture dari catalog LayoutApp, dan catalog untuk auto place.
+Seed sama -> data sama persis (bisa dibandingkan antar commit).
+"""
+import random
+
+CANVAS = 800
+
+# Catalog furniture LayoutApp (cm, 1 cm = 1 px di canvas)
+FURNITURE = [
+    {"nama": "SOFA 3 Seat", "panjang": 260, "lebar": 100, "category": "living"},
+    {"nama": "SOFA 1 Seat Besar", "panjang": 115, "lebar": 100, "category": "living"},
+    {"nama": "SOFA 1 Seat Kecil", "panjang": 94, "lebar": 80, "category": "living"},
+    {"nama": "Meja Lingkaran Besar", "panjang": 98, "lebar": 98, "category": "living"},
+    {"nama": "Meja Lingkaran Kecil", "panjang": 50, "lebar": 50, "category": "living"},
+    {"nama": "Kursi Kayu", "panjang": 98, "lebar": 100, "category": "living"},
+    {"nama": "Pas Bunga Small", "panjang": 36, "lebar": 36, "category": "decoration"},
+    {"nama": "Pas Bunga Medium", "panjang": 43, "lebar": 43, "category": "decoration"},
+    {"nama": "Pas Bunga Large", "panjang": 60, "lebar": 60, "category": "decoration"},
+    {"nama": "Stand Lukisan", "panjang": 82, "lebar": 72, "category": "decoration"},
+    {"nama": "Lukisan Kecil", "panjang": 60, "lebar": 80, "category": "living"},
+    {"nama": "Lukisan Besar", "panjang": 425, "lebar": 180, "category": "living"},
+    {"nama": "Meja Makan", "panjang": 240, "lebar": 100, "category": "dining"},
+    {"nama": "Kursi Makan", "panjang": 46, "lebar": 75, "category": "dining"},
+    {"nama": "Kursi Pantai", "panjang": 80, "lebar": 200, "category": "outdoor"},
+]
+
+# Bobot pemilihan item (kursi makan paling banyak di cart asli)
+FURNITURE_WEIGHTS = [4, 2, 2, 3, 1, 3, 1, 1, 1, 3, 3, 1, 4, 24, 6]
+
+ROOM_TYPES = ("living", "office", "bedroom")
+STAIR_DIRECTIONS = ("up", "down")
+
+
+def make_floor(seed, n_rooms=None, n_stairs=None, n_columns=None, n_walls=None):
+    """
+    Floor plan random: canvas dibagi jadi 1-3 room (split vertikal/horizontal),
+    tangga, kolom & dinding internal - format sama dengan defaultFloors LayoutApp
+    """
+    rnd = random.Random(seed)
+    n_rooms = n_rooms if n_rooms is not None else rnd.randint(1, 3)
+    n_stairs = n_stairs if n_stairs is not None else rnd.randint(1, 3)
+    n_columns = n_columns if n_columns is not None else rnd.randint(0, 6)
+    n_walls = n_walls if n_walls is not None else rnd.randint(0, 2)
+
+    # Room: split area canvas secara rekursif (room terbesar dibelah)
+    areas = [(60, 50, CANVAS - 120, CANVAS - 100)]
+    while len(areas) < n_rooms:
+        x, y, w, h = areas.pop(max(range(len(areas)), key=lambda i: areas[i][2] * areas[i][3]))
+        gap = 20
+        if w >= h:
+            cut = int(w * rnd.uniform(0.35, 0.65))
+            areas += [(x, y, cut - gap // 2, h), (x + cut + gap // 2, y, w - cut - gap // 2, h)]
+        else:
+            cut = int(h * rnd.uniform(0.35, 0.65))
+            areas += [(x, y, w, cut - gap // 2), (x, y + cut + gap // 2, w, h - cut - gap // 2)]
+    rooms = [{"name": f"Room {i + 1}", "type": rnd.choice(ROOM_TYPES),
+              "x": x, "y": y, "width": w, "height": h}
+             for i, (x, y, w, h) in enumerate(areas)]
+
+    def inside(w, h):
+        room = rnd.choice(rooms)
+        return (rnd.randint(room["x"], max(room["x"], room["x"] + room["width"] - w)),
+                rnd.randint(room["y"], max(room["y"], room["y"] + room["height"] - h)))
+
+    stairs = []
+    for i in range(n_stairs):
+        w, h = rnd.choice([(80, 140), (100, 80), (140, 80), (120, 80)])
+        x, y = inside(w, h)
+        stairs.append({"name": f"Tangga {i + 1}", "x": x, "y": y, "width": w, "height": h,
+                       "direction": rnd.choice(STAIR_DIRECTIONS)})
+
+    obstacles = []
+    for i in range(n_columns):
+        size = rnd.randint(15, 22)
+        x, y = inside(size, size)
+        obstacles.append({"name": f"Column {i + 1}", "x": x, "y": y, "width": size, "height": size})
+    for i in range(n_walls):
+        length = rnd.randint(150, 420)
+        w, h = (length, 12) if rnd.random() < 0.5 else (12, length)
+        x, y = inside(w, h)
+        obstacles.append({"name": f"Internal Wall {i + 1}", "x": x, "y": y, "width": w, "height": h})
+
+    return {"name": f"Floor {seed}", "rooms": rooms, "stairs": stairs, "obstacles": obstacles}
+
+
+def make_cart(n, seed=0):
+    """Cart n item dari catalog LayoutApp (format item predict_batch)"""
+    rnd = random.Random(seed)
+    picks = rnd.choices(range(len(FURNITURE)), weights=FURNITURE_WEIGHTS, k=n)
+    return [{"id": i, "uid": f"{FURNITURE[p]['nama']}-{i}", "name": FURNITURE[p]["nama"], **FURNITURE[p]}
+            for i, p in enumerate(picks)]
+
+
+def make_catalog(n, seed=0):
+    """
+    Catalog auto place (format LayoutService._load_catalog, meter) dengan total
+    quantity n - zone dari category, priority urut zone
+    """
+    from app.services.LayoutService import ZONE_PRIORITY
+
+    rnd = random.Random(seed)
+    counts = {}
+    for p in rnd.choices(range(len(FURNITURE)), weights=FURNITURE_WEIGHTS, k=n):
+        counts[p] = counts.get(p, 0) + 1
+    return [{"nama": FURNITURE[p]["nama"],
+             "panjang": FURNITURE[p]["panjang"] / 100,
+             "lebar": FURNITURE[p]["lebar"] / 100,
+             "zone": FURNITURE[p]["category"],
+             "quantity": quantity,
+             "priority": ZONE_PRIORITY[FURNITURE[p]["category"]]}
+            for p, quantity in sorted(counts.items())]
@@ -9,7 +9,8 @@ class Config:
 
     # Flask settings
     SECRET_KEY = os.environ.get('SECRET_KEY') or 'dev-secret-key-change-in-production'
-    DEBUG = False
+    # Debug mode (Werkzeug debugger + reloader) cuma kalau FLASK_DEBUG=1
+    DEBUG = os.environ.get('FLASK_DEBUG', '').lower() in ('1', 'true', 'yes')
     TESTING = False
 
     # Model paths
@@ -17,6 +18,21 @@ class Config:
     MODEL_PATH = os.path.join(BASE_DIR, 'app', 'services', 'model_auto_layout (8).pkl')
     FEATURE_COLS_PATH = os.path.join(BASE_DIR, 'app', 'services', 'feature_columns (7).pkl')
     METADATA_PATH = os.path.join(BASE_DIR, 'app', 'services', 'model_metadata (6).pkl')
+    MODEL_HOT_RELOAD = True  # Watch model files & reload otomatis
+    MODEL_WATCH_INTERVAL = 2.0  # seconds
+
+    # Compiled inference: tree ensemble di-export ke NumPy arrays (tanpa pandas/XGBoost predict)
+    COMPILED_INFERENCE = True
+    COMPILED_PARITY_TOL = 0.01  # px - max selisih vs model.predict saat load
+    COMPILED_MAX_BATCH = 64  # Batch lebih besar pakai model.predict (lebih cepat)
+
+    # Inference mode: "model" (model .pkl) atau "surrogate" (lookup table + interpolation)
+    LAYOUT_INFERENCE = "model"
+    SURROGATE_PANJANG_RANGE = (20, 400)  # cm
+    SURROGATE_LEBAR_RANGE = (20, 300)  # cm
+    SURROGATE_STEP = 5  # cm per grid cell
+    SURROGATE_VALIDATION_SAMPLES = 2000
+    SURROGATE_MAX_ERROR = 25  # px - lebih dari ini surrogate tidak dipakai
 
     # Upload settings
     UPLOAD_FOLDER = os.path.join(BASE_DIR, 'static', 'uploads')
@@ -31,6 +47,25 @@ class Config:
     DB_NAME = "virtualtour1"
     DB_PORT = 3306
 
+    # Connection pool (per database, per process)
+    DB_POOL_ENABLED = True
+    DB_POOL_SIZE = 10  # max koneksi terbuka
+    DB_POOL_PREWARM = 2  # koneksi dibuka saat app start
+    DB_POOL_TIMEOUT = 5  # seconds - tunggu koneksi kosong sebelum error
+    DB_POOL_MAX_LIFETIME = 1800  # seconds - koneksi lebih tua ditutup (di bawah wait_timeout MySQL)
+    DB_POOL_PING_AFTER = 5  # seconds idle sebelum koneksi di-ping saat checkout
+    DB_PREPARED_STATEMENTS = True  # BaseModel query lewat server-side prepared statement
+    DB_STATEMENT_CACHE_SIZE = 64  # prepared statement per koneksi (LRU)
+
+    # Unit of work: 1 koneksi untuk semua model call dalam 1 request
+    DB_UNIT_OF_WORK = True
+    # Request dengan method ini = 1 transaksi (commit di akhir request, rollback kalau error / status >= 400)
+    DB_TRANSACTION_METHODS = ("POST", "PUT", "PATCH", "DELETE")
+
+    # List endpoint (keyset pagination: ?limit=&cursor=, response next_cursor)
+    PAGE_SIZE_DEFAULT = 50
+    PAGE_SIZE_MAX = 200
+
     # Database settings - Hosting MySQL - Backup
     # DB_HOST = "virtualign.my.id"
     # DB_USER = "virtuali_virtualuser"
@@ -52,8 +87,53 @@ class Config:
     MARGIN = 50  # Canvas margin for furniture placement
 
     # Collision detection
-    COLLISION_PADDING = 20
+    COLLISION_PADDING = 25  # Jarak antar furniture (spiral search & optimizer)
+    OBSTACLE_MARGIN = 50  # Safety margin di sekitar obstacle (pintu, dll)
+    ROOM_PADDING = 15  # Jarak furniture ke dinding room
     MAX_COLLISION_ATTEMPTS = 50
+    SPATIAL_INDEX = "grid"  # "grid" atau "linear" (brute force)
+    SPATIAL_GRID_CELL = 100  # Ukuran cell grid index (px)
+    OCCUPANCY_GRID = False  # Raster + summed-area table untuk free-rect query (opt-in)
+    OCCUPANCY_RESOLUTION = 10  # px per cell
+
+    # Layout result cache (LRU + TTL)
+    LAYOUT_CACHE_ENABLED = True
+    LAYOUT_CACHE_SIZE = 256  # max entries
+    LAYOUT_CACHE_TTL = 600  # seconds
+
+    # Multi-floor layout (process pool)
+    LAYOUT_POOL_WORKERS = 0  # 0 = min(4, cpu_count)
+    LAYOUT_POOL_START_METHOD = "spawn"  # spawn aman dengan thread (model watcher) di parent
+    LAYOUT_POOL_PREWARM = True  # Spawn worker saat app start
+
+    # Anytime optimizer (simulated annealing, restart paralel di layout pool)
+    LAYOUT_OPTIMIZER_RESTARTS = 0  # 0 = 1 restart per pool worker
+    LAYOUT_OPTIMIZER_MAX_BUDGET_MS = 5000
+
+    # Rotation-aware placement (cek orientasi 0 / 90 per item)
+    LAYOUT_ROTATION = True
+
+    # Top-k layout alternatif (predict "alternatives": k)
+    LAYOUT_ALTERNATIVES_MAX = 10
+    LAYOUT_ALTERNATIVES_OVERSAMPLE = 2  # Kandidat = k x oversample, ambil k terbaik
+    LAYOUT_ALTERNATIVES_MAX_ATTEMPTS = 8  # Maksimal k x ini seed kalau kandidat unik masih kurang dari k
+    LAYOUT_ALTERNATIVE_JITTER = 40  # px, std dev jitter prediksi per variant
+
+    # Timing per stage pipeline (Server-Timing header, /api/layout/stats)
+    LAYOUT_STAGE_TIMING = True
+
+    # Metrics (/api/metrics, Prometheus text format)
+    METRICS_ENABLED = True
+    # Directory bersama untuk aggregate semua worker (kosong = process ini saja)
+    METRICS_DIR = os.environ.get('METRICS_DIR')
+    METRICS_FLUSH_INTERVAL = 1.0  # seconds - snapshot worker ke METRICS_DIR
+
+    # Async layout jobs (submit / poll)
+    LAYOUT_JOB_EXECUTOR = "thread"  # "thread" atau "process"
+    LAYOUT_JOB_WORKERS = 2
+    LAYOUT_JOB_TTL = 600  # seconds - hasil disimpan selama ini setelah selesai
+    LAYOUT_JOB_MAX_PENDING = 100
+    LAYOUT_JOB_MAX_WAIT = 30  # seconds - batas long-poll
 
     # API settings
     API_RATE_LIMIT = "100 per hour"
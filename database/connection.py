@@ -2,15 +2,30 @@
 Database Connection Manager
 Mengelola koneksi ke MySQL database
 """
+import threading
 import mysql.connector
 from config import Config
+from database.pool import ConnectionPool
 
 class Database:
     """Database connection singleton"""
     
+    _pools = {}  # database name -> ConnectionPool
+    _pools_lock = threading.Lock()
+    
     @staticmethod
     def get_connection(database=None):
-        """Get MySQL connection"""
+        """
+        Get MySQL connection - dari pool kalau database di-set (DB_POOL_ENABLED)
+        conn.close() mengembalikan koneksi ke pool
+        """
+        if database and Config.DB_POOL_ENABLED:
+            return Database.pool(database).acquire()
+        return Database.connect(database)
+    
+    @staticmethod
+    def connect(database=None):
+        """Koneksi MySQL baru (tanpa pool)"""
         cfg = {
             "host": Config.DB_HOST,
             "user": Config.DB_USER,
@@ -21,6 +36,29 @@ class Database:
             cfg["database"] = database
         return mysql.connector.connect(**cfg)
     
+    @classmethod
+    def pool(cls, database=None):
+        """Pool untuk database (dibuat saat pertama dipakai)"""
+        database = database or Config.DB_NAME
+        pool = cls._pools.get(database)
+        if pool is None:
+            with cls._pools_lock:
+                pool = cls._pools.get(database)
+                if pool is None:
+                    pool = ConnectionPool(lambda: Database.connect(database), name=database)
+                    cls._pools[database] = pool
+        return pool
+    
+    @classmethod
+    def prewarm(cls):
+        """Buka DB_POOL_PREWARM koneksi sebelum traffic masuk - return jumlah koneksi idle"""
+        return cls.pool(Config.DB_NAME).prewarm()
+    
+    @classmethod
+    def pool_stats(cls):
+        """Statistik semua pool (process ini)"""
+        return [pool.stats() for pool in list(cls._pools.values())]
+    
     @staticmethod
     def init_database():
         """Initialize database and tables"""
@@ -62,7 +100,8 @@ class Database:
           category VARCHAR(100),
           author VARCHAR(100),
           date DATETIME,
-          published BOOLEAN DEFAULT TRUE
+          published BOOLEAN DEFAULT TRUE,
+          INDEX idx_news_date (date)
         ) CHARACTER SET = utf8mb4;
         """)
         
@@ -88,7 +127,9 @@ class Database:
           status VARCHAR(20) DEFAULT 'pending',
           created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
           answered_at DATETIME,
-          answered_by VARCHAR(255)
+          answered_by VARCHAR(255),
+          INDEX idx_questions_created (created_at),
+          INDEX idx_pending_q (status, created_at)
         ) CHARACTER SET = utf8mb4;
         """)
         
@@ -0,0 +1,73 @@
+"""
+Instrumented Connection
+Wrapper connection/cursor MySQL yang mencatat jumlah & latency query per model class
+"""
+import time
+from app.services.Metrics import Metrics
+
+
+def _operation(query):
+    """SELECT / INSERT / UPDATE / ... (kata pertama query)"""
+    words = str(query).split(None, 1)
+    return words[0].upper() if words else "UNKNOWN"
+
+
+class InstrumentedCursor:
+    """Cursor proxy - execute/executemany diukur, sisanya diteruskan"""
+    
+    def __init__(self, cursor, model):
+        self._cursor = cursor
+        self._model = model
+    
+    def _timed(self, method, query, *args, **kwargs):
+        started = time.perf_counter()
+        status = "error"
+        try:
+            result = method(query, *args, **kwargs)
+            status = "ok"
+            return result
+        finally:
+            Metrics.inc("db_queries_total", model=self._model, operation=_operation(query), status=status)
+            Metrics.observe("db_query_duration_seconds", time.perf_counter() - started, model=self._model)
+    
+    def execute(self, query, *args, **kwargs):
+        return self._timed(self._cursor.execute, query, *args, **kwargs)
+    
+    def executemany(self, query, *args, **kwargs):
+        return self._timed(self._cursor.executemany, query, *args, **kwargs)
+    
+    def __iter__(self):
+        return iter(self._cursor)
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        self._cursor.close()
+    
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+
+class InstrumentedConnection:
+    """Connection proxy - cursor() return InstrumentedCursor dengan label model"""
+    
+    def __init__(self, connection, model):
+        self._connection = connection
+        self._model = model
+    
+    def cursor(self, *args, **kwargs):
+        return InstrumentedCursor(self._connection.cursor(*args, **kwargs), self._model)
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        self._connection.close()
+    
+    def __getattr__(self, name):
+        attr = getattr(self._connection, name)
+        if name == "prepared":
+            # Prepared cursor dari cache koneksi pool (cuma ada kalau koneksi dari pool)
+            return lambda query: InstrumentedCursor(attr(query), self._model)
+        return attr
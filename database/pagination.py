@@ -0,0 +1,99 @@
+"""
+Keyset Pagination
+Halaman list lewat cursor (nilai kolom urutan row terakhir), bukan OFFSET:
+query halaman ke-n = index range scan mulai dari posisi cursor, biayanya sama
+dengan halaman pertama. Row yang masuk / dihapus di antara 2 request tidak
+membuat row lain terlewat atau muncul 2x.
+
+Urutan selalu DESC di semua key, key terakhir harus unik (id) sebagai tie-breaker.
+Key nullable (NULL di MySQL paling akhir untuk DESC) harus disebut di nullable -
+branch IS NULL cuma dibuat untuk key itu, key lain tetap murni range di index.
+"""
+import base64
+import binascii
+import json
+from datetime import date, datetime
+from decimal import Decimal
+
+from config import Config
+
+
+def page_size(limit=None, default=None):
+    """Ukuran halaman dari ?limit= (default PAGE_SIZE_DEFAULT, maksimal PAGE_SIZE_MAX)"""
+    if not limit or limit < 1:
+        limit = default or Config.PAGE_SIZE_DEFAULT
+    return min(limit, Config.PAGE_SIZE_MAX)
+
+
+def _encode_value(value):
+    if isinstance(value, datetime):
+        return {"dt": value.isoformat()}
+    if isinstance(value, date):
+        return {"d": value.isoformat()}
+    if isinstance(value, Decimal):
+        return {"n": str(value)}
+    return value
+
+
+def _decode_value(value):
+    if not isinstance(value, dict):
+        return value
+    if "dt" in value:
+        return datetime.fromisoformat(value["dt"])
+    if "d" in value:
+        return date.fromisoformat(value["d"])
+    if "n" in value:
+        return Decimal(value["n"])
+    raise ValueError("Invalid cursor")
+
+
+def encode_cursor(values):
+    """Nilai key row terakhir -> token opaque (urlsafe base64, tanpa padding)"""
+    payload = json.dumps([_encode_value(value) for value in values], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(token, size):
+    """
+    Token -> list nilai key
+    Raises:
+        ValueError: token rusak / bukan dari endpoint dengan jumlah key yang sama
+    """
+    try:
+        payload = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        values = [_decode_value(value) for value in json.loads(payload)]
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError, KeyError):
+        raise ValueError("Invalid cursor")
+    if len(values) != size:
+        raise ValueError("Invalid cursor")
+    return values
+
+
+def keyset_condition(keys, values, nullable=()):
+    """
+    WHERE untuk row setelah cursor pada ORDER BY keys DESC:
+    k1 <= v1 AND ((k1 < v1) OR (k1 = v1 AND k2 < v2) OR ...)
+    Key di nullable: row NULL (urutan paling akhir) ikut setelah semua nilai non-NULL
+    Returns: (sql, params)
+    """
+    terms, params = [], []
+    for i, (key, value) in enumerate(zip(keys, values)):
+        if value is None:
+            continue  # Tidak ada yang lebih "kecil" dari NULL untuk DESC (kecuali di key berikutnya)
+        prefix, prefix_params = [], []
+        for prev_key, prev_value in zip(keys[:i], values[:i]):
+            if prev_value is None:
+                prefix.append(f"{prev_key} IS NULL")
+            else:
+                prefix.append(f"{prev_key} = %s")
+                prefix_params.append(prev_value)
+        less = f"({key} < %s OR {key} IS NULL)" if key in nullable else f"{key} < %s"
+        terms.append("(" + " AND ".join(prefix + [less]) + ")")
+        params += prefix_params + [value]
+    if not terms:
+        return "1 = 0", []  # Cursor di row paling akhir
+    condition = "(" + " OR ".join(terms) + ")"
+    if values[0] is not None and keys[0] not in nullable:
+        # Batas atas key pertama terpisah dari OR - optimizer langsung dapat range index
+        return f"{keys[0]} <= %s AND {condition}", [values[0]] + params
+    return condition, params
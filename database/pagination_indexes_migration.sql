@@ -0,0 +1,21 @@
+-- Migration: Index untuk keyset pagination list endpoint
+-- Date: 2026-10-16
+-- Purpose: ORDER BY <waktu> DESC, id DESC + cursor = index range scan,
+--          biaya tiap halaman sama (tanpa filesort / OFFSET scan).
+-- InnoDB secondary index sudah menyimpan primary key (id) di belakang key,
+-- jadi index (created_at) efektif = (created_at, id).
+-- Jalankan sekali; index yang sudah ada akan error "Duplicate key name" (aman di-skip).
+
+ALTER TABLE news ADD INDEX idx_news_date (date);
+
+ALTER TABLE questions ADD INDEX idx_questions_created (created_at);
+
+-- Segment pending (Question.get_all): WHERE status = 'pending' ORDER BY created_at DESC
+ALTER TABLE questions ADD INDEX idx_pending_q (status, created_at);
+
+ALTER TABLE contact_messages ADD INDEX idx_contact_created (created_at);
+
+ALTER TABLE house_layouts
+    ADD INDEX idx_hl_created (created_at),
+    ADD INDEX idx_hl_public_created (is_public, created_at),
+    ADD INDEX idx_hl_user_created (user_id, created_at);
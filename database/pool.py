@@ -0,0 +1,260 @@
+"""
+Connection Pool
+Pool koneksi MySQL per database - koneksi dipakai ulang antar query
+(handshake TCP + auth cuma saat koneksi dibuat)
+
+conn.close() dari model tidak menutup koneksi, tapi mengembalikan ke pool.
+Checkout: koneksi yang sudah lama idle di-ping dulu, yang melewati max
+lifetime dibuang. Setelah fork, pool di child mulai kosong (socket parent
+tidak pernah dipakai bersama).
+"""
+import os
+import threading
+import time
+from collections import deque
+
+import mysql.connector
+from mysql.connector.errors import PoolError
+from config import Config
+from database.statement_cache import StatementCache
+
+
+class PooledConnection:
+    """Lease 1 koneksi dari pool - close() = kembali ke pool, sisanya diteruskan"""
+
+    def __init__(self, pool, entry):
+        self._pool = pool
+        self._entry = entry
+
+    @property
+    def connection(self):
+        if self._entry is None:
+            raise PoolError("Connection already returned to pool")
+        return self._entry.connection
+
+    def prepared(self, query):
+        """Prepared cursor dari cache koneksi fisik ini (tetap ada antar checkout)"""
+        entry = self._entry
+        if entry is None:
+            raise PoolError("Connection already returned to pool")
+        if entry.statements is None:
+            entry.statements = StatementCache(entry.connection)
+        return entry.statements.cursor(query)
+
+    def discard_prepared(self, query):
+        if self._entry is not None and self._entry.statements is not None:
+            self._entry.statements.discard(query)
+
+    def close(self):
+        if self._entry is not None:
+            entry, self._entry = self._entry, None
+            self._pool.release(entry)
+
+    def __del__(self):
+        # Lease yang tidak di-close (exception sebelum conn.close()) tetap kembali ke pool
+        try:
+            self.close()
+        except Exception:
+            pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __getattr__(self, name):
+        return getattr(self.connection, name)
+
+
+class _Entry:
+    """Koneksi fisik + umur & waktu terakhir dipakai"""
+
+    __slots__ = ("connection", "created_at", "last_used", "pid", "statements")
+
+    def __init__(self, connection):
+        self.connection = connection
+        self.statements = None  # StatementCache, dibuat saat prepared statement pertama
+        self.created_at = self.last_used = time.monotonic()
+        self.pid = os.getpid()
+
+
+class ConnectionPool:
+    """Pool thread-safe dengan ukuran tetap (koneksi dibuat lazy sampai size)"""
+
+    _pools = []  # Semua pool (reset setelah fork)
+
+    def __init__(self, connect, size=None, timeout=None, max_lifetime=None, ping_after=None, name="default"):
+        """
+        Args:
+            connect (callable): buat 1 koneksi baru
+            size (int): maksimal koneksi terbuka
+            timeout (float): detik menunggu koneksi kosong sebelum PoolError
+            max_lifetime (float): detik - koneksi lebih tua dari ini ditutup saat kembali / checkout
+            ping_after (float): detik idle sebelum checkout di-ping dulu
+        """
+        self.name = name
+        self._connect = connect
+        self.size = size or Config.DB_POOL_SIZE
+        self.timeout = timeout if timeout is not None else Config.DB_POOL_TIMEOUT
+        self.max_lifetime = max_lifetime if max_lifetime is not None else Config.DB_POOL_MAX_LIFETIME
+        self.ping_after = ping_after if ping_after is not None else Config.DB_POOL_PING_AFTER
+        self._reset_state()
+        ConnectionPool._pools.append(self)
+
+    def _reset_state(self):
+        self._idle = deque()
+        self._cond = threading.Condition(threading.Lock())
+        self._open = 0
+        self._waiting = 0
+        self._pid = os.getpid()
+        self._stats = {"checkouts": 0, "created": 0, "recycled": 0, "ping_failures": 0,
+                       "timeouts": 0, "wait_seconds": 0.0}
+
+    # ========== CHECKOUT / RELEASE ==========
+
+    def acquire(self, timeout=None):
+        """Koneksi sehat dari pool (atau koneksi baru kalau pool belum penuh)"""
+        if self._pid != os.getpid():
+            self._after_fork()
+
+        timeout = self.timeout if timeout is None else timeout
+        deadline = time.monotonic() + timeout
+        waited = 0.0
+        while True:
+            entry, create = None, False
+            with self._cond:
+                while not self._idle and self._open >= self.size:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self._stats["timeouts"] += 1
+                        raise PoolError(f"Connection pool '{self.name}' exhausted "
+                                        f"({self.size} connections, waited {timeout}s)")
+                    started = time.monotonic()
+                    self._waiting += 1
+                    self._cond.wait(remaining)
+                    self._waiting -= 1
+                    waited += time.monotonic() - started
+                if self._idle:
+                    entry = self._idle.pop()  # LIFO - koneksi paling baru dipakai (paling mungkin masih hidup)
+                else:
+                    self._open += 1
+                    create = True
+
+            if create:
+                entry = self._create()
+            elif not self._healthy(entry):
+                self._discard(entry)
+                continue
+
+            with self._cond:
+                self._stats["checkouts"] += 1
+                self._stats["wait_seconds"] += waited
+            entry.last_used = time.monotonic()
+            return PooledConnection(self, entry)
+
+    def release(self, entry):
+        """Kembalikan koneksi (dipanggil dari PooledConnection.close)"""
+        if entry.pid != os.getpid():
+            return  # Koneksi milik parent process - jangan disentuh
+        if time.monotonic() - entry.created_at > self.max_lifetime:
+            self._count("recycled")
+            self._discard(entry)
+            return
+        try:
+            if entry.connection.in_transaction:
+                entry.connection.rollback()  # Transaksi yang tidak di-commit tidak ikut ke peminjam berikutnya
+        except mysql.connector.Error:
+            self._discard(entry)
+            return
+
+        entry.last_used = time.monotonic()
+        with self._cond:
+            self._idle.append(entry)
+            self._cond.notify()
+
+    def _create(self):
+        try:
+            entry = _Entry(self._connect())
+        except Exception:
+            with self._cond:
+                self._open -= 1
+                self._cond.notify()
+            raise
+        self._count("created")
+        return entry
+
+    def _healthy(self, entry):
+        """Cek lifetime, lalu ping kalau sudah idle lebih lama dari ping_after"""
+        now = time.monotonic()
+        if now - entry.created_at > self.max_lifetime:
+            self._count("recycled")
+            return False
+        if now - entry.last_used < self.ping_after:
+            return True
+        try:
+            entry.connection.ping(reconnect=False)
+            return True
+        except mysql.connector.Error:
+            self._count("ping_failures")
+            return False
+
+    def _count(self, key, value=1):
+        with self._cond:
+            self._stats[key] += value
+
+    def _discard(self, entry):
+        try:
+            entry.connection.close()
+        except Exception:
+            pass
+        with self._cond:
+            self._open -= 1
+            self._cond.notify()
+
+    # ========== LIFECYCLE ==========
+
+    def prewarm(self, count=None):
+        """Buka koneksi di depan (saat app start) - return jumlah koneksi idle"""
+        count = min(self.size, count if count is not None else Config.DB_POOL_PREWARM)
+        leases = []
+        try:
+            for _ in range(count):
+                leases.append(self.acquire())
+        finally:
+            for lease in leases:
+                lease.close()
+        return len(self._idle)
+
+    def close_all(self):
+        """Tutup semua koneksi idle (mis. sebelum shutdown)"""
+        with self._cond:
+            idle, self._idle = list(self._idle), deque()
+        for entry in idle:
+            self._discard(entry)
+
+    def _after_fork(self):
+        """Child process: lupakan koneksi parent (tanpa close - socket masih dipakai parent)"""
+        self._reset_state()
+
+    @classmethod
+    def _reset_all_after_fork(cls):
+        for pool in cls._pools:
+            pool._after_fork()
+
+    def stats(self):
+        with self._cond:
+            return {
+                "name": self.name,
+                "size": self.size,
+                "open": self._open,
+                "idle": len(self._idle),
+                "in_use": self._open - len(self._idle),
+                "waiting": self._waiting,
+                **{key: round(value, 4) if isinstance(value, float) else value
+                   for key, value in self._stats.items()}
+            }
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=ConnectionPool._reset_all_after_fork)
@@ -0,0 +1,91 @@
+"""
+Statement Cache
+Prepared statement server-side per koneksi pool (LRU, DB_STATEMENT_CACHE_SIZE)
+Query yang sama di koneksi yang sama cuma di-parse MySQL 1x (COM_STMT_PREPARE),
+berikutnya cukup COM_STMT_EXECUTE dengan parameter binary.
+"""
+import threading
+from collections import OrderedDict
+
+from mysql.connector.constants import FieldType
+from config import Config
+
+
+def text_rows(cursor, rows):
+    """
+    Samakan hasil binary protocol dengan text protocol: kolom JSON dikirim
+    sebagai bytes (charset binary) - decode ke str seperti cursor biasa
+    """
+    json_columns = [column[0] for column in cursor.description or () if column[1] == FieldType.JSON]
+    if not json_columns:
+        return rows
+    for row in rows:
+        for name in json_columns:
+            if isinstance(row.get(name), (bytes, bytearray)):
+                row[name] = row[name].decode("utf-8")
+    return rows
+
+
+class StatementCache:
+    """LRU query -> prepared cursor untuk 1 koneksi fisik (tidak di-share antar thread)"""
+
+    # Statistik semua koneksi di process ini
+    _totals = {"hits": 0, "misses": 0, "evictions": 0}
+    _lock = threading.Lock()
+
+    def __init__(self, connection, max_size=None):
+        self._connection = connection
+        self.max_size = max_size or Config.DB_STATEMENT_CACHE_SIZE
+        self._cursors = OrderedDict()
+
+    def __len__(self):
+        return len(self._cursors)
+
+    def cursor(self, query):
+        """Prepared cursor (dictionary) untuk query - statement di-prepare saat execute pertama"""
+        cursor = self._cursors.get(query)
+        if cursor is not None:
+            self._cursors.move_to_end(query)
+            self._count("hits")
+            return cursor
+
+        self._count("misses")
+        cursor = self._connection.cursor(prepared=True, dictionary=True)
+        self._cursors[query] = cursor
+        while len(self._cursors) > self.max_size:
+            _, evicted = self._cursors.popitem(last=False)
+            self._close(evicted)  # COM_STMT_CLOSE - statement di server ikut dibuang
+            self._count("evictions")
+        return cursor
+
+    def discard(self, query):
+        """Buang statement (mis. error / perlu re-prepare setelah ALTER TABLE)"""
+        cursor = self._cursors.pop(query, None)
+        if cursor is not None:
+            self._close(cursor)
+
+    def close(self):
+        for cursor in self._cursors.values():
+            self._close(cursor)
+        self._cursors.clear()
+
+    @staticmethod
+    def _close(cursor):
+        try:
+            cursor.close()
+        except Exception:
+            pass
+
+    @classmethod
+    def _count(cls, key):
+        with cls._lock:
+            cls._totals[key] += 1
+
+    @classmethod
+    def stats(cls):
+        with cls._lock:
+            lookups = cls._totals["hits"] + cls._totals["misses"]
+            return {
+                **cls._totals,
+                "hit_rate": round(cls._totals["hits"] / lookups, 4) if lookups else 0.0
+            }
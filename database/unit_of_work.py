@@ -0,0 +1,131 @@
+"""
+Unit of Work
+1 koneksi (dari pool) untuk semua model call dalam 1 request, disimpan di flask.g
+Request write (DB_TRANSACTION_METHODS) dibungkus 1 transaksi:
+commit di teardown kalau response sukses, rollback kalau error / status >= 400
+"""
+from flask import g, has_request_context, jsonify, request
+from config import Config
+from database.connection import Database
+
+
+class SharedConnection:
+    """
+    Koneksi request untuk model - close() diabaikan (ditutup di teardown),
+    commit() ditunda ke akhir request kalau transactional
+    """
+
+    def __init__(self, unit_of_work, connection):
+        self._unit_of_work = unit_of_work
+        self._connection = connection
+
+    def cursor(self, *args, **kwargs):
+        # Buffered: hasil query langsung dibaca semua, model call berikutnya
+        # di koneksi yang sama tidak kena "Unread result found"
+        kwargs.setdefault("buffered", True)
+        return self._connection.cursor(*args, **kwargs)
+
+    def commit(self):
+        if not self._unit_of_work.transactional:
+            self._connection.commit()
+
+    def rollback(self):
+        if self._unit_of_work.transactional:
+            self._unit_of_work.failed = True  # Seluruh transaksi request di-rollback di teardown
+        else:
+            self._connection.rollback()
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        pass
+
+    def __getattr__(self, name):
+        return getattr(self._connection, name)
+
+
+class UnitOfWork:
+    """State koneksi & transaksi 1 request"""
+
+    def __init__(self, transactional=False, database=None):
+        self.transactional = transactional
+        self.database = database or Config.DB_NAME
+        self.failed = False
+        self.queries = 0  # Jumlah model call yang pakai koneksi ini
+        self._connection = None
+        self._shared = None
+
+    @staticmethod
+    def current():
+        """Unit of work request ini, None di luar request (thread job, script)"""
+        if not has_request_context():
+            return None
+        return g.get("unit_of_work")
+
+    def connection(self):
+        """Koneksi request (checkout dari pool saat model call pertama)"""
+        if self._connection is None:
+            self._connection = Database.get_connection(self.database)
+            self._shared = SharedConnection(self, self._connection)
+            if self.transactional:
+                self._connection.start_transaction()
+        self.queries += 1
+        return self._shared
+
+    def finish(self, success=True):
+        """Commit / rollback lalu kembalikan koneksi ke pool"""
+        connection, self._connection, self._shared = self._connection, None, None
+        if connection is None:
+            return
+        try:
+            if self.transactional:
+                if success and not self.failed:
+                    connection.commit()
+                else:
+                    connection.rollback()
+        finally:
+            connection.close()
+
+    # ========== REQUEST HOOKS ==========
+
+    @staticmethod
+    def before_request():
+        if Config.DB_UNIT_OF_WORK:
+            g.unit_of_work = UnitOfWork(transactional=request.method in Config.DB_TRANSACTION_METHODS)
+
+    @staticmethod
+    def after_request(response):
+        """
+        Commit sebelum response dikirim - commit gagal masih bisa jadi 500
+        (streaming response: commit setelah stream selesai, di teardown)
+        """
+        unit_of_work = g.get("unit_of_work")
+        if unit_of_work is None:
+            return response
+        if response.status_code >= 400:
+            unit_of_work.failed = True
+        if response.is_streamed:
+            return response
+
+        g.pop("unit_of_work")
+        try:
+            unit_of_work.finish()
+        except Exception as e:
+            print(f"Unit of work commit error: {e}")
+            response = jsonify({
+                "status": "error",
+                "message": str(e)
+            })
+            response.status_code = 500
+        return response
+
+    @staticmethod
+    def teardown_request(exc=None):
+        """Dipanggil juga kalau handler raise / setelah streaming response selesai"""
+        unit_of_work = g.pop("unit_of_work", None)
+        if unit_of_work is not None:
+            unit_of_work.finish(success=exc is None)
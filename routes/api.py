@@ -3,6 +3,7 @@ API Routes
 Define all API routes
 """
 from flask import Blueprint
+from config import Config
 from app.controllers import (
     NewsController,
     CMSController,
@@ -16,10 +17,27 @@ from app.controllers.ContactController import ContactController
 from app.controllers.HouseLayoutController import HouseLayoutController
 from app.controllers.SocialMediaController import SocialMediaController
 from app.controllers.HouseTypeController import HouseTypeController
+from app.controllers.MetricsController import MetricsController
+from database.unit_of_work import UnitOfWork
 
 # Create blueprint
 api = Blueprint('api', __name__, url_prefix='/api')
 
+# ===== METRICS =====
+api.before_request(MetricsController.before_request)
+api.after_request(MetricsController.after_request)
+api.teardown_request(MetricsController.teardown_request)
+
+# ===== UNIT OF WORK (1 koneksi DB per request, write request = 1 transaksi) =====
+api.before_request(UnitOfWork.before_request)
+api.after_request(UnitOfWork.after_request)
+api.teardown_request(UnitOfWork.teardown_request)
+
+@api.route('/metrics', methods=['GET'])
+def metrics():
+    """Prometheus scrape endpoint"""
+    return MetricsController.metrics()
+
 # ===== STATUS =====
 @api.route('/status', methods=['GET'])
 def status():
@@ -30,6 +48,19 @@ def status():
         "version": "2.0.0"
     })
 
+@api.route('/db/pool', methods=['GET'])
+def db_pool_stats():
+    """Connection pool statistics (process ini)"""
+    from flask import jsonify
+    from database.connection import Database
+    from database.statement_cache import StatementCache
+    return jsonify({
+        "status": "success",
+        "enabled": Config.DB_POOL_ENABLED,
+        "pools": Database.pool_stats(),
+        "prepared_statements": StatementCache.stats()
+    })
+
 # ===== NEWS ROUTES =====
 @api.route('/news', methods=['GET'])
 def get_news():
@@ -140,6 +171,22 @@ def admin_login():
 def predict_layout():
     return LayoutController.predict_batch()
 
+@api.route('/layout/update', methods=['POST'])
+def update_layout():
+    return LayoutController.update_layout()
+
+@api.route('/layout/predict-building', methods=['POST'])
+def predict_building_layout():
+    return LayoutController.predict_building()
+
+@api.route('/layout/jobs', methods=['POST'])
+def submit_layout_job():
+    return LayoutController.submit_job()
+
+@api.route('/layout/jobs/<job_id>', methods=['GET'])
+def get_layout_job(job_id):
+    return LayoutController.get_job(job_id)
+
 @api.route('/layout/recommendations', methods=['POST'])
 def get_recommendations():
     return LayoutController.get_floor_recommendations()
@@ -148,6 +195,11 @@ def get_recommendations():
 def reset_layout():
     return LayoutController.reset_layout()
 
+@api.route('/layout/stats', methods=['GET'])
+def get_layout_stats():
+    """Pipeline timing per stage & retry counters (process ini)"""
+    return LayoutController.layout_stats()
+
 @api.route('/layout/auto-place', methods=['POST'])
 def auto_place_furniture():
     return LayoutController.auto_place_furniture()
@@ -155,32 +207,24 @@ def auto_place_furniture():
 @api.route('/layout/model-info', methods=['GET'])
 def get_model_info():
     """Get AI model information and metrics"""
-    from app.services.LayoutService import LayoutService
+    from app.services.ModelRegistry import ModelRegistry
     from flask import jsonify
-    import joblib
-    from config import Config
     
-    try:
-        # Try to load model metadata
-        metadata = joblib.load(Config.METADATA_PATH)
-        
+    # Metadata sudah di memory (di-load saat app start)
+    info = ModelRegistry.model_info()
+    if info:
         return jsonify({
             "status": "success",
             "model_loaded": True,
-            "version": metadata.get('version'),
-            "date": metadata.get('date'),
-            "furniture_count": metadata.get('furniture_count'),
-            "training_samples": metadata.get('samples'),
-            "regression": metadata.get('regression'),
-            "classification": metadata.get('classification')
-        })
-    except:
-        return jsonify({
-            "status": "warning",
-            "model_loaded": False,
-            "message": "AI model not loaded. Using grid search fallback.",
-            "instructions": "Upload model_auto_layout (8).pkl to app/services/ directory"
+            **info
         })
+    
+    return jsonify({
+        "status": "warning",
+        "model_loaded": False,
+        "message": "AI model not loaded. Using grid search fallback.",
+        "instructions": "Upload model_auto_layout (8).pkl to app/services/ directory"
+    })
 
 # ===== UPLOAD ROUTES =====
 @api.route('/news/upload-image', methods=['POST'])
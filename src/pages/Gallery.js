@@ -8,32 +8,36 @@ function Gallery() {
   const [filter, setFilter] = useState('public'); // 'public' or 'all'
   const [searchQuery, setSearchQuery] = useState('');
   const [viewMode, setViewMode] = useState('grid'); // 'grid' or 'list'
+  const [nextCursor, setNextCursor] = useState(null);
+  const [loadingMore, setLoadingMore] = useState(false);
 
   useEffect(() => {
     fetchLayouts();
   }, [filter]);
 
-  const fetchLayouts = async () => {
-    setLoading(true);
+  // cursor = next_cursor dari halaman sebelumnya (load more), null = halaman pertama
+  const fetchLayouts = async (cursor = null) => {
+    cursor ? setLoadingMore(true) : setLoading(true);
     try {
       const endpoint = filter === 'public' 
         ? `${API_BASE_URL}/api/layouts/public`
         : `${API_BASE_URL}/api/layouts`;
       
-      const response = await fetch(endpoint);
+      const response = await fetch(cursor ? `${endpoint}?cursor=${encodeURIComponent(cursor)}` : endpoint);
       const data = await response.json();
       
-      if (data.success) {
-        setLayouts(data.data || []);
+      if (data.success || data.status === 'success') {
+        setLayouts((prev) => cursor ? [...prev, ...(data.data || [])] : (data.data || []));
+        setNextCursor(data.next_cursor || null);
       } else {
         console.error('Failed to fetch layouts:', data.message);
-        setLayouts([]);
+        if (!cursor) setLayouts([]);
       }
     } catch (error) {
       console.error('Error fetching layouts:', error);
-      setLayouts([]);
+      if (!cursor) setLayouts([]);
     } finally {
-      setLoading(false);
+      cursor ? setLoadingMore(false) : setLoading(false);
     }
   };
 
@@ -235,6 +239,14 @@ function Gallery() {
             ))}
           </div>
         )}
+
+        {!loading && nextCursor && (
+          <div className="gallery-load-more">
+            <button className="btn-primary" onClick={() => fetchLayouts(nextCursor)} disabled={loadingMore}>
+              {loadingMore ? 'Loading...' : 'Load More'}
+            </button>
+          </div>
+        )}
       </div>
     </div>
   );
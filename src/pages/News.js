@@ -9,6 +9,8 @@ function News() {
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState(null);
   const [selectedCategory, setSelectedCategory] = useState('all');
+  const [nextCursor, setNextCursor] = useState(null);
+  const [loadingMore, setLoadingMore] = useState(false);
 
   useEffect(() => {
     const fetchNews = async () => {
@@ -19,6 +21,7 @@ function News() {
         
         if (res.status === "success") {
           setNews(res.news || []);
+          setNextCursor(res.next_cursor || null);
         } else {
           setError(res.message || "Gagal memuat berita");
         }
@@ -33,6 +36,21 @@ function News() {
     fetchNews();
   }, []);
 
+  const loadMoreNews = async () => {
+    setLoadingMore(true);
+    try {
+      const res = await cmsApi.getNews(nextCursor);
+      if (res.status === "success") {
+        setNews((prev) => [...prev, ...(res.news || [])]);
+        setNextCursor(res.next_cursor || null);
+      }
+    } catch (err) {
+      console.error("Error fetching more news:", err);
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
   const categories = ['all', 'teknologi', 'bisnis', 'tutorial', 'update'];
 
   const filteredNews = selectedCategory === 'all' 
@@ -129,7 +147,7 @@ function News() {
                     <h2 className="featured-title">{filteredNews[0].title}</h2>
                     <p className="featured-excerpt">
                       {filteredNews[0].excerpt || 
-                       filteredNews[0].content?.substring(0, 200) + "..."}
+                       (filteredNews[0].content ? filteredNews[0].content.substring(0, 200) + "..." : "")}
                     </p>
                     <div className="featured-footer">
                       <div className="author-info">
@@ -168,7 +186,7 @@ function News() {
                       <h3 className="news-card-title">{item.title}</h3>
                       <p className="news-excerpt">
                         {item.excerpt || 
-                         (item.content?.substring(0, 120) + "...")}
+                         (item.content ? item.content.substring(0, 120) + "..." : "")}
                       </p>
                       <div className="news-footer">
                         <div className="author-section">
@@ -184,6 +202,14 @@ function News() {
                 ))}
               </div>
             )}
+
+            {nextCursor && (
+              <div className="news-load-more">
+                <button className="read-more-btn" onClick={loadMoreNews} disabled={loadingMore}>
+                  {loadingMore ? "Memuat..." : "Muat Lebih Banyak"}
+                </button>
+              </div>
+            )}
           </>
         )}
       </div>
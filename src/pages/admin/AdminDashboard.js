@@ -19,6 +19,7 @@ function AdminDashboard() {
 
   // NEWS STATE
   const [newsList, setNewsList] = useState([]);
+  const [newsCursor, setNewsCursor] = useState(null); // next_cursor (list endpoint paginated)
   const [newArticle, setNewArticle] = useState({ title: '', excerpt: '', content: '', image: '', category: 'General', author: 'Admin' });
   const [uploadingImage, setUploadingImage] = useState(false);
 
@@ -29,6 +30,8 @@ function AdminDashboard() {
 
   // Q&A STATE
   const [questionsList, setQuestionsList] = useState([]);
+  const [questionsCursor, setQuestionsCursor] = useState(null);
+  const [questionsSummary, setQuestionsSummary] = useState(null); // Total semua pertanyaan (server)
   const [selectedQuestion, setSelectedQuestion] = useState(null);
   const [answerText, setAnswerText] = useState('');
   const [answeredBy, setAnsweredBy] = useState('Admin');
@@ -36,6 +39,7 @@ function AdminDashboard() {
 
   // CONTACT MESSAGES STATE
   const [contactMessages, setContactMessages] = useState([]);
+  const [contactCursor, setContactCursor] = useState(null);
   const [messageFilter, setMessageFilter] = useState('all'); // all, new, read
 
   // SOCIAL MEDIA STATE
@@ -85,9 +89,13 @@ function AdminDashboard() {
     if (isAuthenticated && activeSection === 'news') loadNews();
   }, [isAuthenticated, activeSection]);
 
-  const loadNews = async () => {
-    const res = await cmsApi.getNews();
-    if (res.status === 'success') setNewsList(res.news);
+  // cursor = next_cursor halaman sebelumnya (Load More), tanpa cursor = reload halaman pertama
+  const loadNews = async (cursor = null) => {
+    const res = await cmsApi.getNews(cursor);
+    if (res.status === 'success') {
+      setNewsList((prev) => cursor ? [...prev, ...(res.news || [])] : (res.news || []));
+      setNewsCursor(res.next_cursor || null);
+    }
   };
 
   /* ===============================
@@ -148,10 +156,12 @@ function AdminDashboard() {
     if (isAuthenticated && activeSection === 'qna') loadQuestions();
   }, [isAuthenticated, activeSection]);
 
-  const loadQuestions = async () => {
-    const res = await cmsApi.getAllQuestions();
+  const loadQuestions = async (cursor = null) => {
+    const res = await cmsApi.getAllQuestions(cursor);
     if (res.status === 'success') {
-      setQuestionsList(res.data || []);
+      setQuestionsList((prev) => cursor ? [...prev, ...(res.data || [])] : (res.data || []));
+      setQuestionsCursor(res.next_cursor || null);
+      setQuestionsSummary(res.summary || null);
     }
   };
 
@@ -212,9 +222,12 @@ function AdminDashboard() {
     if (isAuthenticated && activeSection === 'contact') loadContactMessages();
   }, [isAuthenticated, activeSection]);
 
-  const loadContactMessages = async () => {
-    const res = await cmsApi.getContactMessages();
-    if (res.status === 'success') setContactMessages(res.data || []);
+  const loadContactMessages = async (cursor = null) => {
+    const res = await cmsApi.getContactMessages(cursor);
+    if (res.status === 'success') {
+      setContactMessages((prev) => cursor ? [...prev, ...(res.data || [])] : (res.data || []));
+      setContactCursor(res.next_cursor || null);
+    }
   };
 
   const handleMarkAsRead = async (id) => {
@@ -1989,6 +2002,13 @@ function AdminDashboard() {
                 </li>
               ))}
             </ul>
+            {newsCursor && (
+              <div style={{textAlign: 'center', marginTop: '1rem'}}>
+                <button className="btn-secondary" onClick={() => loadNews(newsCursor)}>
+                  Load More
+                </button>
+              </div>
+            )}
           </section>
         )}
 
@@ -2301,6 +2321,13 @@ function AdminDashboard() {
                   </table>
                 </div>
               )}
+              {contactCursor && (
+                <div style={{textAlign: 'center', marginTop: '1rem'}}>
+                  <button className="btn-secondary" onClick={() => loadContactMessages(contactCursor)}>
+                    Load More
+                  </button>
+                </div>
+              )}
             </div>
           </>
         )}
@@ -2973,12 +3000,12 @@ function AdminDashboard() {
             <div className="qna-header">
               <h2>Q&A Management</h2>
               <div className="qna-summary">
-                <span className="badge badge-total">Total: {questionsList.length}</span>
+                <span className="badge badge-total">Total: {questionsSummary ? questionsSummary.total : questionsList.length}</span>
                 <span className="badge badge-pending">
-                  Pending: {questionsList.filter(q => q.status === 'pending').length}
+                  Pending: {questionsSummary ? questionsSummary.pending : questionsList.filter(q => q.status === 'pending').length}
                 </span>
                 <span className="badge badge-answered">
-                  Answered: {questionsList.filter(q => q.status === 'answered').length}
+                  Answered: {questionsSummary ? questionsSummary.answered : questionsList.filter(q => q.status === 'answered').length}
                 </span>
               </div>
             </div>
@@ -3137,6 +3164,13 @@ function AdminDashboard() {
                   </tbody>
                 </table>
               )}
+              {questionsCursor && (
+                <div style={{textAlign: 'center', marginTop: '1rem'}}>
+                  <button className="btn-secondary" onClick={() => loadQuestions(questionsCursor)}>
+                    Load More
+                  </button>
+                </div>
+              )}
             </div>
           </>
         )}
@@ -1,6 +1,10 @@
 // src/services/cmsApi.js
 const API_BASE_URL = 'http://localhost:5000/api';
 
+// List endpoints are paginated: pass next_cursor from the previous page to get the next one
+const withCursor = (url, cursor) =>
+  cursor ? `${url}${url.includes('?') ? '&' : '?'}cursor=${encodeURIComponent(cursor)}` : url;
+
 export const cmsApi = {
   // =========================
   // LOGIN
@@ -47,9 +51,9 @@ export const cmsApi = {
   // =========================
 // NEWS
 // =========================
-getNews: async () => {
+getNews: async (cursor = null) => {
   try {
-    const res = await fetch(`${API_BASE_URL}/news`, { credentials: 'include' });
+    const res = await fetch(withCursor(`${API_BASE_URL}/news`, cursor), { credentials: 'include' });
     const data = await res.json();
     return data;
   } catch (err) {
@@ -184,9 +188,9 @@ deleteFAQ: async (id) => {
 // =========================
 // Q&A (QUESTIONS)
 // =========================
-getAllQuestions: async () => {
+getAllQuestions: async (cursor = null) => {
   try {
-    const res = await fetch(`${API_BASE_URL}/questions/all`);
+    const res = await fetch(withCursor(`${API_BASE_URL}/questions/all`, cursor));
     const data = await res.json();
     return data;
   } catch (err) {
@@ -328,9 +332,9 @@ deleteQuestion: async (id) => {
     }
   },
 
-  getContactMessages: async () => {
+  getContactMessages: async (cursor = null) => {
     try {
-      const response = await fetch(`${API_BASE_URL}/contact/messages`);
+      const response = await fetch(withCursor(`${API_BASE_URL}/contact/messages`, cursor));
       const data = await response.json();
       return data;
     } catch (error) {
@@ -379,9 +383,9 @@ deleteQuestion: async (id) => {
   // =========================
   // HOUSE LAYOUTS
   // =========================
-  getAllLayouts: async (limit = 100) => {
+  getAllLayouts: async (limit = 100, cursor = null) => {
     try {
-      const response = await fetch(`${API_BASE_URL}/layouts?limit=${limit}`);
+      const response = await fetch(withCursor(`${API_BASE_URL}/layouts?limit=${limit}`, cursor));
       const data = await response.json();
       return data;
     } catch (error) {
@@ -390,9 +394,9 @@ deleteQuestion: async (id) => {
     }
   },
 
-  getPublicLayouts: async (limit = 50) => {
+  getPublicLayouts: async (limit = 50, cursor = null) => {
     try {
-      const response = await fetch(`${API_BASE_URL}/layouts/public?limit=${limit}`);
+      const response = await fetch(withCursor(`${API_BASE_URL}/layouts/public?limit=${limit}`, cursor));
       const data = await response.json();
       return data;
     } catch (error) {
@@ -416,9 +420,9 @@ deleteQuestion: async (id) => {
     }
   },
 
-  getUserLayouts: async (userId) => {
+  getUserLayouts: async (userId, cursor = null) => {
     try {
-      const response = await fetch(`${API_BASE_URL}/layouts/user/${userId}`);
+      const response = await fetch(withCursor(`${API_BASE_URL}/layouts/user/${userId}`, cursor));
       const data = await response.json();
       return data;
     } catch (error) {
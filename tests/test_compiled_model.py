@@ -0,0 +1,74 @@
+"""
+Parity CompiledModel.predict vs model.predict (ensemble asli)
+Dipakai ModelRegistry._compile saat load - selisih harus <= COMPILED_PARITY_TOL
+"""
+import numpy as np
+import pytest
+
+from config import Config
+from app.services.CompiledModel import CompiledModel
+from app.services.LayoutService import LayoutService
+
+
+def _training_data():
+    rng = np.random.default_rng(0)
+    dims = rng.uniform(30, 300, size=(500, 2))
+    X = LayoutService._build_features(dims)
+    y = np.column_stack([60 + dims[:, 0] * 1.5, 60 + dims[:, 1] * 2.0]) + rng.normal(0, 20, (500, 2))
+    return X, y
+
+
+def _xgboost():
+    xgb = pytest.importorskip("xgboost")
+    return xgb.XGBRegressor(n_estimators=50, max_depth=4, random_state=0)
+
+
+def _random_forest():
+    ensemble = pytest.importorskip("sklearn.ensemble")
+    return ensemble.RandomForestRegressor(n_estimators=20, max_depth=6, random_state=0)
+
+
+def _gradient_boosting():
+    ensemble = pytest.importorskip("sklearn.ensemble")
+    multioutput = pytest.importorskip("sklearn.multioutput")
+    return multioutput.MultiOutputRegressor(ensemble.GradientBoostingRegressor(n_estimators=30, random_state=0))
+
+
+@pytest.fixture(params=[_xgboost, _random_forest, _gradient_boosting], ids=["xgboost", "random_forest",
+                                                                            "gradient_boosting"])
+def fitted(request):
+    X, y = _training_data()
+    model = request.param().fit(X, y)
+    compiled = CompiledModel.compile(model)
+    assert compiled is not None
+    return model, compiled
+
+
+def _assert_parity(model, compiled, X):
+    expected = np.asarray(model.predict(X), dtype=float).reshape(len(X), -1)
+    actual = compiled.predict(X)
+    assert actual.shape == expected.shape
+    assert np.abs(actual - expected).max() <= Config.COMPILED_PARITY_TOL
+
+
+@pytest.mark.parametrize("batch", [1, 7, 256])
+def test_parity_seeded_inputs(fitted, batch):
+    model, compiled = fitted
+    rng = np.random.default_rng(batch)
+    # Termasuk dims di luar range training
+    X = LayoutService._build_features(rng.uniform(1, 1000, size=(batch, 2)))
+    _assert_parity(model, compiled, X)
+
+
+def test_parity_on_split_threshold(fitted):
+    model, compiled = fitted
+    X = LayoutService._build_features([(120.0, 60.0)] * 3)
+    # Sample tepat di threshold split root tree pertama (dan sedikit di kiri / kanan)
+    feature, threshold = int(compiled.feature[0, 0]), np.float32(compiled.threshold[0, 0])
+    assert feature >= 0
+    X = X.astype(np.float32)
+    X[0, feature] = threshold
+    X[1, feature] = np.nextafter(threshold, np.float32(-np.inf))
+    X[2, feature] = np.nextafter(threshold, np.float32(np.inf))
+    _assert_parity(model, compiled, X)
+    _assert_parity(model, compiled, X[:1])